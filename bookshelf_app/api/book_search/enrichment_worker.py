@@ -0,0 +1,54 @@
+import logging
+import threading
+
+from bookshelf_app.api.book_search.service import (
+    ENRICHMENT_JOB_BATCH_SIZE,
+    ENRICHMENT_JOB_VISIBILITY_TIMEOUT_SECONDS,
+    BookSearchService,
+    EnrichmentJobRunResult,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class BookEnrichmentWorker:
+    def __init__(
+        self,
+        service: BookSearchService,
+        poll_interval_seconds: float,
+        batch_size: int = ENRICHMENT_JOB_BATCH_SIZE,
+        visibility_timeout_seconds: float = ENRICHMENT_JOB_VISIBILITY_TIMEOUT_SECONDS,
+    ):
+        self.poll_interval_seconds = max(0.1, poll_interval_seconds)
+        self.batch_size = batch_size
+        self.visibility_timeout_seconds = visibility_timeout_seconds
+        self._service = service
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_forever, name="book-enrichment", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout_seconds)
+
+    def run_once(self) -> EnrichmentJobRunResult:
+        return self._service.process_enrichment_jobs(self.batch_size, self.visibility_timeout_seconds)
+
+    def _run_forever(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                result = self.run_once()
+            except Exception:
+                logger.exception("Book enrichment worker run failed.")
+                result = None
+            # Drain a backlog without pausing; sleep only when the queue is empty or the database failed.
+            if result is None or result.claimed_count == 0:
+                self._stop_event.wait(self.poll_interval_seconds)
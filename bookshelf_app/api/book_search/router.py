@@ -1,16 +1,24 @@
-from datetime import date
+from datetime import date, datetime
 
 from fastapi import Depends, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from bookshelf_app.api.book_search.scheduler import MetadataWarmupScheduler
 from bookshelf_app.api.book_search.service import (
+    DESCRIPTION_BATCH_MAX_ISBNS,
+    ISBN_BATCH_MAX_ISBNS,
     BookSearchRateLimitError,
     BookSearchResultAppModel,
     BookSearchService,
     PublisherAppModel,
+    normalize_isbn,
 )
 from bookshelf_app.api.shared.custom_router import CustomRouter
-from bookshelf_app.infra.dependencies import get_admin_dependency
+from bookshelf_app.infra.dependencies import (
+    get_admin_dependency,
+    get_book_search_service,
+    get_metadata_warmup_scheduler,
+)
 
 router = CustomRouter()
 
@@ -52,14 +60,57 @@ class BookDescriptionResponse(BaseModel):
     description: str | None = None
 
 
+class BookDescriptionsRequest(BaseModel):
+    isbn13s: list[str] = Field(min_length=1, max_length=DESCRIPTION_BATCH_MAX_ISBNS)
+
+
+class BookDescriptionsResponse(BaseModel):
+    descriptions: list[BookDescriptionResponse]
+
+
+class BooksByIsbn13sRequest(BaseModel):
+    isbn13s: list[str] = Field(min_length=1, max_length=ISBN_BATCH_MAX_ISBNS)
+
+
+class BookByIsbn13Response(BaseModel):
+    isbn13: str
+    book: BookSearchResultResponse | None = None
+
+
+class BooksByIsbn13sResponse(BaseModel):
+    books: list[BookByIsbn13Response]
+
+
 class CacheClearResponse(BaseModel):
     deleted_count: int
 
 
+class MetadataWarmupResultResponse(BaseModel):
+    catalog_count: int
+    candidate_count: int
+    refreshed_count: int
+    failed_count: int
+
+
+class MetadataWarmupStatusResponse(BaseModel):
+    enabled: bool
+    interval_seconds: float
+    is_leader: bool
+    running: bool
+    current_publisher_id: str | None = None
+    last_started_at: datetime | None = None
+    last_finished_at: datetime | None = None
+    next_run_at: datetime | None = None
+    last_error: str | None = None
+    results: dict[str, MetadataWarmupResultResponse]
+
+
 @router.get("/book_search", response_model=BookSearchResponse)
-def search_books(keyword: str) -> BookSearchResponse:
+def search_books(
+    keyword: str, service: BookSearchService = Depends(get_book_search_service)
+) -> BookSearchResponse:
     try:
-        results = BookSearchService().search(keyword)
+        results = service.search(keyword)
     except BookSearchRateLimitError as exc:
         raise HTTPException(
             status_code=429,
@@ -74,8 +125,10 @@ def search_books(keyword: str) -> BookSearchResponse:
     response_model=CacheClearResponse,
     dependencies=[Depends(get_admin_dependency)],
 )
-def clear_publisher_catalog_cache() -> CacheClearResponse:
-    deleted_count = BookSearchService().clear_publisher_catalog_cache()
+def clear_publisher_catalog_cache(
+    service: BookSearchService = Depends(get_book_search_service),
+) -> CacheClearResponse:
+    deleted_count = service.clear_publisher_catalog_cache()
     return CacheClearResponse(deleted_count=deleted_count)
 
 
@@ -84,14 +137,45 @@ def clear_publisher_catalog_cache() -> CacheClearResponse:
     response_model=CacheClearResponse,
     dependencies=[Depends(get_admin_dependency)],
 )
-def clear_book_metadata_cache() -> CacheClearResponse:
-    deleted_count = BookSearchService().clear_book_metadata_cache()
+def clear_book_metadata_cache(
+    service: BookSearchService = Depends(get_book_search_service),
+) -> CacheClearResponse:
+    deleted_count = service.clear_book_metadata_cache()
+    return CacheClearResponse(deleted_count=deleted_count)
+
+
+@router.delete(
+    "/book_search/cache/provider-responses",
+    response_model=CacheClearResponse,
+    dependencies=[Depends(get_admin_dependency)],
+)
+def clear_provider_response_cache(
+    service: BookSearchService = Depends(get_book_search_service),
+) -> CacheClearResponse:
+    deleted_count = service.clear_provider_response_cache()
     return CacheClearResponse(deleted_count=deleted_count)
 
 
+@router.get(
+    "/book_search/warmup/status",
+    response_model=MetadataWarmupStatusResponse,
+    dependencies=[Depends(get_admin_dependency)],
+)
+def get_metadata_warmup_status(
+    scheduler: MetadataWarmupScheduler = Depends(get_metadata_warmup_scheduler),
+) -> MetadataWarmupStatusResponse:
+    status = scheduler.status()
+    return MetadataWarmupStatusResponse(
+        **{key: value for key, value in vars(status).items() if key != "results"},
+        results={
+            publisher_id: MetadataWarmupResultResponse(**vars(result)) for publisher_id, result in status.results.items()
+        },
+    )
+
+
 @router.get("/book_search/publishers", response_model=PublishersResponse)
-def list_publishers() -> PublishersResponse:
-    publishers = BookSearchService().list_publishers()
+def list_publishers(service: BookSearchService = Depends(get_book_search_service)) -> PublishersResponse:
+    publishers = service.list_publishers()
     return PublishersResponse(publishers=[convert_publisher(publisher) for publisher in publishers])
 
 
@@ -101,9 +185,10 @@ def search_publisher_books(
     keyword: str | None = None,
     page: int = Query(default=1, ge=1),
     limit: int = Query(default=40, ge=1, le=100),
+    service: BookSearchService = Depends(get_book_search_service),
 ) -> PublisherBookSearchResponse:
     try:
-        result = BookSearchService().search_publisher_books(publisher_id, keyword, page, limit)
+        result = service.search_publisher_books(publisher_id, keyword, page, limit)
     except BookSearchRateLimitError as exc:
         raise HTTPException(
             status_code=429,
@@ -121,9 +206,11 @@ def search_publisher_books(
 
 
 @router.get("/book_search/isbn13/{isbn13}/description", response_model=BookDescriptionResponse)
-def get_book_description(isbn13: str) -> BookDescriptionResponse:
+def get_book_description(
+    isbn13: str, service: BookSearchService = Depends(get_book_search_service)
+) -> BookDescriptionResponse:
     try:
-        description = BookSearchService().find_description_by_isbn13(isbn13)
+        description = service.find_description_by_isbn13(isbn13)
     except BookSearchRateLimitError as exc:
         raise HTTPException(
             status_code=429,
@@ -133,6 +220,50 @@ def get_book_description(isbn13: str) -> BookDescriptionResponse:
     return BookDescriptionResponse(isbn13=isbn13, description=description)
 
 
+@router.post("/book_search/isbn13s", response_model=BooksByIsbn13sResponse)
+def find_books_by_isbn13s(
+    request: BooksByIsbn13sRequest, service: BookSearchService = Depends(get_book_search_service)
+) -> BooksByIsbn13sResponse:
+    try:
+        books = service.find_by_isbn13s(request.isbn13s)
+    except BookSearchRateLimitError as exc:
+        raise HTTPException(
+            status_code=429,
+            detail="外部書籍検索APIの利用制限に達しました。しばらく時間を置いてから再度お試しください。",
+        ) from exc
+
+    # Results follow the request order; unknown or malformed ISBNs get no book.
+    return BooksByIsbn13sResponse(
+        books=[
+            BookByIsbn13Response(
+                isbn13=isbn13, book=convert(books[normalize_isbn(isbn13)]) if normalize_isbn(isbn13) in books else None
+            )
+            for isbn13 in request.isbn13s
+        ]
+    )
+
+
+@router.post("/book_search/isbn13s/descriptions", response_model=BookDescriptionsResponse)
+def get_book_descriptions(
+    request: BookDescriptionsRequest, service: BookSearchService = Depends(get_book_search_service)
+) -> BookDescriptionsResponse:
+    try:
+        descriptions = service.find_descriptions_by_isbn13s(request.isbn13s)
+    except BookSearchRateLimitError as exc:
+        raise HTTPException(
+            status_code=429,
+            detail="外部書籍検索APIの利用制限に達しました。しばらく時間を置いてから再度お試しください。",
+        ) from exc
+
+    # Results follow the request order; unknown or malformed ISBNs get no description.
+    return BookDescriptionsResponse(
+        descriptions=[
+            BookDescriptionResponse(isbn13=isbn13, description=descriptions.get(normalize_isbn(isbn13)))
+            for isbn13 in request.isbn13s
+        ]
+    )
+
+
 def convert(model: BookSearchResultAppModel) -> BookSearchResultResponse:
     return BookSearchResultResponse(**vars(model))
 
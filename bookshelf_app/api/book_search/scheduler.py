@@ -0,0 +1,167 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import logging
+import os
+import socket
+import threading
+import uuid
+
+from bookshelf_app.api.book_search.service import BookSearchService, MetadataCacheWarmupResult
+from bookshelf_app.infra.db.database import SessionLocal
+from bookshelf_app.infra.db.lock import release_lock, try_acquire_lock
+
+METADATA_WARMUP_LOCK_NAME = "metadata_warmup_leader"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MetadataWarmupStatus:
+    enabled: bool
+    interval_seconds: float
+    is_leader: bool
+    running: bool
+    current_publisher_id: str | None
+    last_started_at: datetime | None
+    last_finished_at: datetime | None
+    next_run_at: datetime | None
+    last_error: str | None
+    results: dict[str, MetadataCacheWarmupResult] = field(default_factory=dict)
+
+
+class MetadataWarmupScheduler:
+    def __init__(
+        self,
+        service: BookSearchService,
+        interval_seconds: float,
+        refresh_after_days: int,
+        batch_size: int,
+        initial_delay_seconds: float = 0,
+    ):
+        self.interval_seconds = max(1.0, interval_seconds)
+        self.refresh_after_days = refresh_after_days
+        self.batch_size = batch_size
+        self.initial_delay_seconds = max(0.0, initial_delay_seconds)
+        self._service = service
+        self._owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._status_lock = threading.Lock()
+        self._is_leader = False
+        self._running = False
+        self._current_publisher_id: str | None = None
+        self._last_started_at: datetime | None = None
+        self._last_finished_at: datetime | None = None
+        self._next_run_at: datetime | None = None
+        self._last_error: str | None = None
+        self._results: dict[str, MetadataCacheWarmupResult] = {}
+
+    @property
+    def lock_ttl_seconds(self) -> float:
+        # The leader renews the lock every run; a crashed leader is replaced after two missed runs.
+        return self.interval_seconds * 2
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run_forever, name="metadata-warmup", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout_seconds: float = 5.0) -> None:
+        self._stop_event.set()
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            thread.join(timeout_seconds)
+        if self._is_leader:
+            try:
+                self._release_lock()
+            except Exception:
+                logger.exception("Failed to release metadata warmup lock.")
+            self._is_leader = False
+
+    def status(self) -> MetadataWarmupStatus:
+        with self._status_lock:
+            return MetadataWarmupStatus(
+                enabled=self._thread is not None,
+                interval_seconds=self.interval_seconds,
+                is_leader=self._is_leader,
+                running=self._running,
+                current_publisher_id=self._current_publisher_id,
+                last_started_at=self._last_started_at,
+                last_finished_at=self._last_finished_at,
+                next_run_at=self._next_run_at,
+                last_error=self._last_error,
+                results=dict(self._results),
+            )
+
+    def run_once(self) -> bool:
+        # Every worker runs the scheduler; only the holder of the leader lock warms the cache.
+        try:
+            self._is_leader = self._try_acquire_lock()
+        except Exception:
+            logger.exception("Failed to acquire metadata warmup lock.")
+            self._is_leader = False
+        if not self._is_leader:
+            return False
+
+        with self._status_lock:
+            self._running = True
+            self._last_started_at = datetime.now(timezone.utc)
+            self._last_error = None
+        try:
+            for publisher in self._service.list_publishers():
+                if self._stop_event.is_set():
+                    break
+                with self._status_lock:
+                    self._current_publisher_id = publisher.publisher_id
+                result = self._warm_publisher(publisher.publisher_id)
+                with self._status_lock:
+                    if result is not None:
+                        self._results[publisher.publisher_id] = result
+                # Long runs keep extending the lease so no other worker starts a second run.
+                self._is_leader = self._try_acquire_lock()
+                if not self._is_leader:
+                    break
+        finally:
+            with self._status_lock:
+                self._running = False
+                self._current_publisher_id = None
+                self._last_finished_at = datetime.now(timezone.utc)
+        return True
+
+    def _warm_publisher(self, publisher_id: str) -> MetadataCacheWarmupResult | None:
+        try:
+            return self._service.warm_publisher_metadata_cache(
+                publisher_id=publisher_id,
+                refresh_after_days=self.refresh_after_days,
+                batch_size=self.batch_size,
+                google_delay_seconds=0,
+                batch_delay_seconds=0,
+            )
+        except Exception as error:
+            logger.exception("Failed to warm book metadata cache. publisher_id:%s", publisher_id)
+            with self._status_lock:
+                self._last_error = f"{publisher_id}: {error}"
+            return None
+
+    def _run_forever(self) -> None:
+        delay_seconds = self.initial_delay_seconds
+        while True:
+            with self._status_lock:
+                self._next_run_at = datetime.now(timezone.utc) + timedelta(seconds=delay_seconds)
+            if self._stop_event.wait(delay_seconds):
+                return
+            try:
+                self.run_once()
+            except Exception:
+                logger.exception("Metadata warmup run failed.")
+            delay_seconds = self.interval_seconds
+
+    def _try_acquire_lock(self) -> bool:
+        with SessionLocal() as session:
+            return try_acquire_lock(session, METADATA_WARMUP_LOCK_NAME, self._owner, self.lock_ttl_seconds)
+
+    def _release_lock(self) -> None:
+        with SessionLocal() as session:
+            release_lock(session, METADATA_WARMUP_LOCK_NAME, self._owner)
@@ -1,28 +1,136 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+import contextvars
+import hashlib
+from dataclasses import dataclass, field, replace
 from datetime import date, datetime, timedelta, timezone
+from functools import cached_property, lru_cache
+from itertools import islice
 from html import unescape
 from html.parser import HTMLParser
+import http.client
 import json
 import logging
+import os
 import re
+import socket
+import threading
 import time
-from sqlalchemy import delete
-from urllib.error import HTTPError
-from urllib.parse import urlencode, urljoin
-from urllib.request import Request, urlopen
+import unicodedata
+import uuid
+import zlib
+from typing import Callable, Iterable, Iterator, TypeVar
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+from urllib.parse import urljoin, urlsplit
 
 from bookshelf_app.config import get_settings
-from bookshelf_app.infra.db.book_search import BookMetadataCacheDTO, PublisherCatalogCacheDTO
+from bookshelf_app.infra.db.book_search import (
+    BOOK_METADATA_FOUND,
+    BOOK_METADATA_NOT_FOUND,
+    BookMetadataCacheDTO,
+    PublisherCatalogBookDTO,
+    PublisherCatalogCacheDTO,
+    load_publisher_catalog_books,
+    replace_publisher_catalog_books,
+    upsert_book_metadata_caches,
+    upsert_publisher_catalog_caches,
+)
 from bookshelf_app.infra.db.database import SessionLocal
-
-
-PUBLISHER_CATALOG_CACHE_DAYS = 3
+from bookshelf_app.infra.db.enrichment_job import (
+    BookEnrichmentJobDTO,
+    claim_enrichment_jobs,
+    complete_enrichment_jobs,
+    count_enrichment_jobs,
+    enqueue_enrichment_jobs,
+    retry_enrichment_jobs,
+)
+from bookshelf_app.infra.db.lock import release_lock, try_acquire_lock
+from bookshelf_app.infra.db.provider_response_cache import (
+    delete_provider_responses,
+    load_provider_response,
+    upsert_provider_responses,
+)
+from bookshelf_app.infra.db.warmup_checkpoint import (
+    delete_warmup_checkpoints,
+    load_warmup_checkpoint,
+    save_warmup_checkpoint,
+)
+from bookshelf_app.infra.other.http_client import (
+    HttpStatusError,
+    HttpStream,
+    close_http_client,
+    get_http_client,
+)
+from bookshelf_app.infra.other.memory_cache import MemoryCacheStats, TtlLruCache
+from bookshelf_app.infra.other.ngram_index import NgramIndex
+from bookshelf_app.infra.other.rate_limiter import (
+    AdaptiveTokenBucket,
+    RateLimiter,
+    TokenBucketStats,
+    use_rate_limit_budget,
+)
+from bookshelf_app.infra.other.retry import Retrier, RetryPolicy, RetryStats
+from bookshelf_app.infra.other.single_flight import SingleFlight, SingleFlightStats
+
+
+PUBLISHER_CATALOG_CACHE_HOURS = 1
 PUBLISHER_CATALOG_MAX_ITEMS = 1000
+CATALOG_REFRESH_MAX_WORKERS = 2
+CATALOG_REFRESH_LOCK_SECONDS = 600
+GIHYO_MAX_CONCURRENT_GENRES = 2
+CATALOG_TITLE_MAX_LENGTH = 500
+HIRAGANA_TO_KATAKANA = {code: code + 0x60 for code in range(ord("ぁ"), ord("ゖ") + 1)}
 GOOGLE_CATALOG_SUPPLEMENT_MAX_ITEMS = 40
+GOOGLE_SEARCH_MAX_WORKERS = 3
+DESCRIPTION_BATCH_MAX_ISBNS = 100
+DESCRIPTION_BATCH_MAX_WORKERS = 4
+ISBN_BATCH_MAX_ISBNS = 300
+ISBN_BATCH_GOOGLE_MAX_ITEMS = 40
+ISBN_BATCH_GOOGLE_MAX_WORKERS = 4
+OPENBD_GET_MAX_ISBNS = 20
+OPENBD_BULK_CHUNK_SIZE = 250
+OPENBD_BULK_MAX_WORKERS = 4
+OPENBD_WARMUP_PREFETCH_SIZE = 1000
+GOOGLE_INTERACTIVE_BUDGET = "interactive"
+GOOGLE_WARMUP_BUDGET = "warmup"
+GOOGLE_INTERACTIVE_MAX_WAIT_SECONDS = 5.0
+GOOGLE_RATE_LIMIT_RECOVERY_SECONDS = 120.0
+ISBN_LOOKUP_TIMEOUT_SECONDS = 8.0
+# Two threads per lookup, with headroom for provider calls still running after their timeout.
+ISBN_LOOKUP_MAX_WORKERS = 16
+KEYWORD_SEARCH_CACHE_SECONDS = 300
+KEYWORD_SEARCH_CACHE_MAX_ENTRIES = 1000
+KEYWORD_SEARCH_CACHE_MAX_BYTES = 32 * 1024 * 1024
 BOOK_METADATA_CACHE_DAYS = 30
+BOOK_METADATA_NOT_FOUND_CACHE_HOURS = 24
+BOOK_DESCRIPTION_NOT_FOUND_CACHE_DAYS = 7
+BOOK_METADATA_MEMORY_CACHE_MAX_ENTRIES = 5000
+BOOK_METADATA_MEMORY_CACHE_MAX_BYTES = 16 * 1024 * 1024
+BOOK_METADATA_MEMORY_CACHE_MAX_SECONDS = 600
+ENRICHMENT_JOB_BATCH_SIZE = 40
+ENRICHMENT_JOB_VISIBILITY_TIMEOUT_SECONDS = 300
+ENRICHMENT_JOB_MAX_ATTEMPTS = 5
+ENRICHMENT_JOB_RETRY_BASE_DELAY_SECONDS = 30.0
+ENRICHMENT_JOB_RETRY_MAX_DELAY_SECONDS = 1800.0
+FETCH_MAX_RETRIES = 2
+FETCH_RETRY_BASE_DELAY_SECONDS = 0.5
+FETCH_RETRY_MAX_DELAY_SECONDS = 8.0
+FETCH_RETRY_DEADLINE_SECONDS = 10.0
+RETRYABLE_HTTP_STATUSES = {429, 500, 502, 503, 504}
+# Hosts missing here (publisher catalogs) are never cached: they have their own catalog cache.
+PROVIDER_RESPONSE_CACHE_SECONDS = {
+    "www.googleapis.com": 6 * 3600,
+    "api.openbd.jp": 24 * 3600,
+}
+PROVIDER_RESPONSE_CACHE_EXCLUDED_PARAMS = frozenset({"key"})
+PROVIDER_RESPONSE_CACHE_MAX_BYTES = 2 * 1024 * 1024
+PROVIDER_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS = 3600
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 class BookSearchRateLimitError(Exception):
     pass
@@ -64,6 +172,47 @@ class PublisherBookPageAppModel:
     total_count: int
 
 
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    fetched_at: datetime
+    books: tuple[PublisherCatalogBookAppModel, ...]
+
+    @cached_property
+    def index(self) -> NgramIndex:
+        return NgramIndex([create_catalog_search_document(book) for book in self.books])
+
+    def search(self, keyword: str | None) -> tuple[PublisherCatalogBookAppModel, ...]:
+        normalized = normalize_catalog_search_text(keyword or "")
+        if not normalized:
+            return self.books
+        return tuple(self.books[document_id] for document_id in self.index.search(normalized))
+
+
+@dataclass(frozen=True)
+class CatalogValidators:
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+
+
+@dataclass(frozen=True)
+class CatalogFetchResult:
+    # books is None when the source reported (or hashed to) the same content as last time.
+    books: list[PublisherCatalogBookAppModel] | None
+    validators: CatalogValidators
+
+
+@dataclass(frozen=True)
+class CatalogDiff:
+    added: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    changed: list[str] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+
 @dataclass(frozen=True)
 class MetadataCacheWarmupResult:
     catalog_count: int
@@ -72,15 +221,86 @@ class MetadataCacheWarmupResult:
     failed_count: int
 
 
+@dataclass(frozen=True)
+class MetadataWarmupCheckpoint:
+    refresh_before: datetime
+    last_isbn13: str | None
+    candidate_count: int
+    processed_count: int
+    refreshed_count: int
+    completed: bool
+
+
+@dataclass(frozen=True)
+class MetadataWarmupProgress:
+    publisher_id: str
+    candidate_count: int
+    resumed_count: int
+    processed_count: int
+    refreshed_count: int
+    failed_count: int
+
+
+@dataclass(frozen=True)
+class DatabaseCacheStats:
+    hits: int
+    misses: int
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class BookMetadataCacheStats:
+    memory: MemoryCacheStats
+    database: DatabaseCacheStats
+
+
+@dataclass(frozen=True)
+class EnrichmentJobAppModel:
+    book: PublisherCatalogBookAppModel
+    publisher_name: str
+    attempts: int
+
+
+@dataclass(frozen=True)
+class EnrichmentJobRunResult:
+    claimed_count: int
+    completed_count: int
+    retried_count: int
+
+
 class BookSearchService:
+    google_timeout_seconds = ISBN_LOOKUP_TIMEOUT_SECONDS
+    openbd_timeout_seconds = ISBN_LOOKUP_TIMEOUT_SECONDS
     _google: "GoogleBooksProvider"
     _openbd: "OpenBdProvider"
     _publisher_catalogs: "PublisherCatalogService"
+    _metadata_cache: "BookMetadataCache"
+    _search_cache: TtlLruCache[str, tuple[BookSearchResultAppModel, ...]]
+    _search_flight: SingleFlight[str, tuple[BookSearchResultAppModel, ...]]
+    _isbn_flight: SingleFlight[str, BookSearchResultAppModel | None]
 
     def __init__(self):
-        self._google = GoogleBooksProvider(get_settings().google_books_api_key)
+        settings = get_settings()
+        self._google = GoogleBooksProvider(settings.google_books_api_key)
         self._openbd = OpenBdProvider()
-        self._publisher_catalogs = PublisherCatalogService(self._google, self._openbd)
+        self._enrichment_queue = BookEnrichmentQueue() if settings.book_enrichment_queue_enabled else None
+        self._metadata_cache = BookMetadataCache()
+        self._publisher_catalogs = PublisherCatalogService(
+            self._google, self._openbd, self._enrichment_queue, self._metadata_cache
+        )
+        self._search_cache = TtlLruCache(
+            max_entries=KEYWORD_SEARCH_CACHE_MAX_ENTRIES,
+            max_bytes=KEYWORD_SEARCH_CACHE_MAX_BYTES,
+            ttl_seconds=KEYWORD_SEARCH_CACHE_SECONDS,
+        )
+        self._search_flight = SingleFlight()
+        self._isbn_flight = SingleFlight()
+        self._lookup_lock = threading.Lock()
+        self._lookup_executor: ThreadPoolExecutor | None = None
 
     def search(self, keyword: str) -> list[BookSearchResultAppModel]:
         keyword = keyword.strip()
@@ -91,21 +311,166 @@ class BookSearchService:
             result = self.find_by_isbn13(keyword)
             return [result] if result is not None else []
 
-        return self._google.search(keyword)
+        cache_key = normalize_search_keyword(keyword)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
 
-    def find_by_isbn13(self, isbn13: str) -> BookSearchResultAppModel | None:
+        return list(self._search_flight.do(cache_key, lambda: self._search_google(keyword, cache_key)))
+
+    def get_search_cache_stats(self) -> MemoryCacheStats:
+        return self._search_cache.stats()
+
+    def get_google_rate_limit_stats(self) -> dict[str, TokenBucketStats]:
+        return self._google.get_rate_limit_stats()
+
+    def get_fetch_retry_stats(self) -> dict[str, RetryStats]:
+        return get_fetch_retrier().stats()
+
+    def get_provider_response_cache_stats(self) -> dict[str, DatabaseCacheStats]:
+        return get_provider_response_cache().stats()
+
+    def get_single_flight_stats(self) -> dict[str, SingleFlightStats]:
+        return {
+            "keyword": self._search_flight.stats(),
+            "isbn13": self._isbn_flight.stats(),
+            "publisher_page": self._publisher_catalogs.get_single_flight_stats(),
+        }
+
+    def find_by_isbn13(self, isbn13: str, require_description: bool = False) -> BookSearchResultAppModel | None:
         normalized = normalize_isbn(isbn13)
-        google_book = self._find_google_by_isbn13(normalized)
-        openbd_book = self._openbd.find_by_isbn13(normalized)
+        flight_key = f"{normalized}:description" if require_description else normalized
+        return self._isbn_flight.do(flight_key, lambda: self._fetch_by_isbn13(normalized, require_description))
+
+    def _search_google(self, keyword: str, cache_key: str) -> tuple[BookSearchResultAppModel, ...]:
+        books = tuple(self._google.search(keyword))
+        self._search_cache.set(cache_key, books)
+        return books
+
+    def _fetch_by_isbn13(self, normalized: str, require_description: bool = False) -> BookSearchResultAppModel | None:
+        cached = self._load_cached_metadata(normalized)
+        if cached is not None and (
+            cached.book is None
+            or (is_complete_book_metadata(cached.book) and (not require_description or cached.has_final_description()))
+        ):
+            return cached.book
+        # Catalog placeholders and cover-less rows are looked up again and kept only as a fallback.
+        cached_book = cached.book if cached is not None else None
+
+        # Only providers that actually answered count; a timeout or rate limit says nothing about the ISBN.
+        answers: dict[str, BookSearchResultAppModel | None] = {}
+
+        def find_google() -> BookSearchResultAppModel | None:
+            try:
+                answers["google-books"] = self._google.find_by_isbn13(normalized)
+            except BookSearchRateLimitError:
+                return None
+            return answers["google-books"]
+
+        def find_openbd() -> BookSearchResultAppModel | None:
+            answers["openbd"] = self._openbd.find_by_isbn13(normalized)
+            return answers["openbd"]
+
+        google_book, openbd_book = call_concurrently_with_timeouts(
+            self._get_lookup_executor(),
+            [
+                ("google-books", find_google, self.google_timeout_seconds),
+                ("openbd", find_openbd, self.openbd_timeout_seconds),
+            ],
+        )
 
         if google_book and openbd_book:
-            return merge_book_search_result(google_book, openbd_book)
-        return openbd_book or google_book
+            result = merge_book_search_result(google_book, openbd_book)
+        else:
+            result = openbd_book or google_book
+        if result is None:
+            if len(answers) == 2 and cached_book is None:
+                self._save_unknown_isbn13s([normalized])
+            elif len(answers) == 2 and require_description and not cached_book.description:
+                self._mark_descriptions_checked([normalized])
+            return cached_book
+
+        result = preserve_cached_metadata(result, cached_book)
+        # A partial answer would be cached for 30 days, so only complete lookups are stored.
+        if len(answers) == 2:
+            self._save_book_metadata_cache([result])
+            # Both providers answered, so a missing description is remembered instead of asked for every time.
+            if require_description and not result.description:
+                self._mark_descriptions_checked([normalized])
+        return result
 
     def find_description_by_isbn13(self, isbn13: str) -> str | None:
-        result = self.find_by_isbn13(isbn13)
+        result = self.find_by_isbn13(isbn13, require_description=True)
         return result.description if result else None
 
+    def find_by_isbn13s(self, isbn13s: list[str]) -> dict[str, BookSearchResultAppModel]:
+        normalized_isbns = list(dict.fromkeys(normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)))
+        cached_books = self._load_book_metadata_cache(normalized_isbns)
+        results = {isbn13: book for isbn13, book in cached_books.items() if is_complete_book_metadata(book)}
+        uncached = [isbn13 for isbn13 in normalized_isbns if isbn13 not in cached_books]
+        unknown_isbns = self._load_unknown_isbn13s(uncached) if uncached else set()
+        missing = [isbn13 for isbn13 in normalized_isbns if isbn13 not in results and isbn13 not in unknown_isbns]
+        if not missing:
+            return results
+
+        openbd_books = self._openbd.find_by_isbn13s(missing)
+
+        # Google only fills in what openBD lacks, and at most a fixed number per request.
+        google_targets = [
+            isbn13 for isbn13 in missing if openbd_books.get(isbn13) is None or not openbd_books[isbn13].image_url
+        ][:ISBN_BATCH_GOOGLE_MAX_ITEMS]
+        google_answers = dict(
+            zip(
+                google_targets,
+                map_concurrently(self._find_google_supplement, google_targets, ISBN_BATCH_GOOGLE_MAX_WORKERS),
+            )
+        )
+
+        fetched_books: list[BookSearchResultAppModel] = []
+        new_unknown_isbns: list[str] = []
+        for isbn13 in missing:
+            openbd_book = openbd_books.get(isbn13)
+            cached_book = cached_books.get(isbn13)
+            google_answered, google_book = google_answers.get(isbn13, (False, None))
+            if google_book and openbd_book:
+                book = merge_book_search_result(google_book, openbd_book)
+            else:
+                book = openbd_book or google_book
+            if book is None:
+                if cached_book is not None:
+                    results[isbn13] = cached_book
+                elif google_answered:
+                    new_unknown_isbns.append(isbn13)
+                continue
+
+            book = preserve_cached_metadata(book, cached_book)
+            results[isbn13] = book
+            # A book still waiting for its Google supplement is returned but not cached.
+            if google_answered or (isbn13 not in google_answers and openbd_book and openbd_book.image_url):
+                fetched_books.append(book)
+
+        self._save_book_metadata_cache(fetched_books)
+        self._save_unknown_isbn13s(new_unknown_isbns)
+        return results
+
+    def find_descriptions_by_isbn13s(self, isbn13s: list[str]) -> dict[str, str | None]:
+        normalized_isbns = list(dict.fromkeys(normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)))
+        cached = self._load_book_metadata_cache(normalized_isbns)
+        descriptions = {isbn13: book.description for isbn13, book in cached.items() if book.description}
+        missing = [isbn13 for isbn13 in normalized_isbns if isbn13 not in descriptions]
+        # Misses are looked up side by side; negative entries and books already known to have no description
+        # are answered by find_by_isbn13 from memory.
+        fetched = map_concurrently(
+            lambda isbn13: self.find_by_isbn13(isbn13, require_description=True),
+            missing,
+            DESCRIPTION_BATCH_MAX_WORKERS,
+        )
+        books = dict(zip(missing, fetched))
+        return {
+            isbn13: descriptions.get(isbn13) or (books[isbn13].description if books.get(isbn13) else None)
+            for isbn13 in normalized_isbns
+        }
+
     def list_publishers(self) -> list[PublisherAppModel]:
         return self._publisher_catalogs.list_publishers()
 
@@ -118,15 +483,25 @@ class BookSearchService:
         return clear_publisher_catalog_cache()
 
     def clear_book_metadata_cache(self) -> int:
-        return clear_book_metadata_cache()
+        deleted = clear_book_metadata_cache()
+        self._metadata_cache.clear_memory()
+        return deleted
+
+    def clear_provider_response_cache(self) -> int:
+        return get_provider_response_cache().clear()
+
+    def get_metadata_cache_stats(self) -> BookMetadataCacheStats:
+        return self._metadata_cache.stats()
 
     def warm_publisher_metadata_cache(
         self,
         publisher_id: str,
         refresh_after_days: int = 14,
         batch_size: int = 40,
-        google_delay_seconds: float = 0.2,
-        batch_delay_seconds: float = 2.0,
+        google_delay_seconds: float = 0,
+        batch_delay_seconds: float = 0,
+        run_id: str | None = None,
+        on_progress: Callable[[MetadataWarmupProgress], None] | None = None,
     ) -> MetadataCacheWarmupResult:
         return self._publisher_catalogs.warm_metadata_cache(
             publisher_id,
@@ -134,81 +509,170 @@ class BookSearchService:
             batch_size,
             google_delay_seconds,
             batch_delay_seconds,
+            run_id,
+            on_progress,
         )
 
-    def _find_google_by_isbn13(self, isbn13: str) -> BookSearchResultAppModel | None:
+    def clear_metadata_warmup_checkpoints(self, run_id: str | None = None, before: datetime | None = None) -> int:
+        with SessionLocal() as session:
+            return delete_warmup_checkpoints(session, run_id, before)
+
+    def process_enrichment_jobs(
+        self,
+        limit: int = ENRICHMENT_JOB_BATCH_SIZE,
+        visibility_timeout_seconds: float = ENRICHMENT_JOB_VISIBILITY_TIMEOUT_SECONDS,
+    ) -> EnrichmentJobRunResult:
+        return self._publisher_catalogs.process_enrichment_jobs(limit, visibility_timeout_seconds)
+
+    def get_enrichment_job_counts(self) -> dict[str, int]:
+        return self._enrichment_queue.counts() if self._enrichment_queue is not None else {}
+
+    def close(self) -> None:
+        with self._lookup_lock:
+            executor, self._lookup_executor = self._lookup_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        self._publisher_catalogs.close()
+        close_http_client()
+
+    def _get_lookup_executor(self) -> ThreadPoolExecutor:
+        with self._lookup_lock:
+            if self._lookup_executor is None:
+                self._lookup_executor = ThreadPoolExecutor(
+                    max_workers=ISBN_LOOKUP_MAX_WORKERS, thread_name_prefix="isbn-lookup"
+                )
+            return self._lookup_executor
+
+    def _load_cached_metadata(self, isbn13: str) -> "CachedBookMetadata | None":
+        return self._metadata_cache.get(isbn13)
+
+    def _load_book_metadata_cache(self, isbn13s: list[str]) -> dict[str, BookSearchResultAppModel]:
+        return self._metadata_cache.get_many(isbn13s)
+
+    def _save_book_metadata_cache(self, books: list[BookSearchResultAppModel]) -> None:
+        self._metadata_cache.save(books)
+
+    def _load_unknown_isbn13s(self, isbn13s: list[str]) -> set[str]:
+        return self._metadata_cache.get_unknown(isbn13s)
+
+    def _mark_descriptions_checked(self, isbn13s: list[str]) -> None:
+        self._metadata_cache.mark_descriptions_checked(isbn13s)
+
+    def _find_google_supplement(self, isbn13: str) -> tuple[bool, BookSearchResultAppModel | None]:
         try:
-            return self._google.find_by_isbn13(isbn13)
-        except BookSearchRateLimitError:
-            return None
+            return True, self._google.find_by_isbn13(isbn13)
+        except Exception as error:
+            if not is_transient_fetch_error(error):
+                raise
+            return False, None
+
+    def _save_unknown_isbn13s(self, isbn13s: list[str]) -> None:
+        self._metadata_cache.save_unknown(isbn13s)
 
 
 class GoogleBooksProvider:
+    api_url = "https://www.googleapis.com/books/v1/volumes"
+    search_max_workers = GOOGLE_SEARCH_MAX_WORKERS
     _api_key: str
+    _rate_limiter: RateLimiter
 
-    def __init__(self, api_key: str):
+    def __init__(self, api_key: str, rate_limiter: RateLimiter | None = None):
         self._api_key = api_key
+        self._rate_limiter = rate_limiter or get_google_rate_limiter()
 
     def search(self, keyword: str) -> list[BookSearchResultAppModel]:
-        books: list[BookSearchResultAppModel] = []
-        for query in create_google_search_queries(keyword):
-            data = fetch_json(
-                "https://www.googleapis.com/books/v1/volumes",
-                {
-                    "q": query,
-                    "printType": "books",
-                    "langRestrict": "ja",
-                    "orderBy": "newest",
-                    "maxResults": "40",
-                    "key": self._api_key,
-                },
-            )
-            books.extend([book for item in data.get("items", []) if (book := convert_google_volume(item))])
-
+        # Each query is an independent round-trip, so wait only for the slowest one.
+        responses = map_concurrently(self._fetch_volumes, create_google_search_queries(keyword), self.search_max_workers)
+        books = [
+            book
+            for data in responses
+            for item in data.get("items", [])
+            if (book := convert_google_volume(item))
+        ]
         return unique_books(books)
 
     def find_by_isbn13(self, isbn13: str) -> BookSearchResultAppModel | None:
         results = self.search(normalize_isbn(isbn13))
         return results[0] if results else None
 
+    def get_rate_limit_stats(self) -> dict[str, TokenBucketStats]:
+        return self._rate_limiter.stats()
+
+    def _fetch_volumes(self, query: str) -> dict | list:
+        return fetch_json(
+            self.api_url,
+            {
+                "q": query,
+                "printType": "books",
+                "langRestrict": "ja",
+                "orderBy": "newest",
+                "maxResults": "40",
+                "key": self._api_key,
+            },
+            rate_limiter=self._rate_limiter,
+        )
+
+
+@lru_cache()
+def get_google_rate_limiter() -> RateLimiter:
+    # One limiter per process: every GoogleBooksProvider shares the same API key quota.
+    settings = get_settings()
+    return RateLimiter(
+        {
+            GOOGLE_INTERACTIVE_BUDGET: AdaptiveTokenBucket(
+                rate_per_second=settings.google_books_interactive_rate_per_second,
+                burst=GOOGLE_SEARCH_MAX_WORKERS * 3,
+                recovery_seconds=GOOGLE_RATE_LIMIT_RECOVERY_SECONDS,
+                max_wait_seconds=GOOGLE_INTERACTIVE_MAX_WAIT_SECONDS,
+            ),
+            GOOGLE_WARMUP_BUDGET: AdaptiveTokenBucket(
+                rate_per_second=settings.google_books_warmup_rate_per_second,
+                burst=1,
+                recovery_seconds=GOOGLE_RATE_LIMIT_RECOVERY_SECONDS,
+            ),
+        },
+        default_budget=GOOGLE_INTERACTIVE_BUDGET,
+    )
+
 
 class OpenBdProvider:
     def find_by_isbn13(self, isbn13: str) -> BookSearchResultAppModel | None:
-        data = fetch_json("https://api.openbd.jp/v1/get", {"isbn": normalize_isbn(isbn13)})
+        normalized = normalize_isbn(isbn13)
+        data = fetch_json("https://api.openbd.jp/v1/get", {"isbn": normalized})
         if not isinstance(data, list) or len(data) < 1:
             return None
-
-        item = data[0]
-        if not item or not item.get("summary"):
-            return None
-
-        summary = item["summary"]
-        isbn = normalize_isbn(summary.get("isbn") or isbn13)
-        return BookSearchResultAppModel(
-            source="openbd",
-            source_id=isbn,
-            title=summary.get("title") or "タイトル不明",
-            authors=split_authors(summary.get("author") or ""),
-            publisher=summary.get("publisher") or "不明",
-            isbn13=isbn,
-            published_at=parse_published_date(summary.get("pubdate")),
-            image_url=normalize_cover_url(summary.get("cover")),
-            description=extract_openbd_description(item),
-        )
+        return convert_openbd_item(data[0], normalized)
 
     def find_by_isbn13s(self, isbn13s: list[str]) -> dict[str, BookSearchResultAppModel]:
-        normalized_isbns = [normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)]
+        normalized_isbns = list(dict.fromkeys(normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)))
         if not normalized_isbns:
             return {}
+        if len(normalized_isbns) <= OPENBD_GET_MAX_ISBNS:
+            return self._find_chunk(normalized_isbns, post=False)
+
+        # The POST form is not bound by URL length; even chunks keep the parallel calls equally sized.
+        chunks = split_evenly(normalized_isbns, OPENBD_BULK_CHUNK_SIZE)
+        results: dict[str, BookSearchResultAppModel] = {}
+        for chunk_results in map_concurrently(
+            lambda chunk: self._find_chunk(chunk, post=True), chunks, OPENBD_BULK_MAX_WORKERS
+        ):
+            results.update(chunk_results)
+        return results
 
-        data = fetch_json("https://api.openbd.jp/v1/get", {"isbn": ",".join(normalized_isbns)})
+    def _find_chunk(self, isbn13s: list[str], post: bool) -> dict[str, BookSearchResultAppModel]:
+        url = "https://api.openbd.jp/v1/get"
+        form = {"isbn": ",".join(isbn13s)}
+        data = post_form_json(url, form) if post else fetch_json(url, form)
         if not isinstance(data, list):
             return {}
 
+        # Items carry their own ISBN; the request position is only trusted when the lengths match.
+        requested = set(isbn13s)
+        aligned = len(data) == len(isbn13s)
         results: dict[str, BookSearchResultAppModel] = {}
-        for fallback_isbn, item in zip(normalized_isbns, data):
-            book = convert_openbd_item(item, fallback_isbn)
-            if book:
+        for index, item in enumerate(data):
+            book = convert_openbd_item(item, isbn13s[index] if aligned else "")
+            if book and book.isbn13 in requested:
                 results[book.isbn13] = book
         return results
 
@@ -217,14 +681,30 @@ class PublisherCatalogService:
     _providers: dict[str, "PublisherCatalogProvider"]
     _google: GoogleBooksProvider
     _openbd: OpenBdProvider
+    _metadata_cache: "BookMetadataCache"
+    _page_flight: SingleFlight[tuple[str, str, int, int], PublisherBookPageAppModel]
 
-    def __init__(self, google: GoogleBooksProvider, openbd: OpenBdProvider):
+    def __init__(
+        self,
+        google: GoogleBooksProvider,
+        openbd: OpenBdProvider,
+        enrichment_queue: "BookEnrichmentQueue | None" = None,
+        metadata_cache: "BookMetadataCache | None" = None,
+    ):
         self._providers = {
             "oreilly_japan": OreillyCatalogProvider(),
             "gihyo": GihyoCatalogProvider(),
         }
         self._google = google
         self._openbd = openbd
+        self._enrichment_queue = enrichment_queue
+        self._metadata_cache = metadata_cache or BookMetadataCache()
+        self._page_flight = SingleFlight()
+        self._catalog_snapshots: dict[str, CatalogSnapshot] = {}
+        self._refreshing_sources: set[str] = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_executor: ThreadPoolExecutor | None = None
+        self._lock_owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
     def list_publishers(self) -> list[PublisherAppModel]:
         return [PublisherAppModel(provider.publisher_id, provider.publisher_name) for provider in self._providers.values()]
@@ -236,18 +716,109 @@ class PublisherCatalogService:
         if provider is None:
             return PublisherBookPageAppModel([], page=max(1, page), page_size=limit, total_count=0)
 
-        books = self._get_catalog_books(provider)
-        books = filter_catalog_books(books, keyword)
-        books = sorted(books, key=lambda book: book.published_at, reverse=True)
         page_size = max(1, min(limit, 100))
         current_page = max(1, page)
+        # Identical page requests share one enrichment so they do not race on the metadata cache rows.
+        flight_key = (publisher_id, normalize_catalog_search_text(keyword or ""), current_page, page_size)
+        return self._page_flight.do(
+            flight_key,
+            lambda: self._search_books(provider, keyword, current_page, page_size),
+        )
+
+    def get_single_flight_stats(self) -> SingleFlightStats:
+        return self._page_flight.stats()
+
+    def close(self) -> None:
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _search_books(
+        self, provider: "PublisherCatalogProvider", keyword: str | None, current_page: int, page_size: int
+    ) -> PublisherBookPageAppModel:
         start = (current_page - 1) * page_size
-        selected = books[start : start + page_size]
+        loaded = self._load_catalog_snapshot(provider.cache_key)
+        snapshot = loaded[0] if loaded is not None else None
+        if loaded is not None and is_cache_expired(loaded[1]):
+            # Serve the stale snapshot now; the scrape runs off the request path.
+            self._refresh_catalog_in_background(provider)
+        if snapshot is not None:
+            matched = snapshot.search(keyword)
+            selected, total_count = list(matched[start : start + page_size]), len(matched)
+        else:
+            # The catalog was just fetched (or is a stale fallback), so page the in-memory list.
+            books = self._get_catalog_books(provider)
+            books = filter_catalog_books(books, keyword)
+            books = sorted(books, key=lambda book: book.published_at, reverse=True)
+            selected, total_count = books[start : start + page_size], len(books)
         return PublisherBookPageAppModel(
-            books=self._enrich_books(selected, provider.publisher_name),
+            books=self._load_page_books(selected, provider.publisher_name),
             page=current_page,
             page_size=page_size,
-            total_count=len(books),
+            total_count=total_count,
+        )
+
+    def _load_page_books(
+        self, books: list[PublisherCatalogBookAppModel], publisher_name: str
+    ) -> list[BookSearchResultAppModel]:
+        if self._enrichment_queue is None:
+            return self._enrich_books(books, publisher_name)
+
+        # Pages only read the cache; Google/openBD lookups run in the enrichment worker.
+        fresh = self._load_book_metadata_cache([book.isbn13 for book in books])
+        missing = [book for book in books if book.isbn13 not in fresh]
+        if not missing:
+            return [fresh[book.isbn13] for book in books]
+
+        stale = self._load_book_metadata_cache([book.isbn13 for book in missing], allow_expired=True)
+        try:
+            self._enrichment_queue.enqueue(missing, publisher_name)
+        except Exception:
+            logger.exception("Failed to enqueue book enrichment jobs. publisher_name:%s", publisher_name)
+        return [
+            fresh.get(book.isbn13) or stale.get(book.isbn13) or convert_catalog_book(book, publisher_name)
+            for book in books
+        ]
+
+    def process_enrichment_jobs(self, limit: int, visibility_timeout_seconds: float) -> EnrichmentJobRunResult:
+        if self._enrichment_queue is None:
+            return EnrichmentJobRunResult(claimed_count=0, completed_count=0, retried_count=0)
+
+        claim_id, jobs = self._enrichment_queue.claim(limit, visibility_timeout_seconds)
+        jobs_by_publisher: dict[str, list[EnrichmentJobAppModel]] = {}
+        for job in jobs:
+            jobs_by_publisher.setdefault(job.publisher_name, []).append(job)
+
+        completed_count = 0
+        retried_count = 0
+        with use_rate_limit_budget(GOOGLE_WARMUP_BUDGET):
+            for publisher_name, publisher_jobs in jobs_by_publisher.items():
+                books = [job.book for job in publisher_jobs]
+                isbn13s = [book.isbn13 for book in books]
+                try:
+                    self._enrich_books(books, publisher_name)
+                    # Transient Google failures return uncached fallbacks; those jobs are retried.
+                    cached = self._load_book_metadata_cache(isbn13s)
+                    error = "metadata was not cached"
+                except Exception as exc:
+                    logger.exception("Failed to process book enrichment jobs. publisher_name:%s", publisher_name)
+                    cached = {}
+                    error = str(exc) or type(exc).__name__
+
+                completed = [isbn13 for isbn13 in isbn13s if isbn13 in cached]
+                failed = [isbn13 for isbn13 in isbn13s if isbn13 not in cached]
+                if completed:
+                    self._enrichment_queue.complete(claim_id, completed)
+                if failed:
+                    self._enrichment_queue.retry(claim_id, failed, error)
+                completed_count += len(completed)
+                retried_count += len(failed)
+
+        return EnrichmentJobRunResult(
+            claimed_count=len(jobs),
+            completed_count=completed_count,
+            retried_count=retried_count,
         )
 
     def warm_metadata_cache(
@@ -257,28 +828,92 @@ class PublisherCatalogService:
         batch_size: int,
         google_delay_seconds: float,
         batch_delay_seconds: float,
+        run_id: str | None = None,
+        on_progress: Callable[[MetadataWarmupProgress], None] | None = None,
     ) -> MetadataCacheWarmupResult:
         provider = self._providers.get(publisher_id)
         if provider is None:
             raise ValueError(f"unknown publisher: {publisher_id}")
 
+        # Google calls are paced by the shared limiter's warmup budget, not by fixed sleeps.
+        with use_rate_limit_budget(GOOGLE_WARMUP_BUDGET):
+            return self._warm_metadata_cache(
+                provider,
+                refresh_after_days,
+                batch_size,
+                google_delay_seconds,
+                batch_delay_seconds,
+                run_id,
+                on_progress,
+            )
+
+    def _warm_metadata_cache(
+        self,
+        provider: "PublisherCatalogProvider",
+        refresh_after_days: int,
+        batch_size: int,
+        google_delay_seconds: float,
+        batch_delay_seconds: float,
+        run_id: str | None = None,
+        on_progress: Callable[[MetadataWarmupProgress], None] | None = None,
+    ) -> MetadataCacheWarmupResult:
+        publisher_id = provider.publisher_id
         books = self._get_catalog_books(provider)
-        refresh_before = datetime.now(timezone.utc) - timedelta(days=max(1, refresh_after_days))
+        checkpoint = self._load_warmup_checkpoint(run_id, publisher_id) if run_id else None
+        if checkpoint is not None and checkpoint.completed:
+            return MetadataCacheWarmupResult(
+                catalog_count=len(books),
+                candidate_count=checkpoint.candidate_count,
+                refreshed_count=checkpoint.refreshed_count,
+                failed_count=0,
+            )
+
+        if checkpoint is not None:
+            # A resumed run keeps its original cutoff so books refreshed before the interruption drop out.
+            refresh_before = checkpoint.refresh_before
+        else:
+            refresh_before = datetime.now(timezone.utc) - timedelta(days=max(1, refresh_after_days))
         candidates = self._find_metadata_refresh_candidates(books, refresh_before)
-        normalized_batch_size = max(1, min(batch_size, GOOGLE_CATALOG_SUPPLEMENT_MAX_ITEMS))
+        candidate_count = len(candidates)
+        processed_count = 0
         refreshed_count = 0
+        if run_id:
+            # ISBN order gives the checkpoint a stable cursor across catalog refreshes.
+            candidates = sorted(candidates, key=lambda book: book.isbn13)
+            if checkpoint is not None:
+                candidates = [book for book in candidates if book.isbn13 > (checkpoint.last_isbn13 or "")]
+                candidate_count = checkpoint.processed_count + len(candidates)
+                processed_count = checkpoint.processed_count
+                refreshed_count = checkpoint.refreshed_count
+        normalized_batch_size = max(1, min(batch_size, GOOGLE_CATALOG_SUPPLEMENT_MAX_ITEMS))
         failed_count = 0
+        last_isbn13 = checkpoint.last_isbn13 if checkpoint is not None else None
+        checkpoint_processed_count = processed_count
+        checkpoint_refreshed_count = refreshed_count
+        # openBD is asked once per window of batches instead of once per Google-sized batch.
+        prefetch_size = normalized_batch_size * max(1, OPENBD_WARMUP_PREFETCH_SIZE // normalized_batch_size)
+        openbd_books: dict[str, BookSearchResultAppModel] = {}
+        prefetched_until = 0
 
         for start in range(0, len(candidates), normalized_batch_size):
             batch = candidates[start : start + normalized_batch_size]
             try:
+                if start >= prefetched_until:
+                    window = candidates[start : start + prefetch_size]
+                    openbd_books = self._openbd.find_by_isbn13s([book.isbn13 for book in window])
+                    prefetched_until = start + len(window)
                 refreshed = self._enrich_books(
                     batch,
                     provider.publisher_name,
                     force_refresh=True,
                     google_delay_seconds=max(0, google_delay_seconds),
+                    prefetched_openbd_books=openbd_books,
                 )
                 refreshed_count += len(refreshed)
+                if not failed_count:
+                    last_isbn13 = batch[-1].isbn13
+                    checkpoint_processed_count += len(batch)
+                    checkpoint_refreshed_count += len(refreshed)
             except Exception:
                 failed_count += len(batch)
                 logger.exception(
@@ -287,17 +922,88 @@ class PublisherCatalogService:
                     start,
                     len(batch),
                 )
+            processed_count += len(batch)
+
+            if run_id:
+                # The cursor only covers batches before the first failure, so a resumed run retries that batch.
+                self._save_warmup_checkpoint(
+                    run_id,
+                    publisher_id,
+                    MetadataWarmupCheckpoint(
+                        refresh_before=refresh_before,
+                        last_isbn13=last_isbn13,
+                        candidate_count=candidate_count,
+                        processed_count=checkpoint_processed_count,
+                        refreshed_count=checkpoint_refreshed_count,
+                        completed=False,
+                    ),
+                )
+            if on_progress is not None:
+                on_progress(
+                    MetadataWarmupProgress(
+                        publisher_id=publisher_id,
+                        candidate_count=candidate_count,
+                        resumed_count=checkpoint.processed_count if checkpoint is not None else 0,
+                        processed_count=processed_count,
+                        refreshed_count=refreshed_count,
+                        failed_count=failed_count,
+                    )
+                )
 
             if start + normalized_batch_size < len(candidates) and batch_delay_seconds > 0:
                 time.sleep(batch_delay_seconds)
 
+        if run_id and not failed_count:
+            self._save_warmup_checkpoint(
+                run_id,
+                publisher_id,
+                MetadataWarmupCheckpoint(
+                    refresh_before=refresh_before,
+                    last_isbn13=last_isbn13,
+                    candidate_count=candidate_count,
+                    processed_count=processed_count,
+                    refreshed_count=refreshed_count,
+                    completed=True,
+                ),
+            )
+
         return MetadataCacheWarmupResult(
             catalog_count=len(books),
-            candidate_count=len(candidates),
+            candidate_count=candidate_count,
             refreshed_count=refreshed_count,
             failed_count=failed_count,
         )
 
+    def _load_warmup_checkpoint(self, run_id: str, publisher_id: str) -> MetadataWarmupCheckpoint | None:
+        with SessionLocal() as session:
+            row = load_warmup_checkpoint(session, run_id, publisher_id)
+            if row is None:
+                return None
+            return MetadataWarmupCheckpoint(
+                refresh_before=row.refresh_before,
+                last_isbn13=row.last_isbn13,
+                candidate_count=row.candidate_count,
+                processed_count=row.processed_count,
+                refreshed_count=row.refreshed_count,
+                completed=row.completed_at is not None,
+            )
+
+    def _save_warmup_checkpoint(self, run_id: str, publisher_id: str, checkpoint: MetadataWarmupCheckpoint) -> None:
+        with SessionLocal() as session:
+            save_warmup_checkpoint(
+                session,
+                run_id,
+                publisher_id,
+                {
+                    "refresh_before": checkpoint.refresh_before,
+                    "last_isbn13": checkpoint.last_isbn13,
+                    "candidate_count": checkpoint.candidate_count,
+                    "processed_count": checkpoint.processed_count,
+                    "refreshed_count": checkpoint.refreshed_count,
+                    "completed_at": datetime.now(timezone.utc) if checkpoint.completed else None,
+                },
+            )
+
     def _find_metadata_refresh_candidates(
         self,
         books: list[PublisherCatalogBookAppModel],
@@ -322,46 +1028,210 @@ class PublisherCatalogService:
         if cached is not None:
             return cached
 
-        try:
+        if self._load_catalog_version(provider.cache_key) is None:
             books = provider.fetch_books()[:PUBLISHER_CATALOG_MAX_ITEMS]
+            self._save_cache(provider.cache_key, books)
+            return books
+
+        try:
+            # An expired catalog is refreshed with its validators, so unchanged sources cost one request.
+            self._update_catalog(provider)
         except Exception:
             stale = self._load_cache(provider.cache_key, allow_expired=True)
             if stale is not None:
                 return stale
             raise
-
-        self._save_cache(provider.cache_key, books)
-        return books
+        return self._load_cache(provider.cache_key, allow_expired=True) or []
 
     def _load_cache(self, source_key: str, allow_expired: bool = False) -> list[PublisherCatalogBookAppModel] | None:
+        snapshot = self._get_catalog_snapshot(source_key, allow_expired)
+        return list(snapshot.books) if snapshot is not None else None
+
+    def _get_catalog_snapshot(self, source_key: str, allow_expired: bool = False) -> CatalogSnapshot | None:
+        loaded = self._load_catalog_snapshot(source_key)
+        if loaded is None:
+            return None
+        snapshot, expires_at = loaded
+        if not allow_expired and is_cache_expired(expires_at):
+            return None
+        return snapshot
+
+    def _load_catalog_snapshot(self, source_key: str) -> tuple[CatalogSnapshot, datetime] | None:
+        version = self._load_catalog_version(source_key)
+        if version is None:
+            return None
+        # expires_at moves on every unchanged refresh; only fetched_at marks new rows.
+        fetched_at, expires_at = version
+
+        snapshot = self._catalog_snapshots.get(source_key)
+        if snapshot is None or snapshot.fetched_at != fetched_at:
+            snapshot = create_catalog_snapshot(fetched_at, self._load_catalog_rows(source_key))
+            # Replacing the dict entry is atomic, so concurrent readers see either the old or the new snapshot.
+            self._catalog_snapshots[source_key] = snapshot
+        return snapshot, expires_at
+
+    def _load_catalog_version(self, source_key: str) -> tuple[datetime, datetime] | None:
         with SessionLocal() as session:
-            dto = session.get(PublisherCatalogCacheDTO, source_key)
-            if dto is None:
-                return None
-            if not allow_expired and is_cache_expired(dto.expires_at):
-                return None
-            return catalog_books_from_json(dto.payload_json)
+            row = session.execute(
+                select(PublisherCatalogCacheDTO.fetched_at, PublisherCatalogCacheDTO.expires_at).where(
+                    PublisherCatalogCacheDTO.source_key == source_key
+                )
+            ).first()
+        return (row.fetched_at, row.expires_at) if row is not None else None
+
+    def _refresh_catalog_in_background(self, provider: "PublisherCatalogProvider") -> None:
+        with self._refresh_lock:
+            if provider.cache_key in self._refreshing_sources:
+                return
+            self._refreshing_sources.add(provider.cache_key)
+        try:
+            self._submit_background(lambda: self._refresh_catalog(provider))
+        except Exception:
+            with self._refresh_lock:
+                self._refreshing_sources.discard(provider.cache_key)
+            raise
 
-    def _save_cache(self, source_key: str, books: list[PublisherCatalogBookAppModel]) -> None:
-        now = datetime.now(timezone.utc)
-        expires_at = now + timedelta(days=PUBLISHER_CATALOG_CACHE_DAYS)
-        payload = catalog_books_to_json(books)
+    def _submit_background(self, func: Callable[[], None]) -> None:
+        with self._refresh_lock:
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=CATALOG_REFRESH_MAX_WORKERS, thread_name_prefix="catalog-refresh"
+                )
+            executor = self._refresh_executor
+        executor.submit(func)
+
+    def _refresh_catalog(self, provider: "PublisherCatalogProvider") -> None:
+        lock_name = f"publisher_catalog_refresh:{provider.cache_key}"
+        try:
+            # Other workers may hold the same stale snapshot; only the lock holder scrapes.
+            if not self._try_acquire_lock(lock_name, CATALOG_REFRESH_LOCK_SECONDS):
+                return
+            diff = None
+            try:
+                version = self._load_catalog_version(provider.cache_key)
+                # Another worker may have finished a refresh between our stale read and taking the lock.
+                if version is None or is_cache_expired(version[1]):
+                    diff = self._update_catalog(provider)
+            finally:
+                self._release_lock(lock_name)
+            if diff is not None and diff.added:
+                self._warm_added_books(provider, diff.added)
+        except Exception:
+            logger.exception("Failed to refresh publisher catalog. source_key:%s", provider.cache_key)
+        finally:
+            with self._refresh_lock:
+                self._refreshing_sources.discard(provider.cache_key)
+
+    def _update_catalog(self, provider: "PublisherCatalogProvider") -> CatalogDiff | None:
+        validators = self._load_catalog_validators(provider.cache_key)
+        result = provider.fetch_catalog(validators)
+        if result.books is None:
+            self._extend_cache(provider.cache_key, result.validators)
+            return None
+
+        previous = self._load_cache(provider.cache_key, allow_expired=True) or []
+        diff = diff_catalog_books(previous, result.books)
+        if diff.is_empty:
+            # Keeping fetched_at keeps every worker's snapshot and search index.
+            self._extend_cache(provider.cache_key, result.validators)
+            return diff
+
+        self._save_cache(provider.cache_key, result.books, result.validators)
+        logger.info(
+            "Publisher catalog changed. source_key:%s, added:%s, removed:%s, changed:%s",
+            provider.cache_key,
+            len(diff.added),
+            len(diff.removed),
+            len(diff.changed),
+        )
+        return diff
+
+    def _warm_added_books(self, provider: "PublisherCatalogProvider", isbn13s: list[str]) -> None:
+        added = set(isbn13s)
+        books = [book for book in self._load_cache(provider.cache_key, allow_expired=True) or [] if book.isbn13 in added]
+        with use_rate_limit_budget(GOOGLE_WARMUP_BUDGET):
+            for start in range(0, len(books), GOOGLE_CATALOG_SUPPLEMENT_MAX_ITEMS):
+                self._enrich_books(books[start : start + GOOGLE_CATALOG_SUPPLEMENT_MAX_ITEMS], provider.publisher_name)
+
+    def _load_catalog_validators(self, source_key: str) -> CatalogValidators:
+        with SessionLocal() as session:
+            row = session.execute(
+                select(
+                    PublisherCatalogCacheDTO.http_etag,
+                    PublisherCatalogCacheDTO.http_last_modified,
+                    PublisherCatalogCacheDTO.content_hash,
+                ).where(PublisherCatalogCacheDTO.source_key == source_key)
+            ).first()
+        if row is None:
+            return CatalogValidators()
+        return CatalogValidators(row.http_etag, row.http_last_modified, row.content_hash)
+
+    def _extend_cache(self, source_key: str, validators: CatalogValidators) -> None:
         with SessionLocal() as session:
-            dto = session.get(PublisherCatalogCacheDTO, source_key)
-            if dto is None:
-                dto = PublisherCatalogCacheDTO(
-                    source_key=source_key,
-                    payload_json=payload,
-                    fetched_at=now,
-                    expires_at=expires_at,
-                    is_deleted=False,
+            session.execute(
+                update(PublisherCatalogCacheDTO)
+                .where(PublisherCatalogCacheDTO.source_key == source_key)
+                .values(
+                    expires_at=datetime.now(timezone.utc) + timedelta(hours=PUBLISHER_CATALOG_CACHE_HOURS),
+                    http_etag=validators.etag,
+                    http_last_modified=validators.last_modified,
+                    content_hash=validators.content_hash,
                 )
-                session.add(dto)
-            else:
-                dto.payload_json = payload
-                dto.fetched_at = now
-                dto.expires_at = expires_at
-                dto.is_deleted = False
+            )
+            session.commit()
+
+    def _try_acquire_lock(self, name: str, ttl_seconds: float) -> bool:
+        with SessionLocal() as session:
+            return try_acquire_lock(session, name, self._lock_owner, ttl_seconds)
+
+    def _release_lock(self, name: str) -> None:
+        with SessionLocal() as session:
+            release_lock(session, name, self._lock_owner)
+
+    def _load_catalog_rows(self, source_key: str) -> list[PublisherCatalogBookAppModel]:
+        with SessionLocal() as session:
+            return [convert_catalog_book_dto(row) for row in load_publisher_catalog_books(session, source_key)]
+
+    def _save_cache(
+        self,
+        source_key: str,
+        books: list[PublisherCatalogBookAppModel],
+        validators: CatalogValidators | None = None,
+    ) -> None:
+        now = datetime.now(timezone.utc)
+        validators = validators or CatalogValidators()
+        with SessionLocal() as session:
+            upsert_publisher_catalog_caches(
+                session,
+                [
+                    {
+                        "source_key": source_key,
+                        "fetched_at": now,
+                        "expires_at": now + timedelta(hours=PUBLISHER_CATALOG_CACHE_HOURS),
+                        "http_etag": validators.etag,
+                        "http_last_modified": validators.last_modified,
+                        "content_hash": validators.content_hash,
+                        "is_deleted": False,
+                    }
+                ],
+            )
+            replace_publisher_catalog_books(
+                session,
+                source_key,
+                [
+                    {
+                        "source_key": source_key,
+                        "isbn13": book.isbn13,
+                        "position": position,
+                        "title": book.title[:CATALOG_TITLE_MAX_LENGTH],
+                        "published_at": book.published_at,
+                        "price": book.price,
+                        "source_url": book.source_url,
+                        "is_deleted": False,
+                    }
+                    for position, book in enumerate(unique_catalog_books(books))
+                ],
+            )
             session.commit()
 
     def _enrich_books(
@@ -370,6 +1240,7 @@ class PublisherCatalogService:
         publisher_name: str,
         force_refresh: bool = False,
         google_delay_seconds: float = 0,
+        prefetched_openbd_books: dict[str, BookSearchResultAppModel] | None = None,
     ) -> list[BookSearchResultAppModel]:
         isbn13s = [book.isbn13 for book in books]
         cached_books = (
@@ -380,7 +1251,7 @@ class PublisherCatalogService:
         complete_cached_books = {
             isbn13: book
             for isbn13, book in cached_books.items()
-            if book.image_url and not force_refresh
+            if is_complete_book_metadata(book) and not force_refresh
         }
         supplement_books = [
             book for book in books if book.isbn13 not in complete_cached_books
@@ -393,20 +1264,43 @@ class PublisherCatalogService:
             for book in supplement_books
             if force_refresh or book.isbn13 not in cached_books
         ]
-        openbd_books = self._openbd.find_by_isbn13s([book.isbn13 for book in openbd_target_books])
+        # The warmup asks again regardless; it only selects unknown ISBNs whose short TTL has passed.
+        unknown_isbn13s = (
+            self._load_unknown_isbn13s([book.isbn13 for book in openbd_target_books])
+            if openbd_target_books and not force_refresh
+            else set()
+        )
+        openbd_books = (
+            prefetched_openbd_books
+            if prefetched_openbd_books is not None
+            else self._openbd.find_by_isbn13s(
+                [book.isbn13 for book in openbd_target_books if book.isbn13 not in unknown_isbn13s]
+            )
+        )
         fetched_books: dict[str, BookSearchResultAppModel] = {}
         fallback_books: dict[str, BookSearchResultAppModel] = {}
         google_call_count = 0
         for book in supplement_books:
+            if book.isbn13 in unknown_isbn13s:
+                # Saving the catalog row would overwrite the not_found entry and re-enable provider lookups.
+                fallback_books[book.isbn13] = convert_catalog_book(book, publisher_name)
+                continue
+
             cached_book = cached_books.get(book.isbn13)
             openbd_book = openbd_books.get(book.isbn13) if force_refresh else cached_book or openbd_books.get(book.isbn13)
             google_book = None
+            google_failed = False
             needs_google_supplement = openbd_book is None or not openbd_book.image_url
             if needs_google_supplement and google_call_count < GOOGLE_CATALOG_SUPPLEMENT_MAX_ITEMS:
                 if google_call_count > 0 and google_delay_seconds > 0:
                     time.sleep(google_delay_seconds)
                 google_call_count += 1
-                google_book = self._find_google_by_isbn13(book.isbn13)
+                try:
+                    google_book = self._google.find_by_isbn13(book.isbn13)
+                except Exception as error:
+                    if not is_transient_fetch_error(error):
+                        raise
+                    google_failed = True
 
             refreshed_book = None
             if google_book and openbd_book:
@@ -417,6 +1311,9 @@ class PublisherCatalogService:
                 refreshed_book = google_book
             elif cached_book:
                 fallback_books[book.isbn13] = cached_book
+            elif google_failed:
+                # Show the catalog row, but leave the ISBN uncached so the next request retries it.
+                fallback_books[book.isbn13] = convert_catalog_book(book, publisher_name)
             else:
                 refreshed_book = convert_catalog_book(book, publisher_name)
 
@@ -427,57 +1324,248 @@ class PublisherCatalogService:
         all_books = {**complete_cached_books, **fallback_books, **fetched_books}
         return [all_books[book.isbn13] for book in books if book.isbn13 in all_books]
 
-    def _find_google_by_isbn13(self, isbn13: str) -> BookSearchResultAppModel | None:
-        try:
-            return self._google.find_by_isbn13(isbn13)
-        except BookSearchRateLimitError:
-            return None
-
     def _load_book_metadata_cache(
         self,
         isbn13s: list[str],
         allow_expired: bool = False,
     ) -> dict[str, BookSearchResultAppModel]:
-        normalized_isbns = [normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)]
-        if not normalized_isbns:
-            return {}
-
-        results: dict[str, BookSearchResultAppModel] = {}
-        with SessionLocal() as session:
-            rows = session.query(BookMetadataCacheDTO).filter(BookMetadataCacheDTO.isbn13.in_(normalized_isbns)).all()
-            for row in rows:
-                if not allow_expired and is_cache_expired(row.expires_at):
-                    continue
-                book = book_search_result_from_json(row.payload_json)
-                if book:
-                    results[book.isbn13] = book
-        return results
+        return self._metadata_cache.get_many(isbn13s, allow_expired)
 
     def _save_book_metadata_cache(self, books: list[BookSearchResultAppModel]) -> None:
+        self._metadata_cache.save(books)
+
+    def _load_unknown_isbn13s(self, isbn13s: list[str]) -> set[str]:
+        return self._metadata_cache.get_unknown(isbn13s)
+
+
+@dataclass(frozen=True)
+class CachedBookMetadata:
+    # None marks an ISBN neither provider knows.
+    book: BookSearchResultAppModel | None
+    expires_at: datetime
+    # Set when both providers were asked for a description and neither had one.
+    description_checked_at: datetime | None = None
+
+    def has_final_description(self) -> bool:
+        if self.book is not None and self.book.description:
+            return True
+        if self.description_checked_at is None:
+            return False
+        return not is_cache_expired(self.description_checked_at + timedelta(days=BOOK_DESCRIPTION_NOT_FOUND_CACHE_DAYS))
+
+
+class BookMetadataCache:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        max_entries: int = BOOK_METADATA_MEMORY_CACHE_MAX_ENTRIES,
+        max_bytes: int = BOOK_METADATA_MEMORY_CACHE_MAX_BYTES,
+        max_memory_seconds: float = BOOK_METADATA_MEMORY_CACHE_MAX_SECONDS,
+    ):
+        self._session_factory = session_factory
+        # Other workers may rewrite a row, so the memory tier also expires long before the row does.
+        self._max_memory_seconds = max_memory_seconds
+        self._memory: TtlLruCache[str, CachedBookMetadata] = TtlLruCache(
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+            ttl_seconds=max_memory_seconds,
+        )
+        self._stats_lock = threading.Lock()
+        self._database_hits = 0
+        self._database_misses = 0
+
+    def get(self, isbn13: str) -> CachedBookMetadata | None:
+        return self._get_entries([isbn13]).get(normalize_isbn(isbn13))
+
+    def get_many(self, isbn13s: list[str], allow_expired: bool = False) -> dict[str, BookSearchResultAppModel]:
+        entries = self._get_entries(isbn13s, allow_expired)
+        return {isbn13: entry.book for isbn13, entry in entries.items() if entry.book is not None}
+
+    def get_unknown(self, isbn13s: list[str]) -> set[str]:
+        entries = self._get_entries(isbn13s)
+        return {isbn13 for isbn13, entry in entries.items() if entry.book is None}
+
+    def save(self, books: list[BookSearchResultAppModel]) -> None:
         if not books:
             return
 
         now = datetime.now(timezone.utc)
         expires_at = now + timedelta(days=BOOK_METADATA_CACHE_DAYS)
-        with SessionLocal() as session:
-            for book in books:
-                dto = session.get(BookMetadataCacheDTO, book.isbn13)
-                payload = book_search_result_to_json(book)
-                if dto is None:
-                    dto = BookMetadataCacheDTO(
-                        isbn13=book.isbn13,
-                        payload_json=payload,
-                        fetched_at=now,
-                        expires_at=expires_at,
-                        is_deleted=False,
+        with self._session_factory() as session:
+            upsert_book_metadata_caches(
+                session,
+                [
+                    {
+                        "isbn13": book.isbn13,
+                        "payload_json": book_search_result_to_json(book),
+                        "status": BOOK_METADATA_FOUND,
+                        "fetched_at": now,
+                        "expires_at": expires_at,
+                        "description_checked_at": None,
+                        "is_deleted": False,
+                    }
+                    for book in books
+                ],
+            )
+            session.commit()
+        for book in books:
+            self._remember(book.isbn13, CachedBookMetadata(book, expires_at))
+
+    def save_unknown(self, isbn13s: list[str]) -> None:
+        normalized_isbns = [normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)]
+        if not normalized_isbns:
+            return
+
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(hours=BOOK_METADATA_NOT_FOUND_CACHE_HOURS)
+        with self._session_factory() as session:
+            # Never replace real metadata (such as a catalog row) with a negative entry.
+            found = set(
+                session.scalars(
+                    select(BookMetadataCacheDTO.isbn13).where(
+                        BookMetadataCacheDTO.isbn13.in_(normalized_isbns),
+                        BookMetadataCacheDTO.status == BOOK_METADATA_FOUND,
                     )
-                    session.add(dto)
-                else:
-                    dto.payload_json = payload
-                    dto.fetched_at = now
-                    dto.expires_at = expires_at
-                    dto.is_deleted = False
+                )
+            )
+            unknown_isbns = [isbn13 for isbn13 in normalized_isbns if isbn13 not in found]
+            upsert_book_metadata_caches(
+                session,
+                [
+                    {
+                        "isbn13": isbn13,
+                        "payload_json": "{}",
+                        "status": BOOK_METADATA_NOT_FOUND,
+                        "fetched_at": now,
+                        "expires_at": expires_at,
+                        "is_deleted": False,
+                    }
+                    for isbn13 in unknown_isbns
+                ],
+            )
             session.commit()
+        for isbn13 in unknown_isbns:
+            self._remember(isbn13, CachedBookMetadata(None, expires_at))
+
+    def mark_descriptions_checked(self, isbn13s: list[str]) -> None:
+        normalized_isbns = [normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)]
+        if not normalized_isbns:
+            return
+
+        now = datetime.now(timezone.utc)
+        with self._session_factory() as session:
+            session.execute(
+                update(BookMetadataCacheDTO)
+                .where(
+                    BookMetadataCacheDTO.isbn13.in_(normalized_isbns),
+                    BookMetadataCacheDTO.status == BOOK_METADATA_FOUND,
+                )
+                .values(description_checked_at=now)
+            )
+            session.commit()
+        for isbn13 in normalized_isbns:
+            entry = self._memory.get(isbn13)
+            if entry is not None and entry.book is not None:
+                self._remember(isbn13, replace(entry, description_checked_at=now))
+
+    def clear_memory(self) -> None:
+        self._memory.clear()
+
+    def stats(self) -> BookMetadataCacheStats:
+        with self._stats_lock:
+            database = DatabaseCacheStats(hits=self._database_hits, misses=self._database_misses)
+        return BookMetadataCacheStats(memory=self._memory.stats(), database=database)
+
+    def _get_entries(self, isbn13s: list[str], allow_expired: bool = False) -> dict[str, CachedBookMetadata]:
+        normalized_isbns = list(dict.fromkeys(normalize_isbn(isbn13) for isbn13 in isbn13s if is_isbn13(isbn13)))
+        entries: dict[str, CachedBookMetadata] = {}
+        missing: list[str] = []
+        for isbn13 in normalized_isbns:
+            entry = self._memory.get(isbn13)
+            if entry is None:
+                missing.append(isbn13)
+            else:
+                entries[isbn13] = entry
+        if not missing:
+            return entries
+
+        loaded = self._load_entries(missing)
+        for isbn13, entry in loaded.items():
+            if not is_cache_expired(entry.expires_at):
+                self._remember(isbn13, entry)
+                entries[isbn13] = entry
+            elif allow_expired and entry.book is not None:
+                entries[isbn13] = entry
+        with self._stats_lock:
+            hits = sum(1 for isbn13 in missing if isbn13 in entries)
+            self._database_hits += hits
+            self._database_misses += len(missing) - hits
+        return entries
+
+    def _load_entries(self, isbn13s: list[str]) -> dict[str, CachedBookMetadata]:
+        entries: dict[str, CachedBookMetadata] = {}
+        with self._session_factory() as session:
+            rows = session.query(BookMetadataCacheDTO).filter(BookMetadataCacheDTO.isbn13.in_(isbn13s)).all()
+            for row in rows:
+                if row.status == BOOK_METADATA_NOT_FOUND:
+                    entries[row.isbn13] = CachedBookMetadata(None, row.expires_at)
+                    continue
+                book = book_search_result_from_json(row.payload_json)
+                if book:
+                    entries[book.isbn13] = CachedBookMetadata(book, row.expires_at, row.description_checked_at)
+        return entries
+
+    def _remember(self, isbn13: str, entry: CachedBookMetadata) -> None:
+        expires_at = entry.expires_at if entry.expires_at.tzinfo else entry.expires_at.replace(tzinfo=timezone.utc)
+        ttl_seconds = min(self._max_memory_seconds, (expires_at - datetime.now(timezone.utc)).total_seconds())
+        self._memory.set(isbn13, entry, ttl_seconds)
+
+
+class BookEnrichmentQueue:
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        self._session_factory = session_factory
+        self._owner = f"{socket.gethostname()}:{os.getpid()}"[:80]
+
+    def enqueue(self, books: list[PublisherCatalogBookAppModel], publisher_name: str) -> int:
+        rows = [
+            {
+                "isbn13": book.isbn13,
+                "publisher_name": publisher_name,
+                "title": book.title[:CATALOG_TITLE_MAX_LENGTH],
+                "published_at": book.published_at,
+                "price": book.price,
+                "source_url": book.source_url,
+            }
+            for book in books
+        ]
+        with self._session_factory() as session:
+            return enqueue_enrichment_jobs(session, rows)
+
+    def claim(self, limit: int, visibility_timeout_seconds: float) -> tuple[str, list[EnrichmentJobAppModel]]:
+        claim_id = f"{self._owner}:{uuid.uuid4().hex[:12]}"
+        with self._session_factory() as session:
+            jobs = claim_enrichment_jobs(session, claim_id, max(1, limit), visibility_timeout_seconds)
+            return claim_id, [convert_enrichment_job_dto(job) for job in jobs]
+
+    def complete(self, claim_id: str, isbn13s: list[str]) -> None:
+        with self._session_factory() as session:
+            complete_enrichment_jobs(session, claim_id, isbn13s)
+
+    def retry(self, claim_id: str, isbn13s: list[str], error: str) -> None:
+        with self._session_factory() as session:
+            retry_enrichment_jobs(
+                session,
+                claim_id,
+                isbn13s,
+                error,
+                max_attempts=ENRICHMENT_JOB_MAX_ATTEMPTS,
+                base_delay_seconds=ENRICHMENT_JOB_RETRY_BASE_DELAY_SECONDS,
+                max_delay_seconds=ENRICHMENT_JOB_RETRY_MAX_DELAY_SECONDS,
+            )
+
+    def counts(self) -> dict[str, int]:
+        with self._session_factory() as session:
+            return count_enrichment_jobs(session)
 
 
 class PublisherCatalogProvider:
@@ -488,6 +1576,14 @@ class PublisherCatalogProvider:
     def fetch_books(self) -> list[PublisherCatalogBookAppModel]:
         raise NotImplementedError
 
+    def fetch_catalog(self, validators: CatalogValidators) -> CatalogFetchResult:
+        # Sources without HTTP validators are compared by a hash of the parsed catalog.
+        books = self.fetch_books()[:PUBLISHER_CATALOG_MAX_ITEMS]
+        content_hash = hash_catalog_books(books)
+        if content_hash == validators.content_hash:
+            return CatalogFetchResult(None, validators)
+        return CatalogFetchResult(books, CatalogValidators(content_hash=content_hash))
+
 
 class OreillyCatalogProvider(PublisherCatalogProvider):
     publisher_id = "oreilly_japan"
@@ -496,8 +1592,25 @@ class OreillyCatalogProvider(PublisherCatalogProvider):
     catalog_url = "https://www.oreilly.co.jp/catalog/"
 
     def fetch_books(self) -> list[PublisherCatalogBookAppModel]:
-        html = fetch_text(self.catalog_url)
-        return parse_oreilly_catalog(html, self.catalog_url)
+        return self.fetch_catalog(CatalogValidators()).books or []
+
+    def fetch_catalog(self, validators: CatalogValidators) -> CatalogFetchResult:
+        with open_fetch_stream(self.catalog_url, create_conditional_headers(validators)) as stream:
+            if stream.status == 304:
+                return CatalogFetchResult(None, validators)
+            # Rows are parsed while the page downloads, and the rest of the page is dropped at the item limit.
+            books = list(
+                islice(iter_oreilly_catalog(stream.iter_text(), self.catalog_url), PUBLISHER_CATALOG_MAX_ITEMS)
+            )
+
+        current = CatalogValidators(
+            etag=stream.headers.get("etag"),
+            last_modified=stream.headers.get("last-modified"),
+            content_hash=hash_catalog_books(books),
+        )
+        if current.content_hash == validators.content_hash:
+            return CatalogFetchResult(None, current)
+        return CatalogFetchResult(books, current)
 
 
 class GihyoCatalogProvider(PublisherCatalogProvider):
@@ -510,31 +1623,263 @@ class GihyoCatalogProvider(PublisherCatalogProvider):
         "https://gihyo.jp/api_gh/book/genre/%E3%83%8D%E3%83%83%E3%83%88%E3%83%AF%E3%83%BC%E3%82%AF%E3%83%BBUNIX%E3%83%BB%E3%83%87%E3%83%BC%E3%82%BF%E3%83%99%E3%83%BC%E3%82%B9",
     ]
     fetch_limit = 100
+    max_concurrent_genres = GIHYO_MAX_CONCURRENT_GENRES
 
     def fetch_books(self) -> list[PublisherCatalogBookAppModel]:
-        books: list[PublisherCatalogBookAppModel] = []
-        for url in self.catalog_urls:
-            books.extend(fetch_gihyo_catalog_books(url, self.base_url, self.fetch_limit))
+        # Genres are fetched concurrently; map_concurrently keeps catalog_urls order so dedup stays deterministic.
+        pages = map_concurrently(
+            lambda url: fetch_gihyo_catalog_books(url, self.base_url, self.fetch_limit),
+            self.catalog_urls,
+            self.max_concurrent_genres,
+        )
+        books = [book for page in pages for book in page]
         unique_books = unique_catalog_books(books)
         return sorted(unique_books, key=lambda book: book.published_at, reverse=True)
 
 
-def fetch_json(url: str, params: dict[str, str]) -> dict | list:
+def fetch_json(url: str, params: dict[str, str], rate_limiter: RateLimiter | None = None) -> dict | list:
     filtered = {key: value for key, value in params.items() if value}
-    request = Request(f"{url}?{urlencode(filtered)}", headers={"User-Agent": "bookshelf-app"})
+    return get_provider_response_cache().fetch(
+        url, filtered, lambda: call_fetch(url, lambda: get_http_client().get(url, filtered).json(), rate_limiter)
+    )
+
+
+def post_form_json(url: str, data: dict[str, str], rate_limiter: RateLimiter | None = None) -> dict | list:
+    return get_provider_response_cache().fetch(
+        url, data, lambda: call_fetch(url, lambda: get_http_client().post_form(url, data).json(), rate_limiter)
+    )
+
+
+def call_fetch(url: str, func: Callable[[], T], rate_limiter: RateLimiter | None = None) -> T:
+    # Runs only on a response cache miss, so cached answers never take a token.
+    def attempt() -> T:
+        # Retries take a token too, and every 429 slows the shared bucket before the next attempt.
+        if rate_limiter is not None and not rate_limiter.acquire():
+            raise BookSearchRateLimitError()
+        try:
+            return func()
+        except HttpStatusError as error:
+            if error.status == 429 and rate_limiter is not None:
+                rate_limiter.throttle(error.retry_after_seconds())
+            raise
+
     try:
-        with urlopen(request, timeout=10) as response:
-            return json.loads(response.read().decode("utf-8"))
-    except HTTPError as error:
-        if error.code == 429:
+        return get_fetch_retrier().call(get_fetch_provider_name(url), attempt)
+    except HttpStatusError as error:
+        if error.status == 429:
             raise BookSearchRateLimitError() from error
         raise
 
 
-def fetch_text(url: str) -> str:
-    request = Request(url, headers={"User-Agent": "bookshelf-app"})
-    with urlopen(request, timeout=10) as response:
-        return response.read().decode("utf-8")
+def open_fetch_stream(url: str, headers: dict[str, str] | None = None) -> HttpStream:
+    # Only opening the stream is retried; a failure mid-body surfaces to the caller.
+    return get_fetch_retrier().call(get_fetch_provider_name(url), lambda: get_http_client().stream(url, headers=headers))
+
+
+def create_conditional_headers(validators: CatalogValidators) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    if validators.etag:
+        headers["If-None-Match"] = validators.etag
+    if validators.last_modified:
+        headers["If-Modified-Since"] = validators.last_modified
+    return headers
+
+
+class ProviderResponseCache:
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        ttl_seconds: dict[str, float] | None = None,
+        max_bytes: int = PROVIDER_RESPONSE_CACHE_MAX_BYTES,
+        prune_interval_seconds: float = PROVIDER_RESPONSE_CACHE_PRUNE_INTERVAL_SECONDS,
+    ):
+        self._session_factory = session_factory
+        self._ttl_seconds = PROVIDER_RESPONSE_CACHE_SECONDS if ttl_seconds is None else ttl_seconds
+        self._max_bytes = max_bytes
+        self._prune_interval_seconds = prune_interval_seconds
+        self._lock = threading.Lock()
+        self._stats: dict[str, list[int]] = {}
+        self._last_pruned_at = time.monotonic()
+
+    def fetch(self, url: str, params: dict[str, str], fetch: Callable[[], dict | list]) -> dict | list:
+        provider = get_fetch_provider_name(url)
+        ttl_seconds = self._ttl_seconds.get(provider)
+        if not ttl_seconds:
+            return fetch()
+
+        request_key = create_provider_request_key(url, params)
+        cache_key = hashlib.sha256(request_key.encode("utf-8")).hexdigest()
+        cached = self._load(cache_key)
+        self._count(provider, hit=cached is not None)
+        if cached is not None:
+            return cached
+
+        data = fetch()
+        self._save(provider, cache_key, request_key, data, ttl_seconds)
+        return data
+
+    def clear(self) -> int:
+        with self._session_factory() as session:
+            return delete_provider_responses(session) or 0
+
+    def stats(self) -> dict[str, DatabaseCacheStats]:
+        with self._lock:
+            return {provider: DatabaseCacheStats(hits, misses) for provider, (hits, misses) in self._stats.items()}
+
+    def _count(self, provider: str, hit: bool) -> None:
+        with self._lock:
+            counts = self._stats.setdefault(provider, [0, 0])
+            counts[0 if hit else 1] += 1
+
+    def _load(self, cache_key: str) -> dict | list | None:
+        # The cache only saves round-trips; a database problem falls back to the provider.
+        try:
+            with self._session_factory() as session:
+                row = load_provider_response(session, cache_key, datetime.now(timezone.utc))
+                payload = row.payload if row is not None else None
+            return json.loads(zlib.decompress(payload)) if payload is not None else None
+        except Exception:
+            logger.warning("Failed to load provider response cache.", exc_info=True)
+            return None
+
+    def _save(self, provider: str, cache_key: str, request_key: str, data: dict | list, ttl_seconds: float) -> None:
+        payload = zlib.compress(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        if len(payload) > self._max_bytes:
+            return
+        now = datetime.now(timezone.utc)
+        try:
+            with self._session_factory() as session:
+                upsert_provider_responses(
+                    session,
+                    [
+                        {
+                            "cache_key": cache_key,
+                            "provider": provider,
+                            "request_key": request_key,
+                            "payload": payload,
+                            "fetched_at": now,
+                            "expires_at": now + timedelta(seconds=ttl_seconds),
+                            "is_deleted": False,
+                        }
+                    ],
+                )
+                session.commit()
+                if self._should_prune():
+                    delete_provider_responses(session, expired_before=now)
+        except Exception:
+            logger.warning("Failed to save provider response cache. provider:%s", provider, exc_info=True)
+
+    def _should_prune(self) -> bool:
+        with self._lock:
+            if time.monotonic() - self._last_pruned_at < self._prune_interval_seconds:
+                return False
+            self._last_pruned_at = time.monotonic()
+            return True
+
+
+@lru_cache()
+def get_provider_response_cache() -> ProviderResponseCache:
+    # One instance per process; the rows themselves are shared by every worker.
+    return ProviderResponseCache(ttl_seconds=None if get_settings().provider_response_cache_enabled else {})
+
+
+def create_provider_request_key(url: str, params: dict[str, str]) -> str:
+    # The API key never affects the answer, so it is left out of the key and never stored.
+    parts = urlsplit(url)
+    normalized = sorted(
+        (key, normalize_space(unicodedata.normalize("NFKC", value)))
+        for key, value in params.items()
+        if key not in PROVIDER_RESPONSE_CACHE_EXCLUDED_PARAMS and value
+    )
+    return json.dumps([parts.hostname, parts.path, normalized], ensure_ascii=False, separators=(",", ":"))
+
+
+@lru_cache()
+def get_fetch_retrier() -> Retrier:
+    return Retrier(
+        RetryPolicy(
+            max_retries=FETCH_MAX_RETRIES,
+            base_delay_seconds=FETCH_RETRY_BASE_DELAY_SECONDS,
+            max_delay_seconds=FETCH_RETRY_MAX_DELAY_SECONDS,
+            deadline_seconds=FETCH_RETRY_DEADLINE_SECONDS,
+        ),
+        is_retryable=is_retryable_fetch_error,
+        retry_after=get_retry_after_seconds,
+    )
+
+
+def get_fetch_provider_name(url: str) -> str:
+    return urlsplit(url).hostname or url
+
+
+def is_transient_fetch_error(error: Exception) -> bool:
+    if isinstance(error, HttpStatusError):
+        return error.status in RETRYABLE_HTTP_STATUSES
+    if isinstance(error, BookSearchRateLimitError):
+        return True
+    return isinstance(error, (TimeoutError, ConnectionError, http.client.HTTPException))
+
+
+def is_retryable_fetch_error(error: Exception) -> bool:
+    # An exhausted local budget gives up at once instead of waiting again on the next attempt.
+    return not isinstance(error, BookSearchRateLimitError) and is_transient_fetch_error(error)
+
+
+def get_retry_after_seconds(error: Exception) -> float | None:
+    if isinstance(error, HttpStatusError):
+        return error.retry_after_seconds()
+    return None
+
+
+def split_evenly(items: list[T], max_size: int) -> list[list[T]]:
+    chunk_count = max(1, -(-len(items) // max(1, max_size)))
+    size, remainder = divmod(len(items), chunk_count)
+    chunks: list[list[T]] = []
+    start = 0
+    for index in range(chunk_count):
+        end = start + size + (1 if index < remainder else 0)
+        chunks.append(items[start:end])
+        start = end
+    return [chunk for chunk in chunks if chunk]
+
+
+def map_concurrently(func: Callable[[T], R], items: list[T], max_workers: int) -> list[R]:
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        contexts = [contextvars.copy_context() for _ in items]
+        return list(executor.map(lambda context, item: context.run(func, item), contexts, items))
+
+
+def call_concurrently_with_timeouts(
+    executor: ThreadPoolExecutor, calls: list[tuple[str, Callable[[], T], float]]
+) -> list[T | None]:
+    started_at = time.monotonic()
+    futures = [executor.submit(contextvars.copy_context().run, func) for _name, func, _timeout in calls]
+    results: list[T | None] = []
+    timed_out_names: list[str] = []
+    errors: list[Exception] = []
+    for future, (name, _func, timeout_seconds) in zip(futures, calls):
+        remaining = max(0.0, timeout_seconds - (time.monotonic() - started_at))
+        try:
+            results.append(future.result(timeout=remaining))
+        except TimeoutError:
+            # A slow provider keeps running in the background until its own socket timeout.
+            logger.warning("Book search provider timed out. provider:%s, timeout:%s", name, timeout_seconds)
+            timed_out_names.append(name)
+            results.append(None)
+        except Exception as error:
+            # One failing provider must not throw away the other provider's answer.
+            logger.warning("Book search provider failed. provider:%s", name, exc_info=True)
+            errors.append(error)
+            results.append(None)
+
+    if calls and len(timed_out_names) == len(calls):
+        raise TimeoutError(f"all book search providers timed out: {timed_out_names}")
+    if calls and len(timed_out_names) + len(errors) == len(calls):
+        raise errors[0]
+    return results
 
 
 def convert_openbd_item(item: dict | None, fallback_isbn13: str) -> BookSearchResultAppModel | None:
@@ -585,25 +1930,35 @@ def unique_search_queries(queries: list[str]) -> list[str]:
 
 
 def parse_oreilly_catalog(html: str, base_url: str) -> list[PublisherCatalogBookAppModel]:
+    return list(iter_oreilly_catalog([html], base_url))
+
+
+def iter_oreilly_catalog(chunks: Iterable[str], base_url: str) -> Iterator[PublisherCatalogBookAppModel]:
     parser = _HtmlTableExtractor()
-    parser.feed(html)
-    parser.close()
+    seen: set[str] = set()
 
-    books: list[PublisherCatalogBookAppModel] = []
-    for row in parser.rows:
-        if len(row.cells) < 4 or not is_isbn13(row.cells[0]):
-            continue
-        books.append(
-            PublisherCatalogBookAppModel(
-                isbn13=normalize_isbn(row.cells[0]),
+    def drain() -> Iterator[PublisherCatalogBookAppModel]:
+        rows, parser.rows = parser.rows, []
+        for row in rows:
+            if len(row.cells) < 4 or not is_isbn13(row.cells[0]):
+                continue
+            isbn13 = normalize_isbn(row.cells[0])
+            if isbn13 in seen:
+                continue
+            seen.add(isbn13)
+            yield PublisherCatalogBookAppModel(
+                isbn13=isbn13,
                 title=row.cells[1].strip(),
                 price=row.cells[2].strip() or None,
                 published_at=parse_published_date(row.cells[3]),
                 source_url=urljoin(base_url, row.href) if row.href else base_url,
             )
-        )
 
-    return unique_catalog_books(books)
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
 
 
 def fetch_gihyo_catalog_books(
@@ -612,25 +1967,37 @@ def fetch_gihyo_catalog_books(
     limit: int,
 ) -> list[PublisherCatalogBookAppModel]:
     books: list[PublisherCatalogBookAppModel] = []
-    offset = 0
     page_size = max(1, min(limit, 100))
-    while len(books) < PUBLISHER_CATALOG_MAX_ITEMS:
-        data = fetch_json(
+
+    def fetch_page(offset: int) -> dict | list:
+        return fetch_json(
             api_url,
             {
                 "limit": str(page_size),
                 "offset": str(offset),
             },
         )
-        if not isinstance(data, dict):
-            break
-
-        page_books = parse_gihyo_catalog_response(data, base_url)
-        books.extend(page_books)
-        if not data.get("next") or not page_books:
-            break
 
-        offset += page_size
+    # One request in flight per genre: page N+1 is requested as soon as page N says there is a next page,
+    # and downloads while page N is parsed.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        offset = 0
+        pending = executor.submit(contextvars.copy_context().run, fetch_page, offset)
+        while pending is not None:
+            data = pending.result()
+            pending = None
+            if not isinstance(data, dict):
+                break
+
+            if data.get("next") and offset + page_size < PUBLISHER_CATALOG_MAX_ITEMS:
+                offset += page_size
+                pending = executor.submit(contextvars.copy_context().run, fetch_page, offset)
+
+            page_books = parse_gihyo_catalog_response(data, base_url)
+            books.extend(page_books)
+            if not page_books and pending is not None:
+                pending.cancel()
+                break
 
     return unique_catalog_books(books)
 
@@ -736,14 +2103,72 @@ class _HtmlTableExtractor(HTMLParser):
 def filter_catalog_books(
     books: list[PublisherCatalogBookAppModel], keyword: str | None
 ) -> list[PublisherCatalogBookAppModel]:
-    normalized = normalize_space(keyword or "").lower()
+    normalized = normalize_catalog_search_text(keyword or "")
     if not normalized:
         return books
-    return [
-        book
-        for book in books
-        if normalized in book.title.lower() or normalized in normalize_isbn(book.isbn13).lower()
-    ]
+    return [book for book in books if normalized in create_catalog_search_document(book)]
+
+
+def create_catalog_snapshot(fetched_at: datetime, books: list[PublisherCatalogBookAppModel]) -> CatalogSnapshot:
+    return CatalogSnapshot(
+        fetched_at=fetched_at,
+        books=tuple(sorted(books, key=lambda book: book.published_at, reverse=True)),
+    )
+
+
+def diff_catalog_books(
+    previous: list[PublisherCatalogBookAppModel], current: list[PublisherCatalogBookAppModel]
+) -> CatalogDiff:
+    previous_by_isbn = {book.isbn13: create_catalog_book_row(book) for book in previous}
+    current_by_isbn = {book.isbn13: create_catalog_book_row(book) for book in unique_catalog_books(current)}
+    return CatalogDiff(
+        added=[isbn13 for isbn13 in current_by_isbn if isbn13 not in previous_by_isbn],
+        removed=[isbn13 for isbn13 in previous_by_isbn if isbn13 not in current_by_isbn],
+        changed=[
+            isbn13
+            for isbn13, row in current_by_isbn.items()
+            if isbn13 in previous_by_isbn and previous_by_isbn[isbn13] != row
+        ],
+    )
+
+
+def hash_catalog_books(books: list[PublisherCatalogBookAppModel]) -> str:
+    rows = [create_catalog_book_row(book) for book in books]
+    return hashlib.sha256(json.dumps(rows, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def create_catalog_book_row(book: PublisherCatalogBookAppModel) -> tuple:
+    # Compare what is stored, so titles cut to the column length do not show up as changes.
+    return (
+        book.isbn13,
+        book.title[:CATALOG_TITLE_MAX_LENGTH],
+        book.published_at.isoformat(),
+        book.price,
+        book.source_url,
+    )
+
+
+def create_catalog_search_document(book: PublisherCatalogBookAppModel) -> str:
+    # The separator never appears in a normalized keyword, so matches cannot span title and ISBN.
+    return f"{normalize_catalog_search_text(book.title)}\n{normalize_isbn(book.isbn13).lower()}"
+
+
+def normalize_catalog_search_text(value: str) -> str:
+    return normalize_search_keyword(value).translate(HIRAGANA_TO_KATAKANA)
+
+
+def convert_enrichment_job_dto(dto: BookEnrichmentJobDTO) -> EnrichmentJobAppModel:
+    return EnrichmentJobAppModel(
+        book=PublisherCatalogBookAppModel(
+            isbn13=dto.isbn13,
+            title=dto.title,
+            published_at=dto.published_at,
+            price=dto.price,
+            source_url=dto.source_url,
+        ),
+        publisher_name=dto.publisher_name,
+        attempts=dto.attempts,
+    )
 
 
 def convert_catalog_book(book: PublisherCatalogBookAppModel, publisher_name: str) -> BookSearchResultAppModel:
@@ -767,39 +2192,16 @@ def unique_catalog_books(books: list[PublisherCatalogBookAppModel]) -> list[Publ
     return list(by_isbn.values())
 
 
-def catalog_books_to_json(books: list[PublisherCatalogBookAppModel]) -> str:
-    return json.dumps(
-        {
-            "books": [
-                {
-                    "isbn13": book.isbn13,
-                    "title": book.title,
-                    "published_at": book.published_at.isoformat(),
-                    "price": book.price,
-                    "source_url": book.source_url,
-                }
-                for book in books
-            ]
-        },
-        ensure_ascii=False,
+def convert_catalog_book_dto(dto: PublisherCatalogBookDTO) -> PublisherCatalogBookAppModel:
+    return PublisherCatalogBookAppModel(
+        isbn13=dto.isbn13,
+        title=dto.title,
+        published_at=dto.published_at,
+        price=dto.price,
+        source_url=dto.source_url,
     )
 
 
-def catalog_books_from_json(payload_json: str) -> list[PublisherCatalogBookAppModel]:
-    payload = json.loads(payload_json)
-    return [
-        PublisherCatalogBookAppModel(
-            isbn13=normalize_isbn(item["isbn13"]),
-            title=item["title"],
-            published_at=parse_published_date(item["published_at"]),
-            price=item.get("price"),
-            source_url=item.get("source_url"),
-        )
-        for item in payload.get("books", [])
-        if isinstance(item, dict) and item.get("isbn13") and item.get("title")
-    ]
-
-
 def book_search_result_to_json(book: BookSearchResultAppModel) -> str:
     return json.dumps(
         {
@@ -869,6 +2271,8 @@ def metadata_cache_needs_refresh(
 ) -> bool:
     if dto is None or getattr(dto, "is_deleted", False):
         return True
+    if getattr(dto, "status", BOOK_METADATA_FOUND) == BOOK_METADATA_NOT_FOUND:
+        return is_cache_expired(dto.expires_at)
 
     fetched_at = dto.fetched_at
     comparable_refresh_before = refresh_before
@@ -884,6 +2288,10 @@ def metadata_cache_needs_refresh(
     return book is None or not book.image_url
 
 
+def is_complete_book_metadata(book: BookSearchResultAppModel) -> bool:
+    return bool(book.image_url) and book.source != "publisher-catalog"
+
+
 def preserve_cached_metadata(
     refreshed_book: BookSearchResultAppModel,
     cached_book: BookSearchResultAppModel | None,
@@ -1028,6 +2436,10 @@ def normalize_space(value: str) -> str:
     return re.sub(r"\s+", " ", value).strip()
 
 
+def normalize_search_keyword(keyword: str) -> str:
+    return normalize_space(unicodedata.normalize("NFKC", keyword)).lower()
+
+
 def is_isbn13(value: str) -> bool:
     return re.fullmatch(r"\d{13}", normalize_isbn(value)) is not None
 
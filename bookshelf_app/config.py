@@ -13,6 +13,19 @@ class Settings(BaseSettings):
     crypt_algorithm: str = ""
     db_connection: str = ""
     google_books_api_key: str = ""
+    google_books_interactive_rate_per_second: float = 5.0
+    google_books_warmup_rate_per_second: float = 2.0
+    http_connect_timeout_seconds: float = 5.0
+    http_read_timeout_seconds: float = 10.0
+    http_max_connections_per_host: int = 8
+    metadata_warmup_enabled: bool = False
+    metadata_warmup_interval_seconds: float = 3600.0
+    metadata_warmup_initial_delay_seconds: float = 60.0
+    metadata_warmup_refresh_after_days: int = 14
+    metadata_warmup_batch_size: int = 40
+    book_enrichment_queue_enabled: bool = True
+    book_enrichment_worker_poll_seconds: float = 5.0
+    provider_response_cache_enabled: bool = True
 
     model_config = SettingsConfigDict(env_file=(os.getenv("ENV_FILE", ".env"), ".env.prod"), env_file_encoding="utf-8")
 
@@ -59,6 +59,20 @@ export default function AdminDebugContainer() {
     });
   };
 
+  const clearProviderResponseCache = async () => {
+    const confirmed = await showConfirmDialog(
+      "確認",
+      "外部API応答キャッシュを削除します。次回の検索時にopenBD / Google Booksへ問い合わせ直します。よろしいですか？"
+    );
+    if (!confirmed) {
+      return;
+    }
+    await clearCache(async () => {
+      const res = await debugApi.clearProviderResponseCache();
+      return `外部API応答キャッシュを ${res.data.deletedCount} 件削除しました。`;
+    });
+  };
+
   const clearCache = async (action: () => Promise<string>) => {
     setLoading(true);
     try {
@@ -96,6 +110,13 @@ export default function AdminDebugContainer() {
           disabled={loading}
           onClick={clearBookMetadataCache}
         />
+        <CacheCard
+          title="外部API応答キャッシュ"
+          description="openBD / Google Booksの応答をリクエストごとに保存したものです。書籍メタデータを最新の内容で取り直したいときは、こちらも削除してください。"
+          buttonText="外部API応答を削除"
+          disabled={loading}
+          onClick={clearProviderResponseCache}
+        />
       </Stack>
       {renderConfirmDialog()}
     </>
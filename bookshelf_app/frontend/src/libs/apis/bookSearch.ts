@@ -64,6 +64,36 @@ export default class BookSearchApi extends ApiBase {
       },
     };
   }
+
+  async findByIsbn13s(
+    isbn13s: string[]
+  ): Promise<ApiResponse<BookByIsbn13Response[]>> {
+    const res = await this.postAsync<ApiBooksByIsbn13sResponse>(
+      "/book_search/isbn13s",
+      { isbn13s }
+    );
+    return {
+      data: res.data.books.map((book) => ({
+        isbn13: book.isbn13,
+        book: book.book ? convertBook(book.book) : null,
+      })),
+    };
+  }
+
+  async findDescriptionsByIsbn13s(
+    isbn13s: string[]
+  ): Promise<ApiResponse<BookDescriptionResponse[]>> {
+    const res = await this.postAsync<ApiBookDescriptionsResponse>(
+      "/book_search/isbn13s/descriptions",
+      { isbn13s }
+    );
+    return {
+      data: res.data.descriptions.map((description) => ({
+        isbn13: description.isbn13,
+        description: description.description ?? null,
+      })),
+    };
+  }
 }
 
 type BookSearchResponse = {
@@ -124,23 +154,41 @@ type ApiBookDescriptionResponse = {
   description?: string | null;
 };
 
+type ApiBookDescriptionsResponse = {
+  descriptions: ApiBookDescriptionResponse[];
+};
+
+type BookByIsbn13Response = {
+  isbn13: string;
+  book: BookSearchResult | null;
+};
+
+type ApiBooksByIsbn13sResponse = {
+  books: {
+    isbn13: string;
+    book?: ApiBookSearchResult | null;
+  }[];
+};
+
 const convert = (data: ApiBookSearchResponse): BookSearchResponse => {
   return {
-    books: data.books.map((book) => ({
-      source:
-        book.source === "openbd"
-          ? "openbd"
-          : book.source === "publisher-catalog"
-          ? "publisher-catalog"
-          : "google-books",
-      sourceId: book.source_id,
-      title: book.title,
-      authors: book.authors,
-      publisher: book.publisher,
-      isbn13: book.isbn13,
-      publishedAt: toDate(book.published_at),
-      imageUrl: book.image_url,
-      description: book.description ?? undefined,
-    })),
+    books: data.books.map(convertBook),
   };
 };
+
+const convertBook = (book: ApiBookSearchResult): BookSearchResult => ({
+  source:
+    book.source === "openbd"
+      ? "openbd"
+      : book.source === "publisher-catalog"
+      ? "publisher-catalog"
+      : "google-books",
+  sourceId: book.source_id,
+  title: book.title,
+  authors: book.authors,
+  publisher: book.publisher,
+  isbn13: book.isbn13,
+  publishedAt: toDate(book.published_at),
+  imageUrl: book.image_url,
+  description: book.description ?? undefined,
+});
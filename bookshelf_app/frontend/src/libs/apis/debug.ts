@@ -22,4 +22,11 @@ export default class DebugApi extends ApiBase {
     );
     return { data: { deletedCount: res.data.deleted_count } };
   }
+
+  async clearProviderResponseCache(): Promise<ApiResponse<CacheClearResponse>> {
+    const res = await this._api.delete<ApiCacheClearResponse>(
+      "/book_search/cache/provider-responses"
+    );
+    return { data: { deletedCount: res.data.deleted_count } };
+  }
 }
@@ -1,9 +1,13 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import DateTime, String, UnicodeText
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Date, DateTime, ForeignKey, Index, Integer, String, Unicode, UnicodeText, delete, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
 
 from bookshelf_app.infra.db.database import Base
+from bookshelf_app.infra.db.upsert import UPSERT_BATCH_SIZE, upsert_rows
+
+BOOK_METADATA_FOUND = "found"
+BOOK_METADATA_NOT_FOUND = "not_found"
 
 
 class PublisherCatalogCacheDTO(Base):
@@ -11,9 +15,32 @@ class PublisherCatalogCacheDTO(Base):
     __table_args__ = {"comment": "出版社カタログキャッシュ"}
 
     source_key: Mapped[str] = mapped_column(String(length=100), primary_key=True, comment="取得元キー")
-    payload_json: Mapped[str] = mapped_column(UnicodeText, nullable=False, comment="カタログJSON")
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="取得日時")
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True, comment="期限日時")
+    http_etag: Mapped[str | None] = mapped_column(String(length=500), nullable=True, comment="ETag")
+    http_last_modified: Mapped[str | None] = mapped_column(String(length=100), nullable=True, comment="Last-Modified")
+    content_hash: Mapped[str | None] = mapped_column(String(length=64), nullable=True, comment="取得内容のハッシュ")
+
+
+class PublisherCatalogBookDTO(Base):
+    __tablename__ = "publisher_catalog_book"
+    __table_args__ = (
+        Index("ix_publisher_catalog_book_source_key_published_at", "source_key", "published_at"),
+        {"comment": "出版社カタログ書籍"},
+    )
+
+    source_key: Mapped[str] = mapped_column(
+        String(length=100),
+        ForeignKey("publisher_catalog_cache.source_key", ondelete="CASCADE"),
+        primary_key=True,
+        comment="取得元キー",
+    )
+    isbn13: Mapped[str] = mapped_column(String(length=13), primary_key=True, comment="ISBN13")
+    position: Mapped[int] = mapped_column(Integer, nullable=False, comment="カタログ内の掲載順")
+    title: Mapped[str] = mapped_column(Unicode(length=500), nullable=False, comment="タイトル")
+    published_at: Mapped[date] = mapped_column(Date, nullable=False, comment="発行日")
+    price: Mapped[str | None] = mapped_column(Unicode(length=100), nullable=True, comment="価格")
+    source_url: Mapped[str | None] = mapped_column(UnicodeText, nullable=True, comment="取得元URL")
 
 
 class BookMetadataCacheDTO(Base):
@@ -22,5 +49,41 @@ class BookMetadataCacheDTO(Base):
 
     isbn13: Mapped[str] = mapped_column(String(length=13), primary_key=True, comment="ISBN13")
     payload_json: Mapped[str] = mapped_column(UnicodeText, nullable=False, comment="書籍メタデータJSON")
+    status: Mapped[str] = mapped_column(
+        String(length=20),
+        nullable=False,
+        default=BOOK_METADATA_FOUND,
+        server_default=BOOK_METADATA_FOUND,
+        comment="found: 取得済み, not_found: どの取得元にも無い",
+    )
     fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="取得日時")
     expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True, comment="期限日時")
+    description_checked_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True, comment="どの取得元にも概要が無いと確認した日時"
+    )
+
+
+def upsert_publisher_catalog_caches(session: Session, rows: list[dict], batch_size: int = UPSERT_BATCH_SIZE) -> None:
+    upsert_rows(session, PublisherCatalogCacheDTO.__table__, rows, ["source_key"], batch_size)
+
+
+def upsert_book_metadata_caches(session: Session, rows: list[dict], batch_size: int = UPSERT_BATCH_SIZE) -> None:
+    upsert_rows(session, BookMetadataCacheDTO.__table__, rows, ["isbn13"], batch_size)
+
+
+def replace_publisher_catalog_books(
+    session: Session, source_key: str, rows: list[dict], batch_size: int = UPSERT_BATCH_SIZE
+) -> None:
+    session.execute(delete(PublisherCatalogBookDTO).where(PublisherCatalogBookDTO.source_key == source_key))
+    for start in range(0, len(rows), batch_size):
+        session.execute(PublisherCatalogBookDTO.__table__.insert(), rows[start : start + batch_size])
+
+
+def load_publisher_catalog_books(session: Session, source_key: str) -> list[PublisherCatalogBookDTO]:
+    stmt = (
+        select(PublisherCatalogBookDTO)
+        .where(PublisherCatalogBookDTO.source_key == source_key)
+        .order_by(PublisherCatalogBookDTO.position)
+    )
+    return list(session.scalars(stmt))
+
@@ -0,0 +1,180 @@
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import Date, DateTime, Integer, String, Unicode, UnicodeText, delete, func, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from bookshelf_app.infra.db.database import Base
+from bookshelf_app.infra.db.upsert import UPSERT_BATCH_SIZE, unique_rows
+
+ENRICHMENT_JOB_PENDING = "pending"
+ENRICHMENT_JOB_FAILED = "failed"
+ENRICHMENT_JOB_FAILED_COOLDOWN = timedelta(days=1)
+ENRICHMENT_JOB_FAILED_RETENTION = timedelta(days=7)
+
+
+class BookEnrichmentJobDTO(Base):
+    __tablename__ = "book_enrichment_job"
+    __table_args__ = {"comment": "書籍メタデータ補完ジョブ"}
+
+    isbn13: Mapped[str] = mapped_column(String(length=13), primary_key=True, comment="ISBN13")
+    publisher_name: Mapped[str] = mapped_column(Unicode(length=200), nullable=False, comment="出版社名")
+    title: Mapped[str] = mapped_column(Unicode(length=500), nullable=False, comment="カタログ上のタイトル")
+    published_at: Mapped[date] = mapped_column(Date, nullable=False, comment="カタログ上の発行日")
+    price: Mapped[str | None] = mapped_column(Unicode(length=100), nullable=True, comment="価格")
+    source_url: Mapped[str | None] = mapped_column(UnicodeText, nullable=True, comment="取得元URL")
+    status: Mapped[str] = mapped_column(String(length=20), nullable=False, comment="状態")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="試行回数")
+    available_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True, comment="次に取り出せる日時"
+    )
+    claimed_by: Mapped[str | None] = mapped_column(String(length=100), nullable=True, comment="取り出したワーカー")
+    last_error: Mapped[str | None] = mapped_column(UnicodeText, nullable=True, comment="最後のエラー")
+
+
+def enqueue_enrichment_jobs(session: Session, rows: list[dict], batch_size: int = UPSERT_BATCH_SIZE) -> int:
+    # One job per ISBN: queued rows are left untouched, and failed rows are retried once their cooldown has passed.
+    rows = unique_rows(rows, ["isbn13"])
+    now = datetime.now(timezone.utc)
+    _purge_failed_jobs(session, now)
+    inserted = 0
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        try:
+            inserted += _insert_new_jobs(session, batch, now)
+            session.commit()
+        except IntegrityError:
+            # Another worker queued some of the same ISBNs in between; the retry skips them.
+            session.rollback()
+            inserted += _insert_new_jobs(session, batch, now)
+            session.commit()
+    return inserted
+
+
+def _insert_new_jobs(session: Session, rows: list[dict], now: datetime) -> int:
+    existing = set(
+        session.scalars(
+            select(BookEnrichmentJobDTO.isbn13).where(BookEnrichmentJobDTO.isbn13.in_([row["isbn13"] for row in rows]))
+        )
+    )
+    if existing:
+        revived = session.execute(
+            update(BookEnrichmentJobDTO)
+            .where(
+                BookEnrichmentJobDTO.isbn13.in_(existing),
+                BookEnrichmentJobDTO.status == ENRICHMENT_JOB_FAILED,
+                BookEnrichmentJobDTO.available_at <= now,
+            )
+            .values(status=ENRICHMENT_JOB_PENDING, attempts=0, available_at=now, claimed_by=None)
+        ).rowcount
+    else:
+        revived = 0
+    new_rows = [
+        {
+            **row,
+            "status": ENRICHMENT_JOB_PENDING,
+            "attempts": 0,
+            "available_at": now,
+            "is_deleted": False,
+        }
+        for row in rows
+        if row["isbn13"] not in existing
+    ]
+    if new_rows:
+        session.execute(BookEnrichmentJobDTO.__table__.insert(), new_rows)
+    return revived + len(new_rows)
+
+
+def _purge_failed_jobs(session: Session, now: datetime) -> None:
+    # Failed ISBNs that nobody asked for again within the retention window are dropped.
+    session.execute(
+        delete(BookEnrichmentJobDTO).where(
+            BookEnrichmentJobDTO.status == ENRICHMENT_JOB_FAILED,
+            BookEnrichmentJobDTO.available_at <= now - ENRICHMENT_JOB_FAILED_RETENTION,
+        )
+    )
+    session.commit()
+
+
+def claim_enrichment_jobs(
+    session: Session, claim_id: str, limit: int, visibility_timeout_seconds: float
+) -> list[BookEnrichmentJobDTO]:
+    now = datetime.now(timezone.utc)
+    candidates = list(
+        session.scalars(
+            select(BookEnrichmentJobDTO.isbn13)
+            .where(BookEnrichmentJobDTO.status == ENRICHMENT_JOB_PENDING, BookEnrichmentJobDTO.available_at <= now)
+            .order_by(BookEnrichmentJobDTO.available_at)
+            .limit(limit)
+        )
+    )
+    if not candidates:
+        return []
+
+    # Re-checking available_at in the UPDATE keeps two workers from claiming the same row.
+    # An unfinished claim becomes visible again once the timeout passes.
+    session.execute(
+        update(BookEnrichmentJobDTO)
+        .where(
+            BookEnrichmentJobDTO.isbn13.in_(candidates),
+            BookEnrichmentJobDTO.status == ENRICHMENT_JOB_PENDING,
+            BookEnrichmentJobDTO.available_at <= now,
+        )
+        .values(
+            claimed_by=claim_id,
+            attempts=BookEnrichmentJobDTO.attempts + 1,
+            available_at=now + timedelta(seconds=visibility_timeout_seconds),
+        )
+    )
+    session.commit()
+    return list(
+        session.scalars(
+            select(BookEnrichmentJobDTO)
+            .where(BookEnrichmentJobDTO.claimed_by == claim_id)
+            .order_by(BookEnrichmentJobDTO.available_at, BookEnrichmentJobDTO.isbn13)
+        )
+    )
+
+
+def complete_enrichment_jobs(session: Session, claim_id: str, isbn13s: list[str]) -> None:
+    session.execute(
+        delete(BookEnrichmentJobDTO).where(
+            BookEnrichmentJobDTO.claimed_by == claim_id, BookEnrichmentJobDTO.isbn13.in_(isbn13s)
+        )
+    )
+    session.commit()
+
+
+def retry_enrichment_jobs(
+    session: Session,
+    claim_id: str,
+    isbn13s: list[str],
+    error: str,
+    max_attempts: int,
+    base_delay_seconds: float,
+    max_delay_seconds: float,
+) -> None:
+    now = datetime.now(timezone.utc)
+    jobs = session.scalars(
+        select(BookEnrichmentJobDTO).where(
+            BookEnrichmentJobDTO.claimed_by == claim_id, BookEnrichmentJobDTO.isbn13.in_(isbn13s)
+        )
+    )
+    for job in jobs:
+        job.claimed_by = None
+        job.last_error = error[:1000]
+        if job.attempts >= max_attempts:
+            job.status = ENRICHMENT_JOB_FAILED
+            # For failed rows available_at is when a later enqueue may retry them.
+            job.available_at = now + ENRICHMENT_JOB_FAILED_COOLDOWN
+        else:
+            delay_seconds = min(max_delay_seconds, base_delay_seconds * 2 ** (job.attempts - 1))
+            job.available_at = now + timedelta(seconds=delay_seconds)
+    session.commit()
+
+
+def count_enrichment_jobs(session: Session) -> dict[str, int]:
+    rows = session.execute(
+        select(BookEnrichmentJobDTO.status, func.count()).group_by(BookEnrichmentJobDTO.status)
+    ).all()
+    return {status: count for status, count in rows}
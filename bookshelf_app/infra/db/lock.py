@@ -0,0 +1,43 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import DateTime, String, delete, insert, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from bookshelf_app.infra.db.database import Base
+
+
+class LockDTO(Base):
+    __tablename__ = "app_lock"
+    __table_args__ = {"comment": "プロセス間ロック"}
+
+    name: Mapped[str] = mapped_column(String(length=100), primary_key=True, comment="ロック名")
+    owner: Mapped[str] = mapped_column(String(length=100), nullable=False, comment="保持者")
+    locked_until: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="有効期限")
+
+
+def try_acquire_lock(session: Session, name: str, owner: str, ttl_seconds: float) -> bool:
+    now = datetime.now(timezone.utc)
+    locked_until = now + timedelta(seconds=ttl_seconds)
+    # Take over an expired lock (or extend our own) with one conditional UPDATE.
+    result = session.execute(
+        update(LockDTO)
+        .where(LockDTO.name == name, or_(LockDTO.locked_until < now, LockDTO.owner == owner))
+        .values(owner=owner, locked_until=locked_until)
+    )
+    if result.rowcount == 1:
+        session.commit()
+        return True
+
+    try:
+        session.execute(insert(LockDTO).values(name=name, owner=owner, locked_until=locked_until, is_deleted=False))
+        session.commit()
+        return True
+    except IntegrityError:
+        session.rollback()
+        return False
+
+
+def release_lock(session: Session, name: str, owner: str) -> None:
+    session.execute(delete(LockDTO).where(LockDTO.name == name, LockDTO.owner == owner))
+    session.commit()
@@ -9,6 +9,10 @@ import bookshelf_app.infra.db.tags  # noqa: F401 # pylint: disable=W0611
 import bookshelf_app.infra.db.books  # noqa: F401 # pylint: disable=W0611
 import bookshelf_app.infra.db.reviews  # noqa: F401　# pylint: disable=W0611
 import bookshelf_app.infra.db.book_search  # noqa: F401 # pylint: disable=W0611
+import bookshelf_app.infra.db.lock  # noqa: F401 # pylint: disable=W0611
+import bookshelf_app.infra.db.enrichment_job  # noqa: F401 # pylint: disable=W0611
+import bookshelf_app.infra.db.warmup_checkpoint  # noqa: F401 # pylint: disable=W0611
+import bookshelf_app.infra.db.provider_response_cache  # noqa: F401 # pylint: disable=W0611
 from bookshelf_app.infra.db.database import Base
 from bookshelf_app.config import get_settings
 
@@ -0,0 +1,39 @@
+"""09_add_publisher_catalog_validators
+
+Revision ID: 1a0540918639
+Revises: 561eff63d279
+Create Date: 2026-07-08 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "1a0540918639"
+down_revision: Union[str, None] = "561eff63d279"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 条件付き GET 用の検証子。既存のカタログは次回の再取得で埋まる。
+    op.add_column(
+        "publisher_catalog_cache",
+        sa.Column("http_etag", sa.String(length=500), nullable=True, comment="ETag"),
+    )
+    op.add_column(
+        "publisher_catalog_cache",
+        sa.Column("http_last_modified", sa.String(length=100), nullable=True, comment="Last-Modified"),
+    )
+    op.add_column(
+        "publisher_catalog_cache",
+        sa.Column("content_hash", sa.String(length=64), nullable=True, comment="取得内容のハッシュ"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("publisher_catalog_cache", "content_hash")
+    op.drop_column("publisher_catalog_cache", "http_last_modified")
+    op.drop_column("publisher_catalog_cache", "http_etag")
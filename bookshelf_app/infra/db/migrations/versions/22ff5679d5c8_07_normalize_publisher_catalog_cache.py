@@ -0,0 +1,142 @@
+"""07_normalize_publisher_catalog_cache
+
+Revision ID: 22ff5679d5c8
+Revises: 6e3b84f87db1
+Create Date: 2026-07-02 00:00:00.000000
+
+"""
+from datetime import date
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "22ff5679d5c8"
+down_revision: Union[str, None] = "6e3b84f87db1"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TITLE_MAX_LENGTH = 500
+
+catalog_cache = sa.table(
+    "publisher_catalog_cache",
+    sa.column("source_key", sa.String),
+    sa.column("payload_json", sa.UnicodeText),
+)
+
+
+def upgrade() -> None:
+    catalog_book = op.create_table(
+        "publisher_catalog_book",
+        sa.Column("source_key", sa.String(length=100), nullable=False, comment="取得元キー"),
+        sa.Column("isbn13", sa.String(length=13), nullable=False, comment="ISBN13"),
+        sa.Column("position", sa.Integer(), nullable=False, comment="カタログ内の掲載順"),
+        sa.Column("title", sa.Unicode(length=500), nullable=False, comment="タイトル"),
+        sa.Column("published_at", sa.Date(), nullable=False, comment="発行日"),
+        sa.Column("price", sa.Unicode(length=100), nullable=True, comment="価格"),
+        sa.Column("source_url", sa.UnicodeText(), nullable=True, comment="取得元URL"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_modified", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.ForeignKeyConstraint(["source_key"], ["publisher_catalog_cache.source_key"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("source_key", "isbn13"),
+        comment="出版社カタログ書籍",
+    )
+    op.create_index(
+        "ix_publisher_catalog_book_source_key_published_at",
+        "publisher_catalog_book",
+        ["source_key", "published_at"],
+        unique=False,
+    )
+    op.create_index(op.f("ix_publisher_catalog_book_is_deleted"), "publisher_catalog_book", ["is_deleted"], unique=False)
+
+    connection = op.get_bind()
+    caches = connection.execute(sa.select(catalog_cache.c.source_key, catalog_cache.c.payload_json)).all()
+    for source_key, payload_json in caches:
+        rows = _convert_payload(source_key, payload_json)
+        if rows:
+            op.bulk_insert(catalog_book, rows)
+
+    op.drop_column("publisher_catalog_cache", "payload_json")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "publisher_catalog_cache",
+        sa.Column("payload_json", sa.UnicodeText(), nullable=True, comment="カタログJSON"),
+    )
+
+    catalog_book = sa.table(
+        "publisher_catalog_book",
+        sa.column("source_key", sa.String),
+        sa.column("isbn13", sa.String),
+        sa.column("position", sa.Integer),
+        sa.column("title", sa.Unicode),
+        sa.column("published_at", sa.Date),
+        sa.column("price", sa.Unicode),
+        sa.column("source_url", sa.UnicodeText),
+    )
+    connection = op.get_bind()
+    books_by_source: dict[str, list[dict]] = {}
+    for source_key in connection.execute(sa.select(catalog_cache.c.source_key)).scalars():
+        books_by_source[source_key] = []
+    rows = connection.execute(
+        sa.select(catalog_book).order_by(catalog_book.c.source_key, catalog_book.c.position)
+    ).mappings()
+    for row in rows:
+        books_by_source.setdefault(row["source_key"], []).append(
+            {
+                "isbn13": row["isbn13"],
+                "title": row["title"],
+                "published_at": row["published_at"].isoformat(),
+                "price": row["price"],
+                "source_url": row["source_url"],
+            }
+        )
+    for source_key, books in books_by_source.items():
+        connection.execute(
+            catalog_cache.update()
+            .where(catalog_cache.c.source_key == source_key)
+            .values(payload_json=json.dumps({"books": books}, ensure_ascii=False))
+        )
+
+    op.alter_column("publisher_catalog_cache", "payload_json", existing_type=sa.UnicodeText(), nullable=False)
+    op.drop_index(op.f("ix_publisher_catalog_book_is_deleted"), table_name="publisher_catalog_book")
+    op.drop_index("ix_publisher_catalog_book_source_key_published_at", table_name="publisher_catalog_book")
+    op.drop_table("publisher_catalog_book")
+
+
+def _convert_payload(source_key: str, payload_json: str | None) -> list[dict]:
+    try:
+        payload = json.loads(payload_json or "{}")
+    except json.JSONDecodeError:
+        return []
+
+    rows: list[dict] = []
+    seen: set[str] = set()
+    for item in payload.get("books", []):
+        if not isinstance(item, dict) or not item.get("isbn13") or not item.get("title"):
+            continue
+        isbn13 = item["isbn13"].replace("-", "").strip()
+        if isbn13 in seen:
+            continue
+        try:
+            published_at = date.fromisoformat(item.get("published_at") or "")
+        except ValueError:
+            published_at = date(1970, 1, 1)
+        seen.add(isbn13)
+        rows.append(
+            {
+                "source_key": source_key,
+                "isbn13": isbn13,
+                "position": len(rows),
+                "title": item["title"][:TITLE_MAX_LENGTH],
+                "published_at": published_at,
+                "price": item.get("price"),
+                "source_url": item.get("source_url"),
+                "is_deleted": False,
+            }
+        )
+    return rows
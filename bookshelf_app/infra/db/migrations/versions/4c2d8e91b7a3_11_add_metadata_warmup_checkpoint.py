@@ -0,0 +1,49 @@
+"""11_add_metadata_warmup_checkpoint
+
+Revision ID: 4c2d8e91b7a3
+Revises: 70509f35e38a
+Create Date: 2026-07-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "4c2d8e91b7a3"
+down_revision: Union[str, None] = "70509f35e38a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "metadata_warmup_checkpoint",
+        sa.Column("run_id", sa.String(length=100), nullable=False, comment="実行ID"),
+        sa.Column("publisher_id", sa.String(length=100), nullable=False, comment="出版社ID"),
+        sa.Column(
+            "refresh_before",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            comment="この日時より前に取得したキャッシュを再取得する",
+        ),
+        sa.Column("last_isbn13", sa.String(length=13), nullable=True, comment="処理済みの最後のISBN13"),
+        sa.Column("candidate_count", sa.Integer(), nullable=False, comment="対象件数"),
+        sa.Column("processed_count", sa.Integer(), nullable=False, comment="処理済み件数"),
+        sa.Column("refreshed_count", sa.Integer(), nullable=False, comment="補完件数"),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True, comment="完了日時"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_modified", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("run_id", "publisher_id"),
+        comment="メタデータキャッシュ一括補完の進捗",
+    )
+    op.create_index(
+        op.f("ix_metadata_warmup_checkpoint_is_deleted"), "metadata_warmup_checkpoint", ["is_deleted"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_metadata_warmup_checkpoint_is_deleted"), table_name="metadata_warmup_checkpoint")
+    op.drop_table("metadata_warmup_checkpoint")
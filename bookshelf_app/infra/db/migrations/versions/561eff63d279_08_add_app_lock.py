@@ -0,0 +1,37 @@
+"""08_add_app_lock
+
+Revision ID: 561eff63d279
+Revises: 22ff5679d5c8
+Create Date: 2026-07-06 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "561eff63d279"
+down_revision: Union[str, None] = "22ff5679d5c8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "app_lock",
+        sa.Column("name", sa.String(length=100), nullable=False, comment="ロック名"),
+        sa.Column("owner", sa.String(length=100), nullable=False, comment="保持者"),
+        sa.Column("locked_until", sa.DateTime(timezone=True), nullable=False, comment="有効期限"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_modified", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+        comment="プロセス間ロック",
+    )
+    op.create_index(op.f("ix_app_lock_is_deleted"), "app_lock", ["is_deleted"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_app_lock_is_deleted"), table_name="app_lock")
+    op.drop_table("app_lock")
@@ -0,0 +1,49 @@
+"""10_add_book_enrichment_job
+
+Revision ID: 70509f35e38a
+Revises: 1a0540918639
+Create Date: 2026-07-10 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "70509f35e38a"
+down_revision: Union[str, None] = "1a0540918639"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "book_enrichment_job",
+        sa.Column("isbn13", sa.String(length=13), nullable=False, comment="ISBN13"),
+        sa.Column("publisher_name", sa.Unicode(length=200), nullable=False, comment="出版社名"),
+        sa.Column("title", sa.Unicode(length=500), nullable=False, comment="カタログ上のタイトル"),
+        sa.Column("published_at", sa.Date(), nullable=False, comment="カタログ上の発行日"),
+        sa.Column("price", sa.Unicode(length=100), nullable=True, comment="価格"),
+        sa.Column("source_url", sa.UnicodeText(), nullable=True, comment="取得元URL"),
+        sa.Column("status", sa.String(length=20), nullable=False, comment="状態"),
+        sa.Column("attempts", sa.Integer(), nullable=False, comment="試行回数"),
+        sa.Column("available_at", sa.DateTime(timezone=True), nullable=False, comment="次に取り出せる日時"),
+        sa.Column("claimed_by", sa.String(length=100), nullable=True, comment="取り出したワーカー"),
+        sa.Column("last_error", sa.UnicodeText(), nullable=True, comment="最後のエラー"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_modified", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("isbn13"),
+        comment="書籍メタデータ補完ジョブ",
+    )
+    op.create_index(
+        op.f("ix_book_enrichment_job_available_at"), "book_enrichment_job", ["available_at"], unique=False
+    )
+    op.create_index(op.f("ix_book_enrichment_job_is_deleted"), "book_enrichment_job", ["is_deleted"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_book_enrichment_job_is_deleted"), table_name="book_enrichment_job")
+    op.drop_index(op.f("ix_book_enrichment_job_available_at"), table_name="book_enrichment_job")
+    op.drop_table("book_enrichment_job")
@@ -0,0 +1,36 @@
+"""12_add_book_metadata_cache_status
+
+Revision ID: b83e5f2a6c19
+Revises: 4c2d8e91b7a3
+Create Date: 2026-07-24 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "b83e5f2a6c19"
+down_revision: Union[str, None] = "4c2d8e91b7a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 既存の行はすべて取得済みのメタデータ。
+    op.add_column(
+        "book_metadata_cache",
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            nullable=False,
+            server_default="found",
+            comment="found: 取得済み, not_found: どの取得元にも無い",
+        ),
+    )
+
+
+def downgrade() -> None:
+    # SQL Server は名前の無い既定値制約があると列を削除できないため、先に制約を削除する。
+    op.drop_column("book_metadata_cache", "status", mssql_drop_default=True)
@@ -0,0 +1,46 @@
+"""13_add_provider_response_cache
+
+Revision ID: d41f7a9c3e52
+Revises: b83e5f2a6c19
+Create Date: 2026-07-31 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "d41f7a9c3e52"
+down_revision: Union[str, None] = "b83e5f2a6c19"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "provider_response_cache",
+        sa.Column("cache_key", sa.String(length=64), nullable=False, comment="取得元と正規化したリクエストのハッシュ"),
+        sa.Column("provider", sa.String(length=100), nullable=False, comment="取得元"),
+        sa.Column("request_key", sa.UnicodeText(), nullable=False, comment="正規化したリクエスト"),
+        sa.Column("payload", sa.LargeBinary(), nullable=False, comment="zlib で圧縮した応答JSON"),
+        sa.Column("fetched_at", sa.DateTime(timezone=True), nullable=False, comment="取得日時"),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False, comment="期限日時"),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_modified", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("is_deleted", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("cache_key"),
+        comment="外部APIの応答キャッシュ",
+    )
+    op.create_index(
+        op.f("ix_provider_response_cache_expires_at"), "provider_response_cache", ["expires_at"], unique=False
+    )
+    op.create_index(
+        op.f("ix_provider_response_cache_is_deleted"), "provider_response_cache", ["is_deleted"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_provider_response_cache_is_deleted"), table_name="provider_response_cache")
+    op.drop_index(op.f("ix_provider_response_cache_expires_at"), table_name="provider_response_cache")
+    op.drop_table("provider_response_cache")
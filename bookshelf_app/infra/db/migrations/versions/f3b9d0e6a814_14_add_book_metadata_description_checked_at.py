@@ -0,0 +1,33 @@
+"""14_add_book_metadata_description_checked_at
+
+Revision ID: f3b9d0e6a814
+Revises: d41f7a9c3e52
+Create Date: 2026-08-07 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "f3b9d0e6a814"
+down_revision: Union[str, None] = "d41f7a9c3e52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "book_metadata_cache",
+        sa.Column(
+            "description_checked_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            comment="どの取得元にも概要が無いと確認した日時",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("book_metadata_cache", "description_checked_at")
@@ -0,0 +1,43 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, LargeBinary, String, UnicodeText, delete, select
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from bookshelf_app.infra.db.database import Base
+from bookshelf_app.infra.db.upsert import UPSERT_BATCH_SIZE, upsert_rows
+
+
+class ProviderResponseCacheDTO(Base):
+    __tablename__ = "provider_response_cache"
+    __table_args__ = {"comment": "外部APIの応答キャッシュ"}
+
+    cache_key: Mapped[str] = mapped_column(
+        String(length=64), primary_key=True, comment="取得元と正規化したリクエストのハッシュ"
+    )
+    provider: Mapped[str] = mapped_column(String(length=100), nullable=False, comment="取得元")
+    request_key: Mapped[str] = mapped_column(UnicodeText, nullable=False, comment="正規化したリクエスト")
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False, comment="zlib で圧縮した応答JSON")
+    fetched_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, comment="取得日時")
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True, comment="期限日時")
+
+
+def load_provider_response(session: Session, cache_key: str, now: datetime) -> ProviderResponseCacheDTO | None:
+    return session.scalars(
+        select(ProviderResponseCacheDTO).where(
+            ProviderResponseCacheDTO.cache_key == cache_key,
+            ProviderResponseCacheDTO.expires_at > now,
+        )
+    ).first()
+
+
+def upsert_provider_responses(session: Session, rows: list[dict], batch_size: int = UPSERT_BATCH_SIZE) -> None:
+    upsert_rows(session, ProviderResponseCacheDTO.__table__, rows, ["cache_key"], batch_size)
+
+
+def delete_provider_responses(session: Session, expired_before: datetime | None = None) -> int:
+    statement = delete(ProviderResponseCacheDTO)
+    if expired_before is not None:
+        statement = statement.where(ProviderResponseCacheDTO.expires_at <= expired_before)
+    result = session.execute(statement)
+    session.commit()
+    return result.rowcount
@@ -0,0 +1,110 @@
+from sqlalchemy import Table, TextClause, bindparam, func, select, text, tuple_, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import Insert
+
+UPSERT_BATCH_SIZE = 100
+# SQL Server rejects statements with more than 2100 parameters.
+MSSQL_MAX_PARAMETERS = 2000
+
+
+def upsert_rows(
+    session: Session,
+    table: Table,
+    rows: list[dict],
+    key_columns: list[str],
+    batch_size: int = UPSERT_BATCH_SIZE,
+) -> None:
+    rows = unique_rows(rows, key_columns)
+    if not rows:
+        return
+
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name == "mssql":
+        batch_size = min(batch_size, MSSQL_MAX_PARAMETERS // len(rows[0]))
+    batch_size = max(1, batch_size)
+
+    for start in range(0, len(rows), batch_size):
+        batch = rows[start : start + batch_size]
+        if dialect_name == "postgresql":
+            session.execute(build_postgresql_upsert(table, batch, key_columns))
+        elif dialect_name == "mssql":
+            session.execute(build_mssql_merge(table, batch, key_columns))
+        else:
+            _upsert_rows_generic(session, table, batch, key_columns)
+
+
+def unique_rows(rows: list[dict], key_columns: list[str]) -> list[dict]:
+    # A single INSERT ... ON CONFLICT / MERGE cannot touch the same row twice, so the last value wins.
+    unique: dict[tuple, dict] = {}
+    for row in rows:
+        unique[tuple(row[column] for column in key_columns)] = row
+    return list(unique.values())
+
+
+def build_postgresql_upsert(table: Table, rows: list[dict], key_columns: list[str]) -> Insert:
+    stmt = postgresql.insert(table).values(rows)
+    update_columns = {
+        column: stmt.excluded[column] for column in rows[0] if column not in key_columns
+    }
+    if "last_modified" in table.c and "last_modified" not in update_columns:
+        update_columns["last_modified"] = func.now()
+    return stmt.on_conflict_do_update(index_elements=key_columns, set_=update_columns)
+
+
+def build_mssql_merge(table: Table, rows: list[dict], key_columns: list[str]) -> TextClause:
+    columns = list(rows[0])
+    update_columns = [column for column in columns if column not in key_columns]
+    values = ", ".join(
+        "(" + ", ".join(f":{column}_{index}" for column in columns) + ")" for index in range(len(rows))
+    )
+    on = " AND ".join(f"target.{column} = source.{column}" for column in key_columns)
+    update_set = [f"target.{column} = source.{column}" for column in update_columns]
+    if "last_modified" in table.c and "last_modified" not in update_columns:
+        update_set.append("target.last_modified = SYSDATETIMEOFFSET()")
+    source_columns = ", ".join(columns)
+
+    sql = (
+        f"MERGE INTO {table.name} WITH (HOLDLOCK) AS target "
+        f"USING (VALUES {values}) AS source ({source_columns}) "
+        f"ON {on} "
+        f"WHEN MATCHED THEN UPDATE SET {', '.join(update_set)} "
+        f"WHEN NOT MATCHED THEN INSERT ({source_columns}) "
+        f"VALUES ({', '.join(f'source.{column}' for column in columns)});"
+    )
+    params = [
+        bindparam(f"{column}_{index}", value=row[column], type_=table.c[column].type)
+        for index, row in enumerate(rows)
+        for column in columns
+    ]
+    return text(sql).bindparams(*params)
+
+
+def _upsert_rows_generic(session: Session, table: Table, rows: list[dict], key_columns: list[str]) -> None:
+    key_expression = tuple_(*(table.c[column] for column in key_columns))
+    keys = [tuple(row[column] for column in key_columns) for row in rows]
+    existing = {
+        tuple(row)
+        for row in session.execute(select(*(table.c[column] for column in key_columns)).where(key_expression.in_(keys)))
+    }
+
+    new_rows = [row for row, key in zip(rows, keys) if key not in existing]
+    if new_rows:
+        session.execute(table.insert(), new_rows)
+
+    updated_rows = [row for row, key in zip(rows, keys) if key in existing]
+    if updated_rows:
+        where = [table.c[column] == bindparam(f"key_{column}") for column in key_columns]
+        stmt = update(table).where(*where).values(
+            {column: bindparam(f"value_{column}") for column in updated_rows[0] if column not in key_columns}
+        )
+        session.execute(
+            stmt,
+            [
+                {
+                    **{f"key_{column}": row[column] for column in key_columns},
+                    **{f"value_{column}": value for column, value in row.items() if column not in key_columns},
+                }
+                for row in updated_rows
+            ],
+        )
@@ -0,0 +1,66 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from bookshelf_app.infra.db.database import Base
+
+
+class MetadataWarmupCheckpointDTO(Base):
+    __tablename__ = "metadata_warmup_checkpoint"
+    __table_args__ = {"comment": "メタデータキャッシュ一括補完の進捗"}
+
+    run_id: Mapped[str] = mapped_column(String(length=100), primary_key=True, comment="実行ID")
+    publisher_id: Mapped[str] = mapped_column(String(length=100), primary_key=True, comment="出版社ID")
+    refresh_before: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, comment="この日時より前に取得したキャッシュを再取得する"
+    )
+    last_isbn13: Mapped[str | None] = mapped_column(String(length=13), nullable=True, comment="処理済みの最後のISBN13")
+    candidate_count: Mapped[int] = mapped_column(Integer, nullable=False, comment="対象件数")
+    processed_count: Mapped[int] = mapped_column(Integer, nullable=False, comment="処理済み件数")
+    refreshed_count: Mapped[int] = mapped_column(Integer, nullable=False, comment="補完件数")
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True, comment="完了日時")
+
+
+def load_warmup_checkpoint(session: Session, run_id: str, publisher_id: str) -> MetadataWarmupCheckpointDTO | None:
+    return session.scalars(
+        select(MetadataWarmupCheckpointDTO).where(
+            MetadataWarmupCheckpointDTO.run_id == run_id,
+            MetadataWarmupCheckpointDTO.publisher_id == publisher_id,
+        )
+    ).first()
+
+
+def save_warmup_checkpoint(session: Session, run_id: str, publisher_id: str, values: dict) -> None:
+    statement = (
+        update(MetadataWarmupCheckpointDTO)
+        .where(
+            MetadataWarmupCheckpointDTO.run_id == run_id,
+            MetadataWarmupCheckpointDTO.publisher_id == publisher_id,
+        )
+        .values(**values)
+    )
+    if session.execute(statement).rowcount == 0:
+        try:
+            session.execute(
+                insert(MetadataWarmupCheckpointDTO).values(
+                    run_id=run_id, publisher_id=publisher_id, is_deleted=False, **values
+                )
+            )
+        except IntegrityError:
+            # The same run was resumed elsewhere and saved first; overwrite it with our progress.
+            session.rollback()
+            session.execute(statement)
+    session.commit()
+
+
+def delete_warmup_checkpoints(session: Session, run_id: str | None = None, before: datetime | None = None) -> int:
+    statement = delete(MetadataWarmupCheckpointDTO)
+    if run_id is not None:
+        statement = statement.where(MetadataWarmupCheckpointDTO.run_id == run_id)
+    if before is not None:
+        statement = statement.where(MetadataWarmupCheckpointDTO.last_modified < before)
+    result = session.execute(statement)
+    session.commit()
+    return result.rowcount
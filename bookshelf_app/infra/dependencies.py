@@ -1,11 +1,17 @@
+from functools import lru_cache
+
 from fastapi import Depends
 from sqlalchemy.orm import Session
 
 from bookshelf_app.api.auth.service import AuthService, TokenUserAppModel, oauth2_scheme
+from bookshelf_app.api.book_search.enrichment_worker import BookEnrichmentWorker
+from bookshelf_app.api.book_search.scheduler import MetadataWarmupScheduler
+from bookshelf_app.api.book_search.service import BookSearchService
 from bookshelf_app.api.book_with_reviews.service import BookWithReviewsService
 from bookshelf_app.api.books.service import BookService
 from bookshelf_app.api.reviews.service import BookReviewService
 from bookshelf_app.api.tags.service import TagService
+from bookshelf_app.config import get_settings
 from bookshelf_app.infra.db.auth import SqlUserRepository
 from bookshelf_app.infra.db.book_with_reviews import SqlBookWithQueryService
 from bookshelf_app.infra.db.books import SqlBookRepository
@@ -35,6 +41,60 @@ def get_book_with_review_service(session: Session = Depends(get_session)) -> Boo
     return BookWithReviewsService(SqlBookWithQueryService(session), SqlUserRepository(session))
 
 
+@lru_cache()
+def get_book_search_service() -> BookSearchService:
+    # Shared by all requests so HTTP pools, in-memory caches and rate limiters survive between them.
+    return BookSearchService()
+
+
+def close_book_search_service() -> None:
+    if get_book_search_service.cache_info().currsize:
+        get_book_search_service().close()
+        get_book_search_service.cache_clear()
+
+
+@lru_cache()
+def get_metadata_warmup_scheduler() -> MetadataWarmupScheduler:
+    settings = get_settings()
+    return MetadataWarmupScheduler(
+        get_book_search_service(),
+        interval_seconds=settings.metadata_warmup_interval_seconds,
+        refresh_after_days=settings.metadata_warmup_refresh_after_days,
+        batch_size=settings.metadata_warmup_batch_size,
+        initial_delay_seconds=settings.metadata_warmup_initial_delay_seconds,
+    )
+
+
+def start_metadata_warmup_scheduler() -> None:
+    if get_settings().metadata_warmup_enabled:
+        get_metadata_warmup_scheduler().start()
+
+
+def close_metadata_warmup_scheduler() -> None:
+    if get_metadata_warmup_scheduler.cache_info().currsize:
+        get_metadata_warmup_scheduler().stop()
+        get_metadata_warmup_scheduler.cache_clear()
+
+
+@lru_cache()
+def get_book_enrichment_worker() -> BookEnrichmentWorker:
+    return BookEnrichmentWorker(
+        get_book_search_service(),
+        poll_interval_seconds=get_settings().book_enrichment_worker_poll_seconds,
+    )
+
+
+def start_book_enrichment_worker() -> None:
+    if get_settings().book_enrichment_queue_enabled:
+        get_book_enrichment_worker().start()
+
+
+def close_book_enrichment_worker() -> None:
+    if get_book_enrichment_worker.cache_info().currsize:
+        get_book_enrichment_worker().stop()
+        get_book_enrichment_worker.cache_clear()
+
+
 def get_admin_dependency(
     session: Session = Depends(get_session), token: str = Depends(oauth2_scheme)
 ) -> TokenUserAppModel:
@@ -0,0 +1,351 @@
+import codecs
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+import gzip
+import http.client
+import json
+import queue
+import threading
+from typing import Iterator
+from urllib.parse import urlencode, urlsplit
+import zlib
+
+from bookshelf_app.config import get_settings
+
+USER_AGENT = "bookshelf-app"
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def text(self, encoding: str = "utf-8") -> str:
+        return self.body.decode(encoding)
+
+    def json(self):
+        return json.loads(self.text())
+
+
+class HttpStatusError(Exception):
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+
+    def __init__(self, url: str, status: int, headers: dict[str, str], body: bytes, *args, **kwargs):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+
+        msg = f"HTTP request failed. status:{status}, url:{url}"
+
+        super().__init__(msg, *args, **kwargs)
+
+    def retry_after_seconds(self) -> float | None:
+        return parse_retry_after(self.headers.get("retry-after"))
+
+
+class HttpStream:
+    # Holds the pool slot and connection until closed; only a fully read stream returns its connection to the pool.
+    def __init__(
+        self,
+        pool: "_HostPool",
+        connection: http.client.HTTPConnection,
+        response: http.client.HTTPResponse,
+    ):
+        self.status = response.status
+        self.headers = {key.lower(): value for key, value in response.getheaders()}
+        self._pool = pool
+        self._connection = connection
+        self._response = response
+        self._decompressor = (
+            zlib.decompressobj(16 + zlib.MAX_WBITS)
+            if self.headers.get("content-encoding", "").lower() == "gzip"
+            else None
+        )
+        self._exhausted = False
+        self._closed = False
+
+    def __enter__(self) -> "HttpStream":
+        return self
+
+    def __exit__(self, *_exc_info) -> None:
+        self.close()
+
+    def iter_bytes(self, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        while chunk := self._response.read(chunk_size):
+            if self._decompressor is not None:
+                chunk = self._decompressor.decompress(chunk)
+            if chunk:
+                yield chunk
+        if self._decompressor is not None and (tail := self._decompressor.flush()):
+            yield tail
+        self._exhausted = True
+
+    def iter_text(self, encoding: str = "utf-8", chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        for chunk in self.iter_bytes(chunk_size):
+            if text := decoder.decode(chunk):
+                yield text
+        if text := decoder.decode(b"", final=True):
+            yield text
+
+    def read(self) -> bytes:
+        return b"".join(self.iter_bytes())
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._exhausted and not self._response.will_close:
+            self._pool.release(self._connection)
+        else:
+            self._connection.close()
+        self._pool.release_slot()
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class _TimeoutConnectionMixin:
+    # http.client has one timeout for both phases; connect with a short one and read with another.
+    connect_timeout_seconds: float
+    read_timeout_seconds: float
+
+    def connect(self):
+        self.timeout = self.connect_timeout_seconds
+        super().connect()
+        self.sock.settimeout(self.read_timeout_seconds)
+
+
+class _HttpConnection(_TimeoutConnectionMixin, http.client.HTTPConnection):
+    pass
+
+
+class _HttpsConnection(_TimeoutConnectionMixin, http.client.HTTPSConnection):
+    pass
+
+
+class _HostPool:
+    def __init__(self, scheme: str, host: str, port: int | None, max_connections: int):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(max_connections)
+
+    @contextmanager
+    def slot(self):
+        with self._slots:
+            yield
+
+    def acquire_slot(self) -> None:
+        self._slots.acquire()
+
+    def release_slot(self) -> None:
+        self._slots.release()
+
+    def acquire_idle(self) -> http.client.HTTPConnection | None:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return None
+
+    def release(self, connection: http.client.HTTPConnection) -> None:
+        self._idle.put(connection)
+
+    def close(self) -> None:
+        while (connection := self.acquire_idle()) is not None:
+            connection.close()
+
+
+class HttpClient:
+    _pools: dict[tuple[str, str, int | None], _HostPool]
+
+    def __init__(
+        self,
+        connect_timeout_seconds: float = 5.0,
+        read_timeout_seconds: float = 10.0,
+        max_connections_per_host: int = 8,
+        user_agent: str = USER_AGENT,
+    ):
+        self.connect_timeout_seconds = connect_timeout_seconds
+        self.read_timeout_seconds = read_timeout_seconds
+        self.max_connections_per_host = max(1, max_connections_per_host)
+        self.user_agent = user_agent
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+        return self.request("GET", url, headers=headers)
+
+    def post_form(
+        self,
+        url: str,
+        data: dict[str, str],
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        return self.request(
+            "POST",
+            url,
+            body=urlencode(data).encode("ascii"),
+            headers={"Content-Type": "application/x-www-form-urlencoded", **(headers or {})},
+        )
+
+    def stream(
+        self,
+        url: str,
+        params: dict[str, str] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> HttpStream:
+        if params:
+            url = f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+        pool, path, request_headers = self._prepare(url, headers)
+
+        pool.acquire_slot()
+        try:
+            connection, response, _payload = self._send(pool, "GET", path, None, request_headers, read_body=False)
+        except BaseException:
+            pool.release_slot()
+            raise
+
+        stream = HttpStream(pool, connection, response)
+        if stream.status >= 400:
+            with stream:
+                raise HttpStatusError(url, stream.status, stream.headers, stream.read())
+        return stream
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> HttpResponse:
+        pool, path, request_headers = self._prepare(url, headers)
+
+        with pool.slot():
+            connection, response, payload = self._send(pool, method, path, body, request_headers, read_body=True)
+            if response.will_close:
+                connection.close()
+            else:
+                pool.release(connection)
+
+        response_headers = {key.lower(): value for key, value in response.getheaders()}
+        if response_headers.get("content-encoding", "").lower() == "gzip":
+            payload = gzip.decompress(payload)
+
+        if response.status >= 400:
+            raise HttpStatusError(url, response.status, response_headers, payload)
+        return HttpResponse(response.status, response_headers, payload)
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools = {}
+        for pool in pools:
+            pool.close()
+
+    def _prepare(self, url: str, headers: dict[str, str] | None) -> tuple[_HostPool, str, dict[str, str]]:
+        parts = urlsplit(url)
+        if parts.scheme not in {"http", "https"} or not parts.hostname:
+            raise ValueError(f"unsupported url: {url}")
+
+        pool = self._get_pool(parts.scheme, parts.hostname, parts.port)
+        path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        request_headers = {
+            "User-Agent": self.user_agent,
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+            **(headers or {}),
+        }
+        return pool, path, request_headers
+
+    def _send(
+        self,
+        pool: _HostPool,
+        method: str,
+        path: str,
+        body: bytes | None,
+        headers: dict[str, str],
+        read_body: bool,
+    ) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse, bytes | None]:
+        connection = pool.acquire_idle()
+        reused = connection is not None
+        while True:
+            if connection is None:
+                connection = self._create_connection(pool)
+            try:
+                connection.request(method, path, body=body, headers=headers)
+                response = connection.getresponse()
+                payload = response.read() if read_body else None
+                return connection, response, payload
+            except (ConnectionError, http.client.BadStatusLine):
+                connection.close()
+                # A pooled connection may have been closed by the server while idle.
+                if not reused:
+                    raise
+                connection = None
+                reused = False
+            except BaseException:
+                connection.close()
+                raise
+
+    def _get_pool(self, scheme: str, host: str, port: int | None) -> _HostPool:
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(scheme, host, port, self.max_connections_per_host)
+                self._pools[key] = pool
+            return pool
+
+    def _create_connection(self, pool: _HostPool) -> http.client.HTTPConnection:
+        connection_class = _HttpsConnection if pool.scheme == "https" else _HttpConnection
+        connection = connection_class(pool.host, pool.port)
+        connection.connect_timeout_seconds = self.connect_timeout_seconds
+        connection.read_timeout_seconds = self.read_timeout_seconds
+        return connection
+
+
+@lru_cache()
+def get_http_client() -> HttpClient:
+    settings = get_settings()
+    return HttpClient(
+        connect_timeout_seconds=settings.http_connect_timeout_seconds,
+        read_timeout_seconds=settings.http_read_timeout_seconds,
+        max_connections_per_host=settings.http_max_connections_per_host,
+    )
+
+
+def close_http_client() -> None:
+    if get_http_client.cache_info().currsize:
+        get_http_client().close()
@@ -0,0 +1,59 @@
+from typing import Sequence
+
+MAX_GRAM_SIZE = 3
+
+
+def create_ngrams(value: str, size: int) -> set[str]:
+    return {value[start : start + size] for start in range(len(value) - size + 1)}
+
+
+class NgramIndex:
+    _postings: dict[str, list[int]]
+
+    def __init__(self, documents: Sequence[str], max_gram_size: int = MAX_GRAM_SIZE):
+        self.max_gram_size = max(1, max_gram_size)
+        self._documents = list(documents)
+        self._postings = {}
+        for document_id, document in enumerate(self._documents):
+            for size in range(1, self.max_gram_size + 1):
+                for gram in create_ngrams(document, size):
+                    self._postings.setdefault(gram, []).append(document_id)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def search(self, query: str) -> list[int]:
+        if not query:
+            return list(range(len(self._documents)))
+
+        size = min(len(query), self.max_gram_size)
+        postings = [self._postings.get(gram) for gram in create_ngrams(query, size)]
+        if any(posting is None for posting in postings):
+            return []
+
+        postings.sort(key=len)
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = intersect_sorted(candidates, posting)
+            if not candidates:
+                return []
+
+        if len(query) <= self.max_gram_size:
+            return list(candidates)
+        # Longer queries only share grams with a candidate; confirm they appear contiguously.
+        return [document_id for document_id in candidates if query in self._documents[document_id]]
+
+
+def intersect_sorted(left: list[int], right: list[int]) -> list[int]:
+    result: list[int] = []
+    left_index = right_index = 0
+    while left_index < len(left) and right_index < len(right):
+        if left[left_index] == right[right_index]:
+            result.append(left[left_index])
+            left_index += 1
+            right_index += 1
+        elif left[left_index] < right[right_index]:
+            left_index += 1
+        else:
+            right_index += 1
+    return result
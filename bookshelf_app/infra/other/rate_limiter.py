@@ -0,0 +1,133 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import threading
+import time
+from typing import Callable
+
+rate_limit_budget: ContextVar[str | None] = ContextVar("rate_limit_budget", default=None)
+
+
+@contextmanager
+def use_rate_limit_budget(budget: str):
+    token = rate_limit_budget.set(budget)
+    try:
+        yield
+    finally:
+        rate_limit_budget.reset(token)
+
+
+@dataclass(frozen=True)
+class TokenBucketStats:
+    rate_per_second: float
+    max_rate_per_second: float
+    tokens: float
+    acquired: int
+    rejected: int
+    throttled: int
+    waited_seconds: float
+
+
+class AdaptiveTokenBucket:
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int,
+        min_rate_per_second: float | None = None,
+        recovery_seconds: float = 60.0,
+        max_wait_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.max_rate_per_second = max(0.001, rate_per_second)
+        self.min_rate_per_second = min(
+            self.max_rate_per_second,
+            min_rate_per_second if min_rate_per_second is not None else self.max_rate_per_second / 10,
+        )
+        self.recovery_seconds = max(0.001, recovery_seconds)
+        self.max_wait_seconds = max_wait_seconds
+        self._capacity = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._rate = self.max_rate_per_second
+        self._tokens = float(self._capacity)
+        self._updated_at = clock()
+        self._acquired = 0
+        self._rejected = 0
+        self._throttled = 0
+        self._waited_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> bool:
+        deadline = None if self.max_wait_seconds is None else self._clock() + self.max_wait_seconds
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    self._acquired += 1
+                    return True
+                wait_seconds = (1 - self._tokens) / self._rate
+                if deadline is not None and self._clock() + wait_seconds > deadline:
+                    self._rejected += 1
+                    return False
+                self._waited_seconds += wait_seconds
+            self._sleep(wait_seconds)
+
+    def throttle(self, retry_after_seconds: float | None = None) -> None:
+        with self._lock:
+            self._refill()
+            self._rate = max(self.min_rate_per_second, self._rate / 2)
+            # A negative balance makes the next acquire wait out the server's Retry-After.
+            self._tokens = min(self._tokens, 0.0, 1 - (retry_after_seconds or 0.0) * self._rate)
+            self._throttled += 1
+
+    def stats(self) -> TokenBucketStats:
+        with self._lock:
+            self._refill()
+            return TokenBucketStats(
+                rate_per_second=self._rate,
+                max_rate_per_second=self.max_rate_per_second,
+                tokens=self._tokens,
+                acquired=self._acquired,
+                rejected=self._rejected,
+                throttled=self._throttled,
+                waited_seconds=self._waited_seconds,
+            )
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = max(0.0, now - self._updated_at)
+        self._updated_at = now
+        if self._rate < self.max_rate_per_second:
+            recovered = (self.max_rate_per_second - self.min_rate_per_second) * elapsed / self.recovery_seconds
+            self._rate = min(self.max_rate_per_second, self._rate + recovered)
+        self._tokens = min(float(self._capacity), self._tokens + elapsed * self._rate)
+
+
+class RateLimiter:
+    _buckets: dict[str, AdaptiveTokenBucket]
+
+    def __init__(self, buckets: dict[str, AdaptiveTokenBucket], default_budget: str):
+        if default_budget not in buckets:
+            raise ValueError(f"unknown default budget: {default_budget}")
+        self._buckets = buckets
+        self.default_budget = default_budget
+
+    def acquire(self, budget: str | None = None) -> bool:
+        return self._get_bucket(budget).acquire()
+
+    def throttle(self, retry_after_seconds: float | None = None) -> None:
+        # The upstream quota is shared, so a throttled response slows every budget down.
+        for bucket in self._buckets.values():
+            bucket.throttle(retry_after_seconds)
+
+    def stats(self) -> dict[str, TokenBucketStats]:
+        return {budget: bucket.stats() for budget, bucket in self._buckets.items()}
+
+    def _get_bucket(self, budget: str | None) -> AdaptiveTokenBucket:
+        name = budget or rate_limit_budget.get() or self.default_budget
+        bucket = self._buckets.get(name)
+        if bucket is None:
+            raise ValueError(f"unknown rate limit budget: {name}")
+        return bucket
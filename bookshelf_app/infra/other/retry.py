@@ -0,0 +1,112 @@
+from dataclasses import dataclass
+import random
+import threading
+import time
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    max_retries: int = 2
+    base_delay_seconds: float = 0.5
+    max_delay_seconds: float = 8.0
+    deadline_seconds: float = 10.0
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    calls: int
+    attempts: int
+    retries: int
+    successes: int
+    failures: int
+    waited_seconds: float
+
+
+@dataclass
+class _RetryCounters:
+    calls: int = 0
+    attempts: int = 0
+    retries: int = 0
+    successes: int = 0
+    failures: int = 0
+    waited_seconds: float = 0.0
+
+
+class Retrier:
+    _counters: dict[str, _RetryCounters]
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        is_retryable: Callable[[Exception], bool],
+        retry_after: Callable[[Exception], float | None] = lambda _error: None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        jitter: Callable[[float, float], float] = random.uniform,
+    ):
+        self.policy = policy
+        self._is_retryable = is_retryable
+        self._retry_after = retry_after
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def call(self, name: str, func: Callable[[], T]) -> T:
+        deadline = self._clock() + self.policy.deadline_seconds
+        self._count(name, calls=1)
+        retries = 0
+        while True:
+            self._count(name, attempts=1)
+            try:
+                result = func()
+            except Exception as error:
+                delay = self._next_delay(error, retries, deadline)
+                if delay is None:
+                    self._count(name, failures=1)
+                    raise
+                retries += 1
+                self._count(name, retries=1, waited_seconds=delay)
+                self._sleep(delay)
+                continue
+            self._count(name, successes=1)
+            return result
+
+    def stats(self) -> dict[str, RetryStats]:
+        with self._lock:
+            return {
+                name: RetryStats(
+                    calls=counters.calls,
+                    attempts=counters.attempts,
+                    retries=counters.retries,
+                    successes=counters.successes,
+                    failures=counters.failures,
+                    waited_seconds=counters.waited_seconds,
+                )
+                for name, counters in self._counters.items()
+            }
+
+    def _next_delay(self, error: Exception, retries: int, deadline: float) -> float | None:
+        if retries >= self.policy.max_retries or not self._is_retryable(error):
+            return None
+
+        # Full jitter keeps concurrent callers from retrying in lockstep.
+        backoff = min(self.policy.max_delay_seconds, self.policy.base_delay_seconds * 2**retries)
+        delay = self._jitter(0, backoff)
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            delay = max(0.0, retry_after) + self._jitter(0, self.policy.base_delay_seconds)
+
+        if self._clock() + delay > deadline:
+            return None
+        return delay
+
+    def _count(self, name: str, **increments) -> None:
+        with self._lock:
+            counters = self._counters.setdefault(name, _RetryCounters())
+            for field, value in increments.items():
+                setattr(counters, field, getattr(counters, field) + value)
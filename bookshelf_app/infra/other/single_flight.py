@@ -0,0 +1,69 @@
+from dataclasses import dataclass
+import threading
+from typing import Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    calls: int
+    executions: int
+    shared: int
+
+
+class _InFlightCall(Generic[V]):
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: V | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[K, V]):
+    _calls: dict[K, _InFlightCall[V]]
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._call_count = 0
+        self._execution_count = 0
+        self._shared_count = 0
+
+    def do(self, key: K, func: Callable[[], V]) -> V:
+        with self._lock:
+            self._call_count += 1
+            call = self._calls.get(key)
+            if call is not None:
+                self._shared_count += 1
+                leader = False
+            else:
+                call = _InFlightCall()
+                self._calls[key] = call
+                self._execution_count += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result  # type: ignore[return-value]
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self) -> SingleFlightStats:
+        with self._lock:
+            return SingleFlightStats(
+                calls=self._call_count,
+                executions=self._execution_count,
+                shared=self._shared_count,
+            )
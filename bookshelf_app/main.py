@@ -1,3 +1,5 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,10 +14,31 @@ from bookshelf_app.api.book_with_reviews import router as book_with_reviews
 from bookshelf_app.helper import serve_spa_app as spa
 from bookshelf_app.helper.custom_error_handler import handle_custom_error
 from bookshelf_app.helper.http_middleware import HttpRequestMiddleware
+from bookshelf_app.infra.dependencies import (
+    close_book_enrichment_worker,
+    close_book_search_service,
+    close_metadata_warmup_scheduler,
+    get_book_search_service,
+    start_book_enrichment_worker,
+    start_metadata_warmup_scheduler,
+)
 
 API_PREFIX = "/api"
 
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    # create long-lived services before the threadpool starts serving requests
+    get_book_search_service()
+    start_book_enrichment_worker()
+    start_metadata_warmup_scheduler()
+    yield
+    close_metadata_warmup_scheduler()
+    close_book_enrichment_worker()
+    close_book_search_service()
+
+
+app = FastAPI(lifespan=lifespan)
 app.include_router(tags.router, prefix=API_PREFIX)
 app.include_router(auth.router, prefix=API_PREFIX)
 app.include_router(book_search.router, prefix=API_PREFIX)
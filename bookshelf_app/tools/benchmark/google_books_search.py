@@ -0,0 +1,112 @@
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+import time
+from statistics import median
+from urllib.parse import parse_qs, urlparse
+
+from bookshelf_app.api.book_search.service import GOOGLE_INTERACTIVE_BUDGET, GoogleBooksProvider
+from bookshelf_app.infra.other.rate_limiter import AdaptiveTokenBucket, RateLimiter
+
+UNLIMITED_RATE_PER_SECOND = 1_000_000.0
+
+
+class _FakeGoogleBooksHandler(BaseHTTPRequestHandler):
+    delay_seconds = 0.2
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query).get("q", [""])[0]
+        time.sleep(self.delay_seconds)
+        body = json.dumps(
+            {
+                "items": [
+                    {
+                        "id": f"{query}-{index}",
+                        "volumeInfo": {
+                            "title": f"{query} {index}",
+                            "authors": [f"著者{index}"],
+                            "publisher": "ベンチマーク出版",
+                            "publishedDate": "2024-01-01",
+                            "industryIdentifiers": [{"type": "ISBN_13", "identifier": f"978000000{index:04d}"}],
+                        },
+                    }
+                    for index in range(40)
+                ]
+            },
+            ensure_ascii=False,
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def create_rate_limiter(rate_per_second: float) -> RateLimiter:
+    # The app's shared Google limiter would pace both runs alike and hide the concurrency gain.
+    rate_per_second = rate_per_second or UNLIMITED_RATE_PER_SECOND
+    return RateLimiter(
+        {
+            GOOGLE_INTERACTIVE_BUDGET: AdaptiveTokenBucket(
+                rate_per_second=rate_per_second, burst=max(1, int(rate_per_second))
+            )
+        },
+        default_budget=GOOGLE_INTERACTIVE_BUDGET,
+    )
+
+
+def measure(provider: GoogleBooksProvider, keyword: str, rounds: int) -> list[float]:
+    elapsed: list[float] = []
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        provider.search(keyword)
+        elapsed.append(time.perf_counter() - started_at)
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark Google Books keyword search against a local stand-in server.")
+    parser.add_argument("--delay-ms", type=int, default=200, help="Artificial latency of each stand-in response.")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--keyword", default="オライリー")
+    parser.add_argument(
+        "--rate-per-second", type=float, default=0, help="Google request rate limit to apply. 0 means unlimited."
+    )
+    args = parser.parse_args()
+
+    if args.delay_ms < 0:
+        parser.error("--delay-ms must not be negative.")
+    if args.rounds < 1:
+        parser.error("--rounds must be at least 1.")
+    if args.rate_per_second < 0:
+        parser.error("--rate-per-second must not be negative.")
+
+    _FakeGoogleBooksHandler.delay_seconds = args.delay_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeGoogleBooksHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        api_url = f"http://127.0.0.1:{server.server_address[1]}/books/v1/volumes"
+        serial = GoogleBooksProvider(api_key="", rate_limiter=create_rate_limiter(args.rate_per_second))
+        serial.api_url = api_url
+        serial.search_max_workers = 1
+        concurrent = GoogleBooksProvider(api_key="", rate_limiter=create_rate_limiter(args.rate_per_second))
+        concurrent.api_url = api_url
+
+        serial_elapsed = median(measure(serial, args.keyword, args.rounds))
+        concurrent_elapsed = median(measure(concurrent, args.keyword, args.rounds))
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"serial median: {serial_elapsed * 1000:.1f}ms")
+    print(f"concurrent median: {concurrent_elapsed * 1000:.1f}ms")
+    print(f"speedup: {serial_elapsed / concurrent_elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
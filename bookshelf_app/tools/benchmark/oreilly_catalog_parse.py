@@ -0,0 +1,113 @@
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import threading
+import time
+import tracemalloc
+from statistics import median
+
+from bookshelf_app.api.book_search import service
+from bookshelf_app.api.book_search.service import CatalogValidators, OreillyCatalogProvider, parse_oreilly_catalog
+from bookshelf_app.infra.other.http_client import get_http_client
+
+
+class _CatalogHandler(BaseHTTPRequestHandler):
+    body = b""
+    chunk_size = 64 * 1024
+    chunk_delay_seconds = 0.0
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(self.body)))
+        self.end_headers()
+        try:
+            for start in range(0, len(self.body), self.chunk_size):
+                self.wfile.write(self.body[start : start + self.chunk_size])
+                self.wfile.flush()
+                time.sleep(self.chunk_delay_seconds)
+        except (BrokenPipeError, ConnectionResetError):
+            # The streaming parser hangs up once it has enough rows.
+            pass
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def create_catalog_fixture(rows: int) -> bytes:
+    lines = ["<html><body><table>", "<tr><th>ISBN</th><th>書名</th><th>価格</th><th>発行年月日</th></tr>"]
+    for index in range(rows):
+        isbn13 = f"978481{index:07d}"
+        lines.append(
+            f"<tr><td>{isbn13}</td><td><a href='/books/{isbn13}/'>ベンチマーク用の書籍 第{index}版</a></td>"
+            f"<td>3,960</td><td>2026/{index % 12 + 1:02d}/01</td></tr>"
+        )
+    lines.append("</table></body></html>")
+    return "\n".join(lines).encode("utf-8")
+
+
+def measure_buffered(catalog_url: str, limit: int) -> int:
+    html = get_http_client().get(catalog_url).text()
+    return len(parse_oreilly_catalog(html, catalog_url)[:limit])
+
+
+def measure_streaming(catalog_url: str, _limit: int) -> int:
+    provider = OreillyCatalogProvider()
+    provider.catalog_url = catalog_url
+    return len(provider.fetch_catalog(CatalogValidators()).books or [])
+
+
+def measure(func, catalog_url: str, limit: int, rounds: int) -> tuple[float, float, int]:
+    elapsed: list[float] = []
+    peaks: list[int] = []
+    count = 0
+    for _ in range(rounds):
+        tracemalloc.start()
+        started_at = time.perf_counter()
+        count = func(catalog_url, limit)
+        elapsed.append(time.perf_counter() - started_at)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    return median(elapsed), median(peaks) / 1024 / 1024, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark buffered and streaming parses of the O'Reilly catalog page.")
+    parser.add_argument("--fixture", type=Path, help="Saved catalog HTML. A synthetic catalog is generated when omitted.")
+    parser.add_argument("--rows", type=int, default=20000, help="Rows of the synthetic catalog.")
+    parser.add_argument("--limit", type=int, default=service.PUBLISHER_CATALOG_MAX_ITEMS)
+    parser.add_argument("--chunk-kb", type=int, default=64)
+    parser.add_argument("--chunk-delay-ms", type=int, default=5, help="Artificial latency between response chunks.")
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.rows < 1 or args.limit < 1 or args.chunk_kb < 1 or args.rounds < 1:
+        parser.error("--rows, --limit, --chunk-kb and --rounds must be at least 1.")
+    if args.chunk_delay_ms < 0:
+        parser.error("--chunk-delay-ms must not be negative.")
+
+    _CatalogHandler.body = args.fixture.read_bytes() if args.fixture else create_catalog_fixture(args.rows)
+    _CatalogHandler.chunk_size = args.chunk_kb * 1024
+    _CatalogHandler.chunk_delay_seconds = args.chunk_delay_ms / 1000
+    service.PUBLISHER_CATALOG_MAX_ITEMS = args.limit
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CatalogHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        catalog_url = f"http://127.0.0.1:{server.server_address[1]}/catalog/"
+        buffered = measure(measure_buffered, catalog_url, args.limit, args.rounds)
+        streaming = measure(measure_streaming, catalog_url, args.limit, args.rounds)
+    finally:
+        get_http_client().close()
+        server.shutdown()
+        server.server_close()
+
+    print(f"fixture: {len(_CatalogHandler.body) / 1024 / 1024:.1f}MiB")
+    print(f"buffered median: {buffered[0] * 1000:.1f}ms, peak memory: {buffered[1]:.1f}MiB, books: {buffered[2]}")
+    print(f"streaming median: {streaming[0] * 1000:.1f}ms, peak memory: {streaming[1]:.1f}MiB, books: {streaming[2]}")
+    print(f"speedup: {buffered[0] / streaming[0]:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
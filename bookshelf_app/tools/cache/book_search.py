@@ -5,6 +5,7 @@ from sqlalchemy import delete
 from bookshelf_app.api.book_search.service import normalize_isbn
 from bookshelf_app.infra.db.book_search import BookMetadataCacheDTO, PublisherCatalogCacheDTO
 from bookshelf_app.infra.db.database import get_session
+from bookshelf_app.infra.db.provider_response_cache import ProviderResponseCacheDTO
 
 
 def clear_book_metadata_cache(isbn13: str | None = None) -> int:
@@ -32,6 +33,15 @@ def clear_publisher_catalog_cache(source_key: str | None = None) -> int:
     raise RuntimeError("failed to open database session")
 
 
+def clear_provider_response_cache() -> int:
+    for session in get_session():
+        result = session.execute(delete(ProviderResponseCacheDTO))
+        session.commit()
+        return result.rowcount or 0
+
+    raise RuntimeError("failed to open database session")
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Clear book search cache.")
     parser.add_argument(
@@ -42,10 +52,15 @@ def main() -> None:
     parser.add_argument("--isbn13", help="Clear only one ISBN from metadata cache.")
     parser.add_argument("--catalog", action="store_true", help="Clear publisher catalog cache.")
     parser.add_argument("--source-key", help="Clear only one publisher catalog source key.")
+    parser.add_argument(
+        "--responses",
+        action="store_true",
+        help="Clear raw openBD/Google responses. Clear them with --metadata to refetch fresh metadata.",
+    )
     args = parser.parse_args()
 
-    if not args.metadata and not args.catalog:
-        parser.error("Specify --metadata or --catalog.")
+    if not args.metadata and not args.catalog and not args.responses:
+        parser.error("Specify --metadata, --catalog or --responses.")
     if args.isbn13 and not args.metadata:
         parser.error("--isbn13 requires --metadata.")
     if args.source_key and not args.catalog:
@@ -59,6 +74,10 @@ def main() -> None:
         count = clear_publisher_catalog_cache(args.source_key)
         print(f"publisher catalog cache deleted: {count}")
 
+    if args.responses:
+        count = clear_provider_response_cache()
+        print(f"provider response cache deleted: {count}")
+
 
 if __name__ == "__main__":
     main()
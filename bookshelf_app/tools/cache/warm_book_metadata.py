@@ -1,15 +1,115 @@
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import threading
+import time
+from typing import Callable
 
-from bookshelf_app.api.book_search.service import BookSearchService
+from bookshelf_app.api.book_search.service import (
+    BookSearchService,
+    MetadataCacheWarmupResult,
+    MetadataWarmupProgress,
+)
+
+CHECKPOINT_RETENTION_DAYS = 30
+
+
+class WarmupProgressReporter:
+    def __init__(
+        self,
+        count_api_calls: Callable[[], int],
+        output: Callable[[str], None] = print,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._count_api_calls = count_api_calls
+        self._output = output
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._started_at = clock()
+        self._initial_api_calls = count_api_calls()
+        self._progress: dict[str, MetadataWarmupProgress] = {}
+
+    def report(self, progress: MetadataWarmupProgress) -> None:
+        with self._lock:
+            self._progress[progress.publisher_id] = progress
+            self._output(
+                f"[{progress.publisher_id}] {progress.processed_count}/{progress.candidate_count} "
+                f"refreshed={progress.refreshed_count} failed={progress.failed_count} | {self._throughput()}"
+            )
+
+    def summary(self) -> str:
+        with self._lock:
+            return self._throughput()
+
+    def _throughput(self) -> str:
+        elapsed_seconds = max(self._clock() - self._started_at, 1e-9)
+        # ISBNs finished by an interrupted run are not part of this run's throughput.
+        isbn_count = sum(progress.processed_count - progress.resumed_count for progress in self._progress.values())
+        api_calls = self._count_api_calls() - self._initial_api_calls
+        return (
+            f"elapsed={elapsed_seconds:.1f}s, isbns={isbn_count} ({isbn_count / elapsed_seconds:.2f}/s), "
+            f"api_calls={api_calls} ({api_calls / elapsed_seconds:.2f}/s)"
+        )
+
+
+def count_api_calls(service: BookSearchService) -> int:
+    return sum(stats.attempts for stats in service.get_fetch_retry_stats().values())
+
+
+def warm_publishers(
+    service: BookSearchService,
+    publisher_ids: list[str],
+    workers: int,
+    run_id: str,
+    reporter: WarmupProgressReporter,
+    refresh_after_days: int = 14,
+    batch_size: int = 40,
+    google_delay_seconds: float = 0,
+    batch_delay_seconds: float = 0,
+) -> dict[str, MetadataCacheWarmupResult | Exception]:
+    def warm(publisher_id: str) -> MetadataCacheWarmupResult | Exception:
+        try:
+            return service.warm_publisher_metadata_cache(
+                publisher_id=publisher_id,
+                refresh_after_days=refresh_after_days,
+                batch_size=batch_size,
+                google_delay_seconds=google_delay_seconds,
+                batch_delay_seconds=batch_delay_seconds,
+                run_id=run_id,
+                on_progress=reporter.report,
+            )
+        except Exception as error:
+            return error
+
+    # Publishers run side by side; their Google calls still share the process-wide warmup budget.
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="metadata-warmup") as executor:
+        return dict(zip(publisher_ids, executor.map(warm, publisher_ids)))
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Warm publisher book metadata cache.")
-    parser.add_argument("--publisher-id", default="oreilly_japan")
+    parser.add_argument(
+        "--publisher-id",
+        action="append",
+        dest="publisher_ids",
+        help="Publisher to warm. Repeat to warm several; all publishers are warmed when omitted.",
+    )
+    parser.add_argument("--workers", type=int, help="Publishers warmed concurrently. Defaults to one per publisher.")
+    parser.add_argument(
+        "--run-id",
+        default=datetime.now(timezone.utc).date().isoformat(),
+        help="Checkpoint key. Running again with the same id resumes where the previous run stopped.",
+    )
+    parser.add_argument("--restart", action="store_true", help="Discard the checkpoint of --run-id and start over.")
     parser.add_argument("--refresh-after-days", type=int, default=14)
     parser.add_argument("--batch-size", type=int, default=40)
-    parser.add_argument("--google-delay-seconds", type=float, default=0.2)
-    parser.add_argument("--batch-delay-seconds", type=float, default=2.0)
+    parser.add_argument(
+        "--google-delay-seconds",
+        type=float,
+        default=0,
+        help="Extra delay between Google Books calls. Calls are already paced by the shared rate limiter.",
+    )
+    parser.add_argument("--batch-delay-seconds", type=float, default=0, help="Extra delay between batches.")
     args = parser.parse_args()
 
     if args.refresh_after_days < 1:
@@ -18,23 +118,58 @@ def main() -> None:
         parser.error("--batch-size must be between 1 and 40.")
     if args.google_delay_seconds < 0 or args.batch_delay_seconds < 0:
         parser.error("Delay values must not be negative.")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1.")
+    if not args.run_id or len(args.run_id) > 100:
+        parser.error("--run-id must be 1 to 100 characters.")
 
-    result = BookSearchService().warm_publisher_metadata_cache(
-        publisher_id=args.publisher_id,
-        refresh_after_days=args.refresh_after_days,
-        batch_size=args.batch_size,
-        google_delay_seconds=args.google_delay_seconds,
-        batch_delay_seconds=args.batch_delay_seconds,
-    )
-    print(
-        "book metadata cache warmup finished: "
-        f"catalog={result.catalog_count}, "
-        f"candidates={result.candidate_count}, "
-        f"refreshed={result.refreshed_count}, "
-        f"failed={result.failed_count}"
-    )
+    service = BookSearchService()
+    try:
+        known_ids = [publisher.publisher_id for publisher in service.list_publishers()]
+        publisher_ids = list(dict.fromkeys(args.publisher_ids or known_ids))
+        unknown_ids = [publisher_id for publisher_id in publisher_ids if publisher_id not in known_ids]
+        if unknown_ids:
+            parser.error(f"unknown publisher: {', '.join(unknown_ids)} (available: {', '.join(known_ids)})")
+
+        service.clear_metadata_warmup_checkpoints(
+            before=datetime.now(timezone.utc) - timedelta(days=CHECKPOINT_RETENTION_DAYS)
+        )
+        if args.restart:
+            service.clear_metadata_warmup_checkpoints(run_id=args.run_id)
+
+        reporter = WarmupProgressReporter(lambda: count_api_calls(service), output=lambda line: print(line, flush=True))
+        results = warm_publishers(
+            service,
+            publisher_ids,
+            workers=args.workers or len(publisher_ids),
+            run_id=args.run_id,
+            reporter=reporter,
+            refresh_after_days=args.refresh_after_days,
+            batch_size=args.batch_size,
+            google_delay_seconds=args.google_delay_seconds,
+            batch_delay_seconds=args.batch_delay_seconds,
+        )
+    finally:
+        service.close()
+
+    failed = False
+    for publisher_id, result in results.items():
+        if isinstance(result, Exception):
+            failed = True
+            print(f"book metadata cache warmup failed: publisher={publisher_id}, error={result!r}")
+            continue
+        failed = failed or result.failed_count > 0
+        print(
+            "book metadata cache warmup finished: "
+            f"publisher={publisher_id}, "
+            f"catalog={result.catalog_count}, "
+            f"candidates={result.candidate_count}, "
+            f"refreshed={result.refreshed_count}, "
+            f"failed={result.failed_count}"
+        )
+    print(f"run_id={args.run_id}, {reporter.summary()}")
 
-    if result.failed_count:
+    if failed:
         raise SystemExit(1)
 
 
@@ -1,19 +1,36 @@
 from datetime import date
 
+import pytest
+
+from bookshelf_app.api.book_search.scheduler import MetadataWarmupStatus
 from bookshelf_app.api.book_search.service import (
+    ISBN_BATCH_MAX_ISBNS,
     BookSearchRateLimitError,
     BookSearchResultAppModel,
+    MetadataCacheWarmupResult,
     PublisherAppModel,
     PublisherBookPageAppModel,
 )
 from bookshelf_app import main
-from bookshelf_app.infra.dependencies import get_admin_dependency
-import bookshelf_app.api.book_search.router as target_router
+from bookshelf_app.infra.dependencies import (
+    get_admin_dependency,
+    get_book_search_service,
+    get_metadata_warmup_scheduler,
+)
 
 URL_BASE = "/api/book_search"
 
 
-def test_book_search_returns_books_without_external_api(integration_client, monkeypatch):
+@pytest.fixture
+def override_book_search_service():
+    def override(service):
+        main.app.dependency_overrides[get_book_search_service] = lambda: service
+
+    yield override
+    main.app.dependency_overrides.pop(get_book_search_service, None)
+
+
+def test_book_search_returns_books_without_external_api(integration_client, override_book_search_service):
     class FakeBookSearchService:
         def search(self, keyword: str):
             assert keyword == "ドメイン駆動設計"
@@ -31,7 +48,7 @@ def test_book_search_returns_books_without_external_api(integration_client, monk
                 )
             ]
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(URL_BASE, params={"keyword": "ドメイン駆動設計"})
 
@@ -52,7 +69,7 @@ def test_book_search_returns_books_without_external_api(integration_client, monk
     ]
 
 
-def test_book_search_returns_multiple_books_without_external_api(integration_client, monkeypatch):
+def test_book_search_returns_multiple_books_without_external_api(integration_client, override_book_search_service):
     class FakeBookSearchService:
         def search(self, keyword: str):
             assert keyword == "設計"
@@ -81,7 +98,7 @@ def test_book_search_returns_multiple_books_without_external_api(integration_cli
                 ),
             ]
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(URL_BASE, params={"keyword": "設計"})
 
@@ -89,7 +106,7 @@ def test_book_search_returns_multiple_books_without_external_api(integration_cli
     assert [book["source_id"] for book in response.json()["books"]] == ["google-book-id-1", "9784814400737"]
 
 
-def test_book_search_returns_nullable_fields_without_external_api(integration_client, monkeypatch):
+def test_book_search_returns_nullable_fields_without_external_api(integration_client, override_book_search_service):
     class FakeBookSearchService:
         def search(self, keyword: str):
             return [
@@ -106,7 +123,7 @@ def test_book_search_returns_nullable_fields_without_external_api(integration_cl
                 )
             ]
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(URL_BASE, params={"keyword": "9784798121963"})
 
@@ -116,13 +133,15 @@ def test_book_search_returns_nullable_fields_without_external_api(integration_cl
     assert book["description"] is None
 
 
-def test_book_search_returns_empty_books_for_blank_keyword_without_external_api(integration_client, monkeypatch):
+def test_book_search_returns_empty_books_for_blank_keyword_without_external_api(
+    integration_client, override_book_search_service
+):
     class FakeBookSearchService:
         def search(self, keyword: str):
             assert keyword == "   "
             return []
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(URL_BASE, params={"keyword": "   "})
 
@@ -136,12 +155,12 @@ def test_book_search_requires_keyword(integration_client):
     assert response.status_code == 422
 
 
-def test_book_search_returns_rate_limit_message_without_external_api(integration_client, monkeypatch):
+def test_book_search_returns_rate_limit_message_without_external_api(integration_client, override_book_search_service):
     class FakeBookSearchService:
         def search(self, keyword: str):
             raise BookSearchRateLimitError()
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(URL_BASE, params={"keyword": "ドメイン駆動設計"})
 
@@ -149,12 +168,12 @@ def test_book_search_returns_rate_limit_message_without_external_api(integration
     assert response.json()["detail"] == "外部書籍検索APIの利用制限に達しました。しばらく時間を置いてから再度お試しください。"
 
 
-def test_book_search_returns_publishers_without_external_api(integration_client, monkeypatch):
+def test_book_search_returns_publishers_without_external_api(integration_client, override_book_search_service):
     class FakeBookSearchService:
         def list_publishers(self):
             return [PublisherAppModel(publisher_id="oreilly_japan", name="オライリー・ジャパン")]
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(f"{URL_BASE}/publishers")
 
@@ -162,7 +181,7 @@ def test_book_search_returns_publishers_without_external_api(integration_client,
     assert response.json() == {"publishers": [{"publisher_id": "oreilly_japan", "name": "オライリー・ジャパン"}]}
 
 
-def test_book_search_returns_publisher_books_without_external_api(integration_client, monkeypatch):
+def test_book_search_returns_publisher_books_without_external_api(integration_client, override_book_search_service):
     class FakeBookSearchService:
         def search_publisher_books(
             self,
@@ -194,7 +213,7 @@ def test_book_search_returns_publisher_books_without_external_api(integration_cl
                 total_count=45,
             )
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(
         f"{URL_BASE}/publishers/oreilly_japan/books",
@@ -209,12 +228,87 @@ def test_book_search_returns_publisher_books_without_external_api(integration_cl
     assert response.json()["total_pages"] == 3
 
 
-def test_book_search_clear_publisher_catalog_cache_requires_admin_dependency(integration_client, monkeypatch):
+def test_book_search_returns_books_by_isbn13s_in_request_order_without_external_api(
+    integration_client, override_book_search_service
+):
+    class FakeBookSearchService:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            assert isbn13s == ["978-4-7981-2196-3", "9784814401703", "unknown"]
+            return {
+                "9784798121963": BookSearchResultAppModel(
+                    source="openbd",
+                    source_id="9784798121963",
+                    title="ドメイン駆動設計",
+                    authors=["エリック・エヴァンス"],
+                    publisher="翔泳社",
+                    isbn13="9784798121963",
+                    published_at=date(2011, 4, 9),
+                    image_url=None,
+                )
+            }
+
+    override_book_search_service(FakeBookSearchService())
+
+    response = integration_client.post(
+        f"{URL_BASE}/isbn13s",
+        json={"isbn13s": ["978-4-7981-2196-3", "9784814401703", "unknown"]},
+    )
+
+    assert response.status_code == 200
+    books = response.json()["books"]
+    assert [book["isbn13"] for book in books] == ["978-4-7981-2196-3", "9784814401703", "unknown"]
+    assert books[0]["book"]["isbn13"] == "9784798121963"
+    assert books[1]["book"] is None
+    assert books[2]["book"] is None
+
+
+def test_book_search_books_by_isbn13s_rejects_too_many_isbns(integration_client):
+    response = integration_client.post(
+        f"{URL_BASE}/isbn13s", json={"isbn13s": ["9784798121963"] * (ISBN_BATCH_MAX_ISBNS + 1)}
+    )
+
+    assert response.status_code == 422
+
+
+def test_book_search_returns_descriptions_in_request_order_without_external_api(
+    integration_client, override_book_search_service
+):
+    class FakeBookSearchService:
+        def find_descriptions_by_isbn13s(self, isbn13s: list[str]):
+            assert isbn13s == ["978-4-7981-2196-3", "9784814401703", "unknown"]
+            return {"9784798121963": "説明", "9784814401703": None}
+
+    override_book_search_service(FakeBookSearchService())
+
+    response = integration_client.post(
+        f"{URL_BASE}/isbn13s/descriptions",
+        json={"isbn13s": ["978-4-7981-2196-3", "9784814401703", "unknown"]},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "descriptions": [
+            {"isbn13": "978-4-7981-2196-3", "description": "説明"},
+            {"isbn13": "9784814401703", "description": None},
+            {"isbn13": "unknown", "description": None},
+        ]
+    }
+
+
+def test_book_search_descriptions_rejects_empty_request(integration_client):
+    response = integration_client.post(f"{URL_BASE}/isbn13s/descriptions", json={"isbn13s": []})
+
+    assert response.status_code == 422
+
+
+def test_book_search_clear_publisher_catalog_cache_requires_admin_dependency(
+    integration_client, override_book_search_service
+):
     class FakeBookSearchService:
         def clear_publisher_catalog_cache(self):
             return 3
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
     main.app.dependency_overrides[get_admin_dependency] = lambda: None
     try:
         response = integration_client.delete(f"{URL_BASE}/cache/publisher-catalog")
@@ -225,12 +319,14 @@ def test_book_search_clear_publisher_catalog_cache_requires_admin_dependency(int
     assert response.json() == {"deleted_count": 3}
 
 
-def test_book_search_clear_book_metadata_cache_requires_admin_dependency(integration_client, monkeypatch):
+def test_book_search_clear_book_metadata_cache_requires_admin_dependency(
+    integration_client, override_book_search_service
+):
     class FakeBookSearchService:
         def clear_book_metadata_cache(self):
             return 4
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
     main.app.dependency_overrides[get_admin_dependency] = lambda: None
     try:
         response = integration_client.delete(f"{URL_BASE}/cache/book-metadata")
@@ -241,18 +337,69 @@ def test_book_search_clear_book_metadata_cache_requires_admin_dependency(integra
     assert response.json() == {"deleted_count": 4}
 
 
+def test_book_search_clear_provider_response_cache_requires_admin_dependency(
+    integration_client, override_book_search_service
+):
+    class FakeBookSearchService:
+        def clear_provider_response_cache(self):
+            return 5
+
+    override_book_search_service(FakeBookSearchService())
+    main.app.dependency_overrides[get_admin_dependency] = lambda: None
+    try:
+        response = integration_client.delete(f"{URL_BASE}/cache/provider-responses")
+    finally:
+        main.app.dependency_overrides.pop(get_admin_dependency, None)
+
+    assert response.status_code == 200
+    assert response.json() == {"deleted_count": 5}
+
+
+def test_book_search_warmup_status_requires_admin_dependency(integration_client):
+    class FakeScheduler:
+        def status(self):
+            return MetadataWarmupStatus(
+                enabled=True,
+                interval_seconds=3600,
+                is_leader=True,
+                running=False,
+                current_publisher_id=None,
+                last_started_at=None,
+                last_finished_at=None,
+                next_run_at=None,
+                last_error=None,
+                results={"gihyo": MetadataCacheWarmupResult(10, 2, 2, 0)},
+            )
+
+    main.app.dependency_overrides[get_metadata_warmup_scheduler] = FakeScheduler
+    main.app.dependency_overrides[get_admin_dependency] = lambda: None
+    try:
+        response = integration_client.get(f"{URL_BASE}/warmup/status")
+    finally:
+        main.app.dependency_overrides.pop(get_admin_dependency, None)
+        main.app.dependency_overrides.pop(get_metadata_warmup_scheduler, None)
+
+    assert response.status_code == 200
+    assert response.json()["is_leader"] is True
+    assert response.json()["results"] == {
+        "gihyo": {"catalog_count": 10, "candidate_count": 2, "refreshed_count": 2, "failed_count": 0}
+    }
+
+
 def test_book_search_clear_cache_rejects_request_without_token(integration_client):
     response = integration_client.delete(f"{URL_BASE}/cache/book-metadata")
 
     assert response.status_code == 401
 
 
-def test_book_search_unexpected_error_is_internal_server_error_without_external_api(integration_client, monkeypatch):
+def test_book_search_unexpected_error_is_internal_server_error_without_external_api(
+    integration_client, override_book_search_service
+):
     class FakeBookSearchService:
         def search(self, keyword: str):
             raise RuntimeError("unexpected provider error")
 
-    monkeypatch.setattr(target_router, "BookSearchService", FakeBookSearchService)
+    override_book_search_service(FakeBookSearchService())
 
     response = integration_client.get(URL_BASE, params={"keyword": "ドメイン駆動設計"})
 
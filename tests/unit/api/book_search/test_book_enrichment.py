@@ -0,0 +1,100 @@
+from datetime import date
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from bookshelf_app.api.book_search import service as target
+from bookshelf_app.api.book_search.enrichment_worker import BookEnrichmentWorker
+from bookshelf_app.infra.db.enrichment_job import BookEnrichmentJobDTO
+from tests.unit.api.book_search.helper import create_book
+
+CATALOG_BOOKS = [
+    target.PublisherCatalogBookAppModel(isbn13="9784297000002", title="新しい本", published_at=date(2026, 6, 1)),
+    target.PublisherCatalogBookAppModel(isbn13="9784297000001", title="古い本", published_at=date(2026, 1, 1)),
+]
+
+
+class FakeOpenBd:
+    def find_by_isbn13s(self, isbn13s: list[str]):
+        return {
+            isbn13: create_book(source="openbd", isbn13=isbn13, image_url=f"https://example.com/{isbn13}.jpg")
+            for isbn13 in isbn13s
+        }
+
+
+class FakeGoogle:
+    def __init__(self):
+        self.calls: list[str] = []
+
+    def find_by_isbn13(self, isbn13: str):
+        self.calls.append(isbn13)
+        raise target.BookSearchRateLimitError()
+
+
+def create_queue() -> target.BookEnrichmentQueue:
+    engine = create_engine("sqlite://")
+    BookEnrichmentJobDTO.__table__.create(engine)
+    return target.BookEnrichmentQueue(sessionmaker(engine))
+
+
+def create_service(monkeypatch, openbd, google, queue) -> tuple[target.PublisherCatalogService, dict]:
+    metadata_cache: dict[str, target.BookSearchResultAppModel] = {}
+    service = target.PublisherCatalogService(google, openbd, queue)
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: (target.datetime(2026, 7, 1), target.datetime(2099, 1, 1)))
+    monkeypatch.setattr(service, "_load_catalog_rows", lambda _key: CATALOG_BOOKS)
+    monkeypatch.setattr(
+        service,
+        "_load_book_metadata_cache",
+        lambda isbn13s, allow_expired=False: {isbn13: metadata_cache[isbn13] for isbn13 in isbn13s if isbn13 in metadata_cache},
+    )
+    monkeypatch.setattr(
+        service, "_save_book_metadata_cache", lambda books: metadata_cache.update({book.isbn13: book for book in books})
+    )
+    monkeypatch.setattr(service, "_load_unknown_isbn13s", lambda _isbns: set())
+    return service, metadata_cache
+
+
+def test_publisher_page_returns_placeholders_and_worker_enriches_queued_books(monkeypatch):
+    queue = create_queue()
+    service, metadata_cache = create_service(monkeypatch, FakeOpenBd(), FakeGoogle(), queue)
+
+    first = service.search_books("gihyo")
+    service.search_books("gihyo")
+
+    assert [book.source for book in first.books] == ["publisher-catalog", "publisher-catalog"]
+    assert queue.counts() == {"pending": 2}
+
+    result = service.process_enrichment_jobs(limit=40, visibility_timeout_seconds=60)
+    second = service.search_books("gihyo", page=1, limit=39)
+
+    assert result == target.EnrichmentJobRunResult(claimed_count=2, completed_count=2, retried_count=0)
+    assert queue.counts() == {}
+    assert sorted(metadata_cache) == ["9784297000001", "9784297000002"]
+    assert [book.image_url for book in second.books] == [
+        "https://example.com/9784297000002.jpg",
+        "https://example.com/9784297000001.jpg",
+    ]
+
+
+def test_enrichment_worker_retries_jobs_left_uncached_by_transient_failures(monkeypatch):
+    class EmptyOpenBd:
+        def find_by_isbn13s(self, _isbn13s: list[str]):
+            return {}
+
+    queue = create_queue()
+    google = FakeGoogle()
+    service, metadata_cache = create_service(monkeypatch, EmptyOpenBd(), google, queue)
+    service.search_books("gihyo")
+
+    class FakeBookSearchService:
+        def process_enrichment_jobs(self, limit: int, visibility_timeout_seconds: float):
+            return service.process_enrichment_jobs(limit, visibility_timeout_seconds)
+
+    worker = BookEnrichmentWorker(FakeBookSearchService(), poll_interval_seconds=1)
+    actual = worker.run_once()
+
+    assert actual == target.EnrichmentJobRunResult(claimed_count=2, completed_count=0, retried_count=2)
+    assert sorted(google.calls) == ["9784297000001", "9784297000002"]
+    assert metadata_cache == {}
+    assert queue.counts() == {"pending": 2}
+    assert worker.run_once().claimed_count == 0
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from bookshelf_app.api.book_search import service as target
+from bookshelf_app.infra.db.book_search import BookMetadataCacheDTO
+from tests.unit.api.book_search.helper import create_book
+
+
+class CountingSessionFactory:
+    def __init__(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        BookMetadataCacheDTO.__table__.create(engine)
+        self._factory = sessionmaker(engine)
+        self.opened = 0
+
+    def __call__(self):
+        self.opened += 1
+        return self._factory()
+
+
+def test_book_metadata_cache_serves_repeated_reads_from_memory():
+    sessions = CountingSessionFactory()
+    cache = target.BookMetadataCache(sessions)
+    cache.save([create_book(isbn13="9784814401703")])
+    cache.clear_memory()
+
+    first = cache.get_many(["9784814401703", "9784814409999"])
+    second = cache.get_many(["978-4-8144-0170-3"])
+
+    assert list(first) == ["9784814401703"]
+    assert second == first
+    assert sessions.opened == 2
+    stats = cache.stats()
+    assert stats.database == target.DatabaseCacheStats(hits=1, misses=1)
+    assert (stats.memory.hits, stats.memory.misses) == (1, 2)
+
+
+def test_book_metadata_cache_writes_through_to_memory():
+    sessions = CountingSessionFactory()
+    cache = target.BookMetadataCache(sessions)
+    book = create_book(isbn13="9784814401703")
+
+    cache.save([book])
+    opened_after_save = sessions.opened
+
+    assert cache.get("9784814401703") is not None
+    assert cache.get_many(["9784814401703"]) == {"9784814401703": book}
+    assert sessions.opened == opened_after_save
+
+
+def test_book_metadata_cache_keeps_memory_entries_no_longer_than_the_row():
+    sessions = CountingSessionFactory()
+    cache = target.BookMetadataCache(sessions)
+    cache.save([create_book(isbn13="9784814401703")])
+    with sessions() as session:
+        session.execute(
+            update(BookMetadataCacheDTO).values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        session.commit()
+    cache.clear_memory()
+
+    assert cache.get_many(["9784814401703"]) == {}
+    assert list(cache.get_many(["9784814401703"], allow_expired=True)) == ["9784814401703"]
+    # Expired rows are never promoted to memory.
+    assert cache.stats().memory.entries == 0
+
+
+def test_book_metadata_cache_negative_entries_never_replace_found_metadata():
+    cache = target.BookMetadataCache(CountingSessionFactory())
+    cache.save([create_book(isbn13="9784814401703")])
+
+    cache.save_unknown(["9784814401703", "978-4-8144-0999-9"])
+    cache.clear_memory()
+
+    assert cache.get_unknown(["9784814401703", "9784814409999"]) == {"9784814409999"}
+    assert list(cache.get_many(["9784814401703", "9784814409999"])) == ["9784814401703"]
+    assert cache.get("9784814409999").book is None
+
+
+def test_book_metadata_cache_remembers_checked_missing_descriptions():
+    sessions = CountingSessionFactory()
+    cache = target.BookMetadataCache(sessions)
+    cache.save([create_book(isbn13="9784814401703", description=None)])
+    assert not cache.get("9784814401703").has_final_description()
+
+    cache.mark_descriptions_checked(["9784814401703"])
+    cached_in_memory = cache.get("9784814401703")
+    cache.clear_memory()
+    cached_in_database = cache.get("9784814401703")
+
+    assert cached_in_memory.has_final_description()
+    assert cached_in_database.has_final_description()
+
+    with sessions() as session:
+        session.execute(
+            update(BookMetadataCacheDTO).values(
+                description_checked_at=datetime.now(timezone.utc)
+                - timedelta(days=target.BOOK_DESCRIPTION_NOT_FOUND_CACHE_DAYS, seconds=1)
+            )
+        )
+        session.commit()
+    cache.clear_memory()
+
+    assert not cache.get("9784814401703").has_final_description()
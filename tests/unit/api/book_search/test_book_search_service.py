@@ -1,9 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
 from bookshelf_app.api.book_search import service as target
 from tests.unit.api.book_search.helper import create_book
 
 
+@pytest.fixture(autouse=True)
+def metadata_cache(monkeypatch) -> dict[str, target.BookSearchResultAppModel | None]:
+    saved: dict[str, target.BookSearchResultAppModel | None] = {}
+    description_checked: set[str] = set()
+
+    def load(_self, isbn13: str):
+        if isbn13 not in saved:
+            return None
+        return target.CachedBookMetadata(
+            saved[isbn13],
+            target.datetime(2099, 1, 1, tzinfo=target.timezone.utc),
+            target.datetime.now(target.timezone.utc) if isbn13 in description_checked else None,
+        )
+
+    monkeypatch.setattr(target.BookSearchService, "_load_cached_metadata", load)
+    monkeypatch.setattr(
+        target.BookSearchService,
+        "_load_book_metadata_cache",
+        lambda _self, isbn13s: {isbn13: saved[isbn13] for isbn13 in isbn13s if saved.get(isbn13)},
+    )
+    monkeypatch.setattr(
+        target.BookSearchService,
+        "_save_book_metadata_cache",
+        lambda _self, books: saved.update({book.isbn13: book for book in books}),
+    )
+    monkeypatch.setattr(
+        target.BookSearchService, "_mark_descriptions_checked", lambda _self, isbn13s: description_checked.update(isbn13s)
+    )
+    monkeypatch.setattr(
+        target.BookSearchService,
+        "_load_unknown_isbn13s",
+        lambda _self, isbn13s: {isbn13 for isbn13 in isbn13s if isbn13 in saved and saved[isbn13] is None},
+    )
+    monkeypatch.setattr(
+        target.BookSearchService, "_save_unknown_isbn13s", lambda _self, isbn13s: saved.update(dict.fromkeys(isbn13s))
+    )
+    return saved
+
+
 def test_book_search_service_returns_empty_for_blank_keyword():
-    service = target.BookSearchService.__new__(target.BookSearchService)
+    service = target.BookSearchService()
 
     actual = service.search("   ")
 
@@ -18,7 +62,7 @@ def test_book_search_service_uses_google_for_keyword_search():
             assert keyword == "ドメイン駆動設計"
             return [book]
 
-    service = target.BookSearchService.__new__(target.BookSearchService)
+    service = target.BookSearchService()
     service._google = FakeGoogle()
 
     actual = service.search(" ドメイン駆動設計 ")
@@ -26,6 +70,50 @@ def test_book_search_service_uses_google_for_keyword_search():
     assert actual == [book]
 
 
+def test_book_search_service_caches_keyword_search_by_normalized_keyword():
+    book = create_book()
+    calls: list[str] = []
+
+    class FakeGoogle:
+        def search(self, keyword: str):
+            calls.append(keyword)
+            return [book]
+
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+
+    first = service.search("Ｐｙｔｈｏｎ  入門")
+    second = service.search(" python 入門 ")
+
+    assert first == [book]
+    assert second == [book]
+    assert calls == ["Ｐｙｔｈｏｎ  入門"]
+    stats = service.get_search_cache_stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+
+
+def test_book_search_service_does_not_cache_rate_limited_keyword_search():
+    book = create_book()
+    calls = 0
+
+    class FlakyGoogle:
+        def search(self, keyword: str):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise target.BookSearchRateLimitError()
+            return [book]
+
+    service = target.BookSearchService()
+    service._google = FlakyGoogle()
+
+    with pytest.raises(target.BookSearchRateLimitError):
+        service.search("Python")
+
+    assert service.search("Python") == [book]
+
+
 def test_book_search_service_merges_google_and_openbd_for_isbn_search():
     google = create_book(title="Google title", image_url="https://google.example.com/cover.jpg")
     openbd = create_book(source="openbd", title="openBD title", image_url=None)
@@ -38,7 +126,7 @@ def test_book_search_service_merges_google_and_openbd_for_isbn_search():
         def find_by_isbn13(self, isbn13: str):
             return openbd
 
-    service = target.BookSearchService.__new__(target.BookSearchService)
+    service = target.BookSearchService()
     service._google = FakeGoogle()
     service._openbd = FakeOpenBd()
 
@@ -76,10 +164,437 @@ def test_book_search_service_returns_empty_when_google_rate_limited_and_openbd_h
         def find_by_isbn13(self, isbn13: str):
             return None
 
-    service = target.BookSearchService.__new__(target.BookSearchService)
+    service = target.BookSearchService()
     service._google = RateLimitedGoogle()
     service._openbd = EmptyOpenBd()
 
     actual = service.search("9784798121963")
 
     assert actual == []
+
+
+def test_book_search_service_reads_isbn_lookup_through_metadata_cache(metadata_cache):
+    google = create_book(title="Google title")
+    calls = 0
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            nonlocal calls
+            calls += 1
+            return google
+
+    class EmptyOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            return None
+
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = EmptyOpenBd()
+
+    first = service.find_by_isbn13("9784798121963")
+    description = service.find_description_by_isbn13("978-4-7981-2196-3")
+
+    assert first == google
+    assert description == google.description
+    assert calls == 1
+    assert metadata_cache == {"9784798121963": google}
+
+
+def test_book_search_service_serves_description_from_metadata_cache(metadata_cache):
+    class UnusedProvider:
+        def find_by_isbn13(self, isbn13: str):
+            raise AssertionError("cached descriptions must not call providers")
+
+    metadata_cache["9784798121963"] = create_book(description="キャッシュ済みの説明")
+    metadata_cache["9784814409999"] = None
+    service = target.BookSearchService()
+    service._google = UnusedProvider()
+    service._openbd = UnusedProvider()
+
+    assert service.find_description_by_isbn13("978-4-7981-2196-3") == "キャッシュ済みの説明"
+    assert service.find_description_by_isbn13("9784814409999") is None
+
+
+def test_book_search_service_fetches_description_missing_from_cached_row(metadata_cache):
+    calls: list[str] = []
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            calls.append(isbn13)
+            return create_book(isbn13=isbn13, description=f"説明{isbn13[-1]}")
+
+    class EmptyOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            return None
+
+    metadata_cache["9784798121963"] = create_book(description=None)
+    metadata_cache["9784814401703"] = create_book(isbn13="9784814401703", description=None)
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = EmptyOpenBd()
+
+    single = service.find_description_by_isbn13("978-4-7981-2196-3")
+    batch = service.find_descriptions_by_isbn13s(["9784814401703"])
+
+    assert single == "説明3"
+    assert batch == {"9784814401703": "説明3"}
+    assert calls == ["9784798121963", "9784814401703"]
+    assert metadata_cache["9784798121963"].description == "説明3"
+
+
+def test_book_search_service_remembers_books_without_description(metadata_cache):
+    calls: list[str] = []
+
+    class FakeProvider:
+        def __init__(self, source: str):
+            self._source = source
+
+        def find_by_isbn13(self, isbn13: str):
+            calls.append(self._source)
+            return create_book(isbn13=isbn13, source=self._source, description=None)
+
+    metadata_cache["9784798121963"] = create_book(description=None)
+    service = target.BookSearchService()
+    service._google = FakeProvider("google-books")
+    service._openbd = FakeProvider("openbd")
+
+    first = service.find_description_by_isbn13("9784798121963")
+    calls_after_first = len(calls)
+    second = service.find_description_by_isbn13("9784798121963")
+    batch = service.find_descriptions_by_isbn13s(["9784798121963"])
+
+    assert (first, second, batch) == (None, None, {"9784798121963": None})
+    assert calls_after_first == 2
+    assert len(calls) == 2
+
+
+def test_book_search_service_finds_descriptions_in_batch_fetching_only_misses(metadata_cache):
+    calls: list[str] = []
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            calls.append(isbn13)
+            return create_book(isbn13=isbn13, description=f"説明{isbn13[-1]}")
+
+    class EmptyOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            return None
+
+    metadata_cache["9784798121963"] = create_book(description="キャッシュ済みの説明")
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = EmptyOpenBd()
+
+    actual = service.find_descriptions_by_isbn13s(
+        ["978-4-7981-2196-3", "9784814401703", "9784814401710", "9784814401703", "not-an-isbn"]
+    )
+
+    assert actual == {
+        "9784798121963": "キャッシュ済みの説明",
+        "9784814401703": "説明3",
+        "9784814401710": "説明0",
+    }
+    assert sorted(calls) == ["9784814401703", "9784814401710"]
+
+
+def test_book_search_service_finds_books_in_batch_from_cache_openbd_and_google(metadata_cache):
+    openbd_calls: list[list[str]] = []
+    google_calls: list[str] = []
+
+    class FakeOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            openbd_calls.append(isbn13s)
+            return {
+                "9784814401703": create_book(isbn13="9784814401703", source="openbd"),
+                "9784814401710": create_book(isbn13="9784814401710", image_url=None, description=None, source="openbd"),
+            }
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            google_calls.append(isbn13)
+            if isbn13 == "9784814401710":
+                return create_book(isbn13=isbn13, image_url="https://example.com/google.jpg")
+            return None
+
+    cached = create_book()
+    metadata_cache["9784798121963"] = cached
+    metadata_cache["9784814409999"] = None
+    service = target.BookSearchService()
+    service._openbd = FakeOpenBd()
+    service._google = FakeGoogle()
+
+    actual = service.find_by_isbn13s(
+        ["978-4-7981-2196-3", "9784814401703", "9784814401710", "9784814409999", "9784814401727", "not-an-isbn"]
+    )
+
+    assert actual["9784798121963"] == cached
+    assert actual["9784814401703"].source == "openbd"
+    assert actual["9784814401710"].image_url == "https://example.com/google.jpg"
+    assert set(actual) == {"9784798121963", "9784814401703", "9784814401710"}
+    assert openbd_calls == [["9784814401703", "9784814401710", "9784814401727"]]
+    assert sorted(google_calls) == ["9784814401710", "9784814401727"]
+    assert metadata_cache["9784814401727"] is None
+    assert metadata_cache["9784814401710"] == actual["9784814401710"]
+
+
+def test_book_search_service_batch_lookup_caps_google_and_skips_caching_rate_limited(monkeypatch, metadata_cache):
+    openbd_calls: list[list[str]] = []
+    google_calls: list[str] = []
+
+    class EmptyOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            openbd_calls.append(isbn13s)
+            return {}
+
+    class RateLimitedGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            google_calls.append(isbn13)
+            raise target.BookSearchRateLimitError()
+
+    monkeypatch.setattr(target, "ISBN_BATCH_GOOGLE_MAX_ITEMS", 2)
+    service = target.BookSearchService()
+    service._openbd = EmptyOpenBd()
+    service._google = RateLimitedGoogle()
+
+    actual = service.find_by_isbn13s(["9784814401703", "9784814401710", "9784814401727"])
+
+    assert actual == {}
+    assert openbd_calls == [["9784814401703", "9784814401710", "9784814401727"]]
+    assert sorted(google_calls) == ["9784814401703", "9784814401710"]
+    assert metadata_cache == {}
+
+
+def test_book_search_service_refetches_catalog_placeholder_from_cache(metadata_cache):
+    calls: list[str] = []
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            calls.append("google")
+            return create_book(isbn13=isbn13, authors=["著者"], description=None)
+
+    class FakeOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            calls.append("openbd")
+            return None
+
+    metadata_cache["9784798121963"] = create_book(
+        source="publisher-catalog", authors=["著者不明"], image_url=None, description="カタログの説明"
+    )
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = FakeOpenBd()
+
+    actual = service.find_by_isbn13("9784798121963")
+
+    assert sorted(calls) == ["google", "openbd"]
+    assert actual is not None
+    assert actual.source == "google-books"
+    assert actual.image_url == "https://example.com/cover.jpg"
+    assert actual.description == "カタログの説明"
+    assert metadata_cache["9784798121963"] == actual
+
+
+def test_book_search_service_batch_lookup_refetches_cached_placeholder(metadata_cache):
+    class FakeOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            assert isbn13s == ["9784814401703"]
+            return {"9784814401703": create_book(isbn13="9784814401703", source="openbd")}
+
+    metadata_cache["9784814401703"] = create_book(
+        isbn13="9784814401703", source="publisher-catalog", authors=["著者不明"], image_url=None
+    )
+    service = target.BookSearchService()
+    service._openbd = FakeOpenBd()
+    service._google = object()
+
+    actual = service.find_by_isbn13s(["9784814401703"])
+
+    assert actual["9784814401703"].source == "openbd"
+    assert metadata_cache["9784814401703"].source == "openbd"
+
+
+def test_book_search_service_negative_caches_isbn_unknown_to_both_providers(metadata_cache):
+    calls: list[str] = []
+
+    class EmptyProvider:
+        def __init__(self, name: str):
+            self.name = name
+
+        def find_by_isbn13(self, isbn13: str):
+            calls.append(self.name)
+            return None
+
+    service = target.BookSearchService()
+    service._google = EmptyProvider("google")
+    service._openbd = EmptyProvider("openbd")
+
+    first = service.find_by_isbn13("978-4-7981-2196-3")
+    second = service.search("9784798121963")
+
+    assert first is None
+    assert second == []
+    assert sorted(calls) == ["google", "openbd"]
+    assert metadata_cache == {"9784798121963": None}
+
+
+def test_book_search_service_does_not_negative_cache_when_google_is_rate_limited(metadata_cache):
+    class RateLimitedGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            raise target.BookSearchRateLimitError()
+
+    class EmptyOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            return None
+
+    service = target.BookSearchService()
+    service._google = RateLimitedGoogle()
+    service._openbd = EmptyOpenBd()
+
+    assert service.find_by_isbn13("9784798121963") is None
+    assert metadata_cache == {}
+
+
+def test_book_search_service_calls_google_and_openbd_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    google = create_book(title="Google title")
+    openbd = create_book(source="openbd", title="openBD title")
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            barrier.wait()
+            return google
+
+    class FakeOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            barrier.wait()
+            return openbd
+
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = FakeOpenBd()
+
+    actual = service.find_by_isbn13("9784798121963")
+
+    assert actual == target.merge_book_search_result(google, openbd)
+
+
+def test_book_search_service_returns_google_result_when_openbd_times_out():
+    release = threading.Event()
+    google = create_book(title="Google title")
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            return google
+
+    class SlowOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            release.wait(5)
+            return create_book(source="openbd")
+
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = SlowOpenBd()
+    service.openbd_timeout_seconds = 0.05
+
+    try:
+        actual = service.find_by_isbn13("9784798121963")
+    finally:
+        release.set()
+
+    assert actual == google
+
+
+def test_book_search_service_returns_google_result_when_openbd_fails(metadata_cache):
+    google = create_book(title="Google title")
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            return google
+
+    class BrokenOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            raise ConnectionError("reset by peer")
+
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = BrokenOpenBd()
+
+    assert service.find_by_isbn13("9784798121963") == google
+    # Only one provider answered, so nothing is cached.
+    assert metadata_cache == {}
+
+
+def test_book_search_service_raises_when_all_providers_fail():
+    class BrokenProvider:
+        def find_by_isbn13(self, isbn13: str):
+            raise ValueError("broken payload")
+
+    service = target.BookSearchService()
+    service._google = BrokenProvider()
+    service._openbd = BrokenProvider()
+
+    with pytest.raises(ValueError):
+        service.find_by_isbn13("9784798121963")
+
+
+def test_book_search_service_reuses_lookup_executor_until_closed():
+    service = target.BookSearchService()
+    executor = service._get_lookup_executor()
+
+    assert service._get_lookup_executor() is executor
+    service.close()
+    assert service._get_lookup_executor() is not executor
+    service.close()
+
+
+def test_book_search_service_raises_when_all_providers_time_out():
+    release = threading.Event()
+
+    class SlowProvider:
+        def find_by_isbn13(self, isbn13: str):
+            release.wait(5)
+            return None
+
+    service = target.BookSearchService()
+    service._google = SlowProvider()
+    service._openbd = SlowProvider()
+    service.google_timeout_seconds = 0.05
+    service.openbd_timeout_seconds = 0.05
+
+    try:
+        with pytest.raises(TimeoutError):
+            service.find_by_isbn13("9784798121963")
+    finally:
+        release.set()
+
+
+def test_book_search_service_coalesces_concurrent_isbn_lookups():
+    release = threading.Event()
+    openbd_calls = 0
+    openbd = create_book(source="openbd")
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            return None
+
+    class SlowOpenBd:
+        def find_by_isbn13(self, isbn13: str):
+            nonlocal openbd_calls
+            openbd_calls += 1
+            release.wait(5)
+            return openbd
+
+    service = target.BookSearchService()
+    service._google = FakeGoogle()
+    service._openbd = SlowOpenBd()
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(service.find_by_isbn13, "978-4-7981-2196-3") for _ in range(3)]
+        while service.get_single_flight_stats()["isbn13"].calls < 3:
+            threading.Event().wait(0.01)
+        release.set()
+        actual = [future.result() for future in futures]
+
+    assert actual == [openbd] * 3
+    assert openbd_calls == 1
+    assert service.get_single_flight_stats()["isbn13"].shared == 2
@@ -1,6 +1,12 @@
 from datetime import date
+import threading
+
+import pytest
 
 from bookshelf_app.api.book_search import service as target
+from bookshelf_app.infra.other.http_client import HttpResponse, HttpStatusError
+from bookshelf_app.infra.other.rate_limiter import AdaptiveTokenBucket, RateLimiter, use_rate_limit_budget
+from bookshelf_app.infra.other.retry import Retrier, RetryPolicy
 
 
 def test_create_google_search_queries_adds_field_specific_queries():
@@ -22,7 +28,7 @@ def test_create_google_search_queries_keeps_isbn_search_single_query():
 def test_google_books_provider_search_uses_publisher_query(monkeypatch):
     queries: list[str] = []
 
-    def fake_fetch_json(_url: str, params: dict[str, str]):
+    def fake_fetch_json(_url: str, params: dict[str, str], rate_limiter=None):
         assert params["orderBy"] == "newest"
         queries.append(params["q"])
         if params["q"] == "inpublisher:オライリー":
@@ -46,15 +52,53 @@ def test_google_books_provider_search_uses_publisher_query(monkeypatch):
 
     actual = target.GoogleBooksProvider(api_key="dummy").search("オライリー")
 
-    assert queries == [
-        "オライリー",
-        "intitle:オライリー",
-        "inpublisher:オライリー",
-    ]
+    assert sorted(queries) == sorted(
+        [
+            "オライリー",
+            "intitle:オライリー",
+            "inpublisher:オライリー",
+        ]
+    )
     assert len(actual) == 1
     assert actual[0].publisher == "オライリー・ジャパン"
 
 
+def test_google_books_provider_search_sends_queries_concurrently(monkeypatch):
+    # Every query waits for the others, so a serial implementation breaks the barrier.
+    barrier = threading.Barrier(3, timeout=5)
+
+    def fake_fetch_json(_url: str, params: dict[str, str], rate_limiter=None):
+        barrier.wait()
+        return {
+            "items": [
+                {
+                    "id": params["q"],
+                    "volumeInfo": {
+                        "title": params["q"],
+                        "authors": [params["q"]],
+                        "publisher": "出版社",
+                        "publishedDate": "2024-01",
+                        "industryIdentifiers": [
+                            {"type": "ISBN_13", "identifier": f"978481440073{len(params['q']) % 10}"}
+                        ],
+                    },
+                }
+            ]
+        }
+
+    monkeypatch.setattr(target, "fetch_json", fake_fetch_json)
+
+    actual = target.GoogleBooksProvider(api_key="dummy").search("Python")
+
+    assert [book.title for book in actual] == ["Python", "intitle:Python", "inpublisher:Python"]
+
+
+def test_map_concurrently_keeps_input_order():
+    actual = target.map_concurrently(lambda value: value * 2, [3, 1, 2], max_workers=3)
+
+    assert actual == [6, 2, 4]
+
+
 def test_convert_google_volume_uses_isbn10_when_isbn13_is_missing():
     actual = target.convert_google_volume(
         {
@@ -135,3 +179,135 @@ def test_extract_openbd_description_prefers_description_text_content():
     )
 
     assert actual == "紹介文\n本文"
+
+
+def create_rate_limiter(max_wait_seconds: float | None = None) -> RateLimiter:
+    return RateLimiter(
+        {
+            "interactive": AdaptiveTokenBucket(rate_per_second=100, burst=3, max_wait_seconds=max_wait_seconds),
+            "warmup": AdaptiveTokenBucket(rate_per_second=100, burst=3),
+        },
+        default_budget="interactive",
+    )
+
+
+def test_google_books_provider_slows_rate_limiter_after_429(monkeypatch, uncached_fetch):
+    client = FlakyHttpClient([429, 429, 429])
+    monkeypatch.setattr(target, "get_http_client", lambda: client)
+    monkeypatch.setattr(target, "get_fetch_retrier", create_fetch_retrier)
+    limiter = create_rate_limiter()
+    provider = target.GoogleBooksProvider(api_key="dummy", rate_limiter=limiter)
+
+    with pytest.raises(target.BookSearchRateLimitError):
+        provider.find_by_isbn13("9784798121963")
+
+    # Every attempt, retries included, takes a token and every 429 slows the bucket.
+    assert client.calls == 3
+    assert limiter.stats()["interactive"].acquired == 3
+    assert limiter.stats()["interactive"].throttled == 3
+    assert limiter.stats()["interactive"].rate_per_second < 13
+
+
+def test_google_books_provider_raises_rate_limit_without_calling_api_when_budget_is_exhausted(
+    monkeypatch, uncached_fetch
+):
+    client = FlakyHttpClient([])
+    monkeypatch.setattr(target, "get_http_client", lambda: client)
+    limiter = create_rate_limiter(max_wait_seconds=0)
+    provider = target.GoogleBooksProvider(api_key="dummy", rate_limiter=limiter)
+
+    provider.search("オライリー")
+    with pytest.raises(target.BookSearchRateLimitError):
+        provider.search("オライリー")
+
+    assert client.calls == 3
+
+
+def test_google_books_provider_uses_warmup_budget_inside_concurrent_search(monkeypatch, uncached_fetch):
+    monkeypatch.setattr(target, "get_http_client", lambda: FlakyHttpClient([]))
+    limiter = create_rate_limiter()
+    provider = target.GoogleBooksProvider(api_key="dummy", rate_limiter=limiter)
+
+    with use_rate_limit_budget("warmup"):
+        provider.search("オライリー")
+
+    assert limiter.stats()["warmup"].acquired == 3
+    assert limiter.stats()["interactive"].acquired == 0
+
+
+def test_google_books_provider_serves_cached_responses_without_rate_limiter(monkeypatch):
+    class CachedResponses:
+        def fetch(self, _url: str, _params: dict[str, str], _fetch):
+            return {"items": []}
+
+    monkeypatch.setattr(target, "get_provider_response_cache", CachedResponses)
+    limiter = create_rate_limiter(max_wait_seconds=0)
+    provider = target.GoogleBooksProvider(api_key="dummy", rate_limiter=limiter)
+
+    for _ in range(3):
+        provider.search("オライリー")
+
+    assert limiter.stats()["interactive"].acquired == 0
+    assert limiter.stats()["interactive"].rejected == 0
+
+
+class FlakyHttpClient:
+    def __init__(self, statuses: list[int]):
+        self.statuses = statuses
+        self.calls = 0
+
+    def get(self, url: str, params: dict[str, str] | None = None):
+        self.calls += 1
+        if self.statuses:
+            raise HttpStatusError(url, self.statuses.pop(0), {"retry-after": "0"}, b"")
+        return HttpResponse(200, {}, b'{"items": []}')
+
+
+@pytest.fixture
+def uncached_fetch(monkeypatch):
+    cache = target.ProviderResponseCache(ttl_seconds={})
+    monkeypatch.setattr(target, "get_provider_response_cache", lambda: cache)
+
+
+def create_fetch_retrier() -> Retrier:
+    return Retrier(
+        RetryPolicy(max_retries=2),
+        is_retryable=target.is_retryable_fetch_error,
+        retry_after=target.get_retry_after_seconds,
+        sleep=lambda _seconds: None,
+    )
+
+
+def test_fetch_json_retries_transient_server_errors(monkeypatch, uncached_fetch):
+    client = FlakyHttpClient([503, 429])
+    retrier = create_fetch_retrier()
+    monkeypatch.setattr(target, "get_http_client", lambda: client)
+    monkeypatch.setattr(target, "get_fetch_retrier", lambda: retrier)
+
+    actual = target.fetch_json("https://www.googleapis.com/books/v1/volumes", {"q": "isbn:9784798121963"})
+
+    assert actual == {"items": []}
+    assert client.calls == 3
+    assert retrier.stats()["www.googleapis.com"].retries == 2
+
+
+def test_fetch_json_raises_rate_limit_error_after_retry_budget(monkeypatch, uncached_fetch):
+    client = FlakyHttpClient([429, 429, 429])
+    monkeypatch.setattr(target, "get_http_client", lambda: client)
+    monkeypatch.setattr(target, "get_fetch_retrier", create_fetch_retrier)
+
+    with pytest.raises(target.BookSearchRateLimitError):
+        target.fetch_json("https://www.googleapis.com/books/v1/volumes", {"q": "isbn:9784798121963"})
+
+    assert client.calls == 3
+
+
+def test_fetch_json_does_not_retry_client_errors(monkeypatch, uncached_fetch):
+    client = FlakyHttpClient([404])
+    monkeypatch.setattr(target, "get_http_client", lambda: client)
+    monkeypatch.setattr(target, "get_fetch_retrier", create_fetch_retrier)
+
+    with pytest.raises(HttpStatusError):
+        target.fetch_json("https://api.openbd.jp/v1/get", {"isbn": "9784798121963"})
+
+    assert client.calls == 1
@@ -0,0 +1,75 @@
+import threading
+
+from bookshelf_app.api.book_search import scheduler as target
+from bookshelf_app.api.book_search.service import MetadataCacheWarmupResult, PublisherAppModel
+
+
+class FakeBookSearchService:
+    def __init__(self, failing_publisher_id: str | None = None):
+        self.failing_publisher_id = failing_publisher_id
+        self.calls: list[dict] = []
+        self.warmed = threading.Event()
+
+    def list_publishers(self):
+        return [PublisherAppModel("oreilly_japan", "オライリー・ジャパン"), PublisherAppModel("gihyo", "技術評論社")]
+
+    def warm_publisher_metadata_cache(self, **kwargs):
+        self.calls.append(kwargs)
+        self.warmed.set()
+        if kwargs["publisher_id"] == self.failing_publisher_id:
+            raise OSError("temporary failure")
+        return MetadataCacheWarmupResult(catalog_count=10, candidate_count=2, refreshed_count=2, failed_count=0)
+
+
+def create_scheduler(service: FakeBookSearchService, monkeypatch, leader: bool = True) -> target.MetadataWarmupScheduler:
+    scheduler = target.MetadataWarmupScheduler(service, interval_seconds=60, refresh_after_days=14, batch_size=40)
+    monkeypatch.setattr(scheduler, "_try_acquire_lock", lambda: leader)
+    monkeypatch.setattr(scheduler, "_release_lock", lambda: None)
+    return scheduler
+
+
+def test_metadata_warmup_scheduler_warms_every_publisher_as_leader(monkeypatch):
+    service = FakeBookSearchService(failing_publisher_id="oreilly_japan")
+    scheduler = create_scheduler(service, monkeypatch)
+
+    actual = scheduler.run_once()
+
+    status = scheduler.status()
+    assert actual is True
+    assert [call["publisher_id"] for call in service.calls] == ["oreilly_japan", "gihyo"]
+    assert service.calls[0]["refresh_after_days"] == 14
+    assert service.calls[0]["google_delay_seconds"] == 0
+    assert status.is_leader is True
+    assert status.running is False
+    assert list(status.results) == ["gihyo"]
+    assert status.results["gihyo"].refreshed_count == 2
+    assert status.last_error == "oreilly_japan: temporary failure"
+    assert status.last_finished_at is not None
+
+
+def test_metadata_warmup_scheduler_skips_run_without_leader_lock(monkeypatch):
+    service = FakeBookSearchService()
+    scheduler = create_scheduler(service, monkeypatch, leader=False)
+
+    actual = scheduler.run_once()
+
+    assert actual is False
+    assert service.calls == []
+    assert scheduler.status().is_leader is False
+    assert scheduler.status().last_started_at is None
+
+
+def test_metadata_warmup_scheduler_runs_in_background_until_stopped(monkeypatch):
+    service = FakeBookSearchService()
+    scheduler = create_scheduler(service, monkeypatch)
+    released: list[bool] = []
+    monkeypatch.setattr(scheduler, "_release_lock", lambda: released.append(True))
+
+    scheduler.start()
+    assert service.warmed.wait(2)
+    assert scheduler.status().enabled is True
+    scheduler.stop()
+
+    assert scheduler.status().enabled is False
+    assert released == [True]
+    assert scheduler.status().next_run_at is not None
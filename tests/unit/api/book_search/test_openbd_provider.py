@@ -1,3 +1,5 @@
+import threading
+
 import pytest
 
 from bookshelf_app.api.book_search import service as target
@@ -42,3 +44,55 @@ def test_openbd_provider_converts_cover_url_to_https(monkeypatch):
     assert actual is not None
     assert actual.image_url == "https://example.com/cover.jpg"
     assert actual.authors == ["著者1", "著者2"]
+
+
+def create_openbd_item(isbn13: str) -> dict:
+    return {"summary": {"isbn": isbn13, "title": f"本{isbn13[-2:]}", "pubdate": "20260401"}}
+
+
+def test_openbd_provider_posts_large_isbn_sets_in_even_chunks(monkeypatch):
+    calls: list[list[str]] = []
+    lock = threading.Lock()
+
+    def fake_post_form_json(url: str, data: dict[str, str]):
+        assert url == "https://api.openbd.jp/v1/get"
+        isbn13s = data["isbn"].split(",")
+        with lock:
+            calls.append(isbn13s)
+        return [create_openbd_item(isbn13) if int(isbn13[-2:]) % 2 else None for isbn13 in isbn13s]
+
+    monkeypatch.setattr(target, "post_form_json", fake_post_form_json)
+    monkeypatch.setattr(target, "OPENBD_BULK_CHUNK_SIZE", 10)
+    isbn13s = [f"97848144001{index:02d}" for index in range(25)]
+
+    actual = target.OpenBdProvider().find_by_isbn13s(isbn13s + isbn13s[:3])
+
+    assert sorted(len(chunk) for chunk in calls) == [8, 8, 9]
+    assert sorted(isbn13 for chunk in calls for isbn13 in chunk) == isbn13s
+    assert sorted(actual) == [isbn13 for isbn13 in isbn13s if int(isbn13[-2:]) % 2]
+
+
+def test_openbd_provider_uses_get_for_small_isbn_sets(monkeypatch):
+    monkeypatch.setattr(
+        target,
+        "fetch_json",
+        lambda url, params: [create_openbd_item(isbn13) for isbn13 in params["isbn"].split(",")],
+    )
+
+    actual = target.OpenBdProvider().find_by_isbn13s(["978-4-8144-0010-1", "9784814400102"])
+
+    assert sorted(actual) == ["9784814400101", "9784814400102"]
+
+
+def test_openbd_provider_keys_bulk_items_by_their_own_isbn(monkeypatch):
+    # A short response must not shift books onto the wrong ISBN.
+    monkeypatch.setattr(
+        target,
+        "fetch_json",
+        lambda url, params: [create_openbd_item("9784814400102"), {"summary": {"title": "ISBNなし"}}],
+    )
+
+    actual = target.OpenBdProvider().find_by_isbn13s(["9784814400101", "9784814400102", "9784814400103"])
+
+    assert list(actual) == ["9784814400102"]
+    assert actual["9784814400102"].title == "本02"
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+import json
+import zlib
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from bookshelf_app.api.book_search import service as target
+from bookshelf_app.infra.db.provider_response_cache import ProviderResponseCacheDTO
+
+GOOGLE_URL = "https://www.googleapis.com/books/v1/volumes"
+
+
+def create_session_factory():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    ProviderResponseCacheDTO.__table__.create(engine)
+    return sessionmaker(engine)
+
+
+class CountingFetch:
+    def __init__(self, data: dict | list):
+        self.data = data
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return self.data
+
+
+def test_provider_response_cache_shares_response_across_instances_without_api_key():
+    sessions = create_session_factory()
+    fetch = CountingFetch({"items": [{"id": "本"}]})
+
+    first = target.ProviderResponseCache(sessions).fetch(
+        GOOGLE_URL, {"q": "inpublisher:オライリー", "key": "secret-1"}, fetch
+    )
+    # Another worker with a different API key and parameter order reads the same row.
+    second = target.ProviderResponseCache(sessions).fetch(
+        GOOGLE_URL, {"key": "secret-2", "q": " inpublisher:オライリー "}, fetch
+    )
+
+    assert first == second == {"items": [{"id": "本"}]}
+    assert fetch.calls == 1
+    with sessions() as session:
+        row = session.scalars(select(ProviderResponseCacheDTO)).one()
+    assert row.provider == "www.googleapis.com"
+    assert "secret" not in row.request_key
+    assert json.loads(zlib.decompress(row.payload)) == first
+
+
+def test_provider_response_cache_refetches_expired_response():
+    sessions = create_session_factory()
+    cache = target.ProviderResponseCache(sessions)
+    fetch = CountingFetch([{"summary": {"isbn": "9784798121963"}}])
+
+    cache.fetch("https://api.openbd.jp/v1/get", {"isbn": "9784798121963"}, fetch)
+    with sessions() as session:
+        session.execute(
+            update(ProviderResponseCacheDTO).values(expires_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        session.commit()
+    cache.fetch("https://api.openbd.jp/v1/get", {"isbn": "9784798121963"}, fetch)
+
+    assert fetch.calls == 2
+    assert cache.stats() == {"api.openbd.jp": target.DatabaseCacheStats(hits=0, misses=2)}
+
+
+def test_provider_response_cache_skips_hosts_without_ttl():
+    sessions = create_session_factory()
+    cache = target.ProviderResponseCache(sessions)
+    fetch = CountingFetch({"list": {}, "next": False})
+
+    cache.fetch("https://gihyo.jp/api_gh/book/genre/test", {"offset": "0"}, fetch)
+    cache.fetch("https://gihyo.jp/api_gh/book/genre/test", {"offset": "0"}, fetch)
+
+    assert fetch.calls == 2
+    assert cache.stats() == {}
+
+
+def test_provider_response_cache_falls_back_to_provider_when_database_fails():
+    def broken_session():
+        raise OSError("database is down")
+
+    cache = target.ProviderResponseCache(broken_session)
+    fetch = CountingFetch({"items": []})
+
+    assert cache.fetch(GOOGLE_URL, {"q": "isbn:9784798121963"}, fetch) == {"items": []}
+    assert cache.fetch(GOOGLE_URL, {"q": "isbn:9784798121963"}, fetch) == {"items": []}
+    assert fetch.calls == 2
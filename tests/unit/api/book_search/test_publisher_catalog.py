@@ -1,9 +1,17 @@
 from datetime import date, datetime, timedelta, timezone
 from types import SimpleNamespace
+import threading
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from bookshelf_app.api.book_search import service as target
+from bookshelf_app.infra.db.book_search import BookMetadataCacheDTO
 from tests.unit.api.book_search.helper import create_book
 
+FRESH_UNTIL = datetime(2099, 1, 1, tzinfo=timezone.utc)
+
 
 def test_parse_oreilly_catalog_extracts_table_books():
     html = """
@@ -104,6 +112,58 @@ def test_fetch_gihyo_catalog_books_reads_all_pages(monkeypatch):
     ]
 
 
+def test_fetch_gihyo_catalog_books_requests_next_page_while_parsing(monkeypatch):
+    next_page_requested = threading.Event()
+    parsed_while_fetching: list[bool] = []
+
+    def fake_fetch_json(_url: str, params: dict[str, str]):
+        if params["offset"] == "100":
+            next_page_requested.set()
+            return {"list": {}, "next": False}
+        return {"list": {}, "next": True}
+
+    def fake_parse(data: dict, _base_url: str):
+        if data["next"]:
+            parsed_while_fetching.append(next_page_requested.wait(timeout=2))
+        return [
+            target.PublisherCatalogBookAppModel(
+                isbn13="9784297157906" if data["next"] else "9784297157272",
+                title="本",
+                published_at=date(2026, 7, 28),
+            )
+        ]
+
+    monkeypatch.setattr(target, "fetch_json", fake_fetch_json)
+    monkeypatch.setattr(target, "parse_gihyo_catalog_response", fake_parse)
+
+    actual = target.fetch_gihyo_catalog_books("https://gihyo.jp/api_gh/book/genre/test", "https://gihyo.jp", 100)
+
+    assert [book.isbn13 for book in actual] == ["9784297157906", "9784297157272"]
+    assert parsed_while_fetching == [True]
+
+
+def test_gihyo_catalog_provider_fetches_genres_concurrently_in_stable_order(monkeypatch):
+    barrier = threading.Barrier(2, timeout=2)
+
+    def fake_fetch_gihyo_catalog_books(url: str, _base_url: str, _limit: int):
+        barrier.wait()
+        return [
+            target.PublisherCatalogBookAppModel(
+                isbn13="9784297150001",
+                title=f"{url}の本",
+                published_at=date(2026, 1, 1),
+            )
+        ]
+
+    monkeypatch.setattr(target, "fetch_gihyo_catalog_books", fake_fetch_gihyo_catalog_books)
+    provider = target.GihyoCatalogProvider()
+    provider.catalog_urls = ["first", "second"]
+
+    actual = provider.fetch_books()
+
+    assert [book.title for book in actual] == ["firstの本"]
+
+
 def test_gihyo_catalog_provider_merges_genres_by_newest(monkeypatch):
     def fake_fetch_gihyo_catalog_books(url: str, _base_url: str, _limit: int):
         if "first" in url:
@@ -188,9 +248,11 @@ def test_publisher_catalog_service_returns_latest_enriched_books(monkeypatch):
 
     service = target.PublisherCatalogService(FakeGoogle(), FakeOpenBd())
     service._providers = {"oreilly_japan": FakeProvider()}
-    monkeypatch.setattr(service, "_load_cache", lambda _key, allow_expired=False: None)
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: None)
+    monkeypatch.setattr(service, "_load_cache", lambda _key: None)
     monkeypatch.setattr(service, "_save_cache", lambda _key, _books: None)
     monkeypatch.setattr(service, "_load_book_metadata_cache", lambda _isbns: {})
+    monkeypatch.setattr(service, "_load_unknown_isbn13s", lambda _isbns: set())
     monkeypatch.setattr(service, "_save_book_metadata_cache", lambda _books: None)
 
     actual = service.search_books("oreilly_japan", limit=1)
@@ -219,10 +281,11 @@ def test_publisher_catalog_service_filters_catalog_books(monkeypatch):
 
     service = target.PublisherCatalogService(google=FakeGoogle(), openbd=FakeOpenBd())
     service._providers = {"oreilly_japan": FakeProvider()}
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: (datetime(2026, 6, 1, tzinfo=timezone.utc), FRESH_UNTIL))
     monkeypatch.setattr(
         service,
-        "_load_cache",
-        lambda _key, allow_expired=False: [
+        "_load_catalog_rows",
+        lambda _key: [
             target.PublisherCatalogBookAppModel(
                 isbn13="9784814401703",
                 title="エンジニアリング戦略の作り方",
@@ -236,6 +299,7 @@ def test_publisher_catalog_service_filters_catalog_books(monkeypatch):
             ],
     )
     monkeypatch.setattr(service, "_load_book_metadata_cache", lambda _isbns: {})
+    monkeypatch.setattr(service, "_load_unknown_isbn13s", lambda _isbns: set())
     monkeypatch.setattr(service, "_save_book_metadata_cache", lambda _books: None)
 
     actual = service.search_books("oreilly_japan", keyword="Python", limit=40)
@@ -281,6 +345,7 @@ def test_publisher_catalog_service_returns_requested_page(monkeypatch):
     }
     service = target.PublisherCatalogService(google=FakeGoogle(), openbd=FakeOpenBd())
     service._providers = {"oreilly_japan": FakeProvider()}
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: None)
     monkeypatch.setattr(service, "_load_cache", lambda _key, allow_expired=False: catalog_books)
     monkeypatch.setattr(
         service,
@@ -296,6 +361,95 @@ def test_publisher_catalog_service_returns_requested_page(monkeypatch):
     assert actual.total_count == 3
 
 
+def test_publisher_catalog_service_rebuilds_search_index_only_when_catalog_changes(monkeypatch):
+    class FakeProvider:
+        publisher_id = "gihyo"
+        publisher_name = "技術評論社"
+        cache_key = "gihyo_catalog"
+
+    catalog_books = [
+        target.PublisherCatalogBookAppModel(
+            isbn13="9784297000001",
+            title="ﾊﾟｲｿﾝ ではじめる機械学習",
+            published_at=date(2026, 1, 1),
+        ),
+        target.PublisherCatalogBookAppModel(
+            isbn13="9784297000002",
+            title="パイソン実践入門",
+            published_at=date(2026, 3, 1),
+        ),
+        target.PublisherCatalogBookAppModel(
+            isbn13="9784297000003",
+            title="Ｇｏ言語入門",
+            published_at=date(2026, 2, 1),
+        ),
+    ]
+    versions = [datetime(2026, 6, 1, tzinfo=timezone.utc)]
+    load_calls = 0
+
+    def fake_load_catalog_rows(_key):
+        nonlocal load_calls
+        load_calls += 1
+        return catalog_books
+
+    service = target.PublisherCatalogService(google=object(), openbd=object())
+    service._providers = {"gihyo": FakeProvider()}
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: (versions[-1], FRESH_UNTIL))
+    monkeypatch.setattr(service, "_load_catalog_rows", fake_load_catalog_rows)
+    monkeypatch.setattr(service, "_enrich_books", lambda books, _publisher_name: [create_book(isbn13=book.isbn13) for book in books])
+
+    by_hiragana = service.search_books("gihyo", keyword="ぱいそん")
+    by_fullwidth = service.search_books("gihyo", keyword="go")
+    by_isbn = service.search_books("gihyo", keyword="9784297000003")
+    versions.append(datetime(2026, 6, 2, tzinfo=timezone.utc))
+    service.search_books("gihyo", keyword="入門")
+
+    assert [book.isbn13 for book in by_hiragana.books] == ["9784297000002", "9784297000001"]
+    assert [book.isbn13 for book in by_fullwidth.books] == ["9784297000003"]
+    assert [book.isbn13 for book in by_isbn.books] == ["9784297000003"]
+    assert load_calls == 2
+
+
+def test_publisher_catalog_service_pages_memoized_catalog_snapshot(monkeypatch):
+    class FakeProvider:
+        publisher_id = "oreilly_japan"
+        publisher_name = "オライリー・ジャパン"
+        cache_key = "oreilly_japan_catalog"
+
+    catalog_books = [
+        target.PublisherCatalogBookAppModel(
+            isbn13=f"978481440000{index}",
+            title=f"本{index}",
+            published_at=date(2026, index, 1),
+        )
+        for index in range(1, 4)
+    ]
+    load_calls = 0
+
+    def fake_load_catalog_rows(_key):
+        nonlocal load_calls
+        load_calls += 1
+        return catalog_books
+
+    def fail_get_catalog_books(_provider):
+        raise AssertionError("a fresh catalog should be paged from the snapshot")
+
+    service = target.PublisherCatalogService(google=object(), openbd=object())
+    service._providers = {"oreilly_japan": FakeProvider()}
+    monkeypatch.setattr(
+        service, "_load_catalog_version", lambda _key: (datetime(2026, 6, 1, tzinfo=timezone.utc), FRESH_UNTIL)
+    )
+    monkeypatch.setattr(service, "_load_catalog_rows", fake_load_catalog_rows)
+    monkeypatch.setattr(service, "_get_catalog_books", fail_get_catalog_books)
+    monkeypatch.setattr(service, "_enrich_books", lambda books, _publisher_name: [create_book(isbn13=book.isbn13) for book in books])
+
+    pages = [service.search_books("oreilly_japan", page=page, limit=1) for page in range(1, 4)]
+
+    assert [page.books[0].isbn13 for page in pages] == ["9784814400003", "9784814400002", "9784814400001"]
+    assert [page.total_count for page in pages] == [3, 3, 3]
+    assert load_calls == 1
+
+
 def test_publisher_catalog_service_uses_book_metadata_cache(monkeypatch):
     cached_book = create_book(
         source="openbd",
@@ -320,6 +474,7 @@ def test_publisher_catalog_service_uses_book_metadata_cache(monkeypatch):
 
     service = target.PublisherCatalogService(google=FakeGoogle(), openbd=FakeOpenBd())
     service._providers = {"oreilly_japan": FakeProvider()}
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: None)
     monkeypatch.setattr(
         service,
         "_load_cache",
@@ -374,6 +529,7 @@ def test_publisher_catalog_service_supplements_cached_book_without_image(monkeyp
 
     service = target.PublisherCatalogService(google=FakeGoogle(), openbd=FakeOpenBd())
     service._providers = {"oreilly_japan": FakeProvider()}
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: None)
     monkeypatch.setattr(
         service,
         "_load_cache",
@@ -484,7 +640,15 @@ def test_publisher_catalog_service_warms_candidates_in_batches(monkeypatch):
         for index in range(1, 4)
     ]
     batches: list[list[str]] = []
-    service = target.PublisherCatalogService(google=object(), openbd=object())
+    openbd_calls: list[list[str]] = []
+    openbd_books = {"9784814400002": create_book(isbn13="9784814400002", source="openbd")}
+
+    class FakeOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            openbd_calls.append(isbn13s)
+            return openbd_books
+
+    service = target.PublisherCatalogService(google=object(), openbd=FakeOpenBd())
     service._providers = {"oreilly_japan": FakeProvider()}
     monkeypatch.setattr(service, "_get_catalog_books", lambda _provider: catalog_books)
     monkeypatch.setattr(
@@ -493,9 +657,10 @@ def test_publisher_catalog_service_warms_candidates_in_batches(monkeypatch):
         lambda _books, _refresh_before: catalog_books,
     )
 
-    def fake_enrich(books, _publisher_name, force_refresh=False, google_delay_seconds=0):
+    def fake_enrich(books, _publisher_name, force_refresh=False, google_delay_seconds=0, prefetched_openbd_books=None):
         assert force_refresh
         assert google_delay_seconds == 0
+        assert prefetched_openbd_books is openbd_books
         batches.append([book.isbn13 for book in books])
         return [create_book(isbn13=book.isbn13) for book in books]
 
@@ -510,6 +675,7 @@ def test_publisher_catalog_service_warms_candidates_in_batches(monkeypatch):
     )
 
     assert batches == [["9784814400001", "9784814400002"], ["9784814400003"]]
+    assert openbd_calls == [["9784814400001", "9784814400002", "9784814400003"]]
     assert actual == target.MetadataCacheWarmupResult(
         catalog_count=3,
         candidate_count=3,
@@ -532,7 +698,11 @@ def test_publisher_catalog_service_continues_after_failed_batch(monkeypatch):
         )
         for index in range(1, 3)
     ]
-    service = target.PublisherCatalogService(google=object(), openbd=object())
+    class EmptyOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            return {}
+
+    service = target.PublisherCatalogService(google=object(), openbd=EmptyOpenBd())
     service._providers = {"oreilly_japan": FakeProvider()}
     monkeypatch.setattr(service, "_get_catalog_books", lambda _provider: catalog_books)
     monkeypatch.setattr(
@@ -542,7 +712,7 @@ def test_publisher_catalog_service_continues_after_failed_batch(monkeypatch):
     )
     calls = 0
 
-    def fake_enrich(books, _publisher_name, force_refresh=False, google_delay_seconds=0):
+    def fake_enrich(books, _publisher_name, force_refresh=False, google_delay_seconds=0, prefetched_openbd_books=None):
         nonlocal calls
         calls += 1
         if calls == 1:
@@ -561,3 +731,384 @@ def test_publisher_catalog_service_continues_after_failed_batch(monkeypatch):
 
     assert actual.refreshed_count == 1
     assert actual.failed_count == 1
+
+
+def test_publisher_catalog_service_resumes_warmup_from_checkpoint(monkeypatch):
+    class FakeProvider:
+        publisher_id = "oreilly_japan"
+        publisher_name = "オライリー・ジャパン"
+        cache_key = "oreilly_japan_catalog"
+
+    catalog_books = [
+        target.PublisherCatalogBookAppModel(
+            isbn13=f"978481440000{index}",
+            title=f"本{index}",
+            published_at=date(2026, index, 1),
+        )
+        for index in range(5, 0, -1)
+    ]
+    refreshed_isbns: set[str] = set()
+    checkpoints: dict[tuple[str, str], target.MetadataWarmupCheckpoint] = {}
+    cutoffs: list[datetime] = []
+    batches: list[list[str]] = []
+    progress: list[target.MetadataWarmupProgress] = []
+    class EmptyOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            return {}
+
+    service = target.PublisherCatalogService(google=object(), openbd=EmptyOpenBd())
+    service._providers = {"oreilly_japan": FakeProvider()}
+    monkeypatch.setattr(service, "_get_catalog_books", lambda _provider: catalog_books)
+    monkeypatch.setattr(service, "_load_warmup_checkpoint", lambda run_id, publisher_id: checkpoints.get((run_id, publisher_id)))
+    monkeypatch.setattr(
+        service,
+        "_save_warmup_checkpoint",
+        lambda run_id, publisher_id, checkpoint: checkpoints.__setitem__((run_id, publisher_id), checkpoint),
+    )
+
+    def fake_candidates(books, refresh_before):
+        cutoffs.append(refresh_before)
+        return [book for book in books if book.isbn13 not in refreshed_isbns]
+
+    monkeypatch.setattr(service, "_find_metadata_refresh_candidates", fake_candidates)
+    fail_isbn = "9784814400003"
+
+    def fake_enrich(books, _publisher_name, force_refresh=False, google_delay_seconds=0, prefetched_openbd_books=None):
+        batches.append([book.isbn13 for book in books])
+        if fail_isbn in batches[-1]:
+            raise OSError("killed")
+        refreshed_isbns.update(batches[-1])
+        return [create_book(isbn13=book.isbn13) for book in books]
+
+    monkeypatch.setattr(service, "_enrich_books", fake_enrich)
+
+    def warm():
+        return service.warm_metadata_cache(
+            "oreilly_japan",
+            refresh_after_days=14,
+            batch_size=2,
+            google_delay_seconds=0,
+            batch_delay_seconds=0,
+            run_id="nightly",
+            on_progress=progress.append,
+        )
+
+    first = warm()
+    fail_isbn = None
+    second = warm()
+    third = warm()
+
+    assert batches == [
+        ["9784814400001", "9784814400002"],
+        ["9784814400003", "9784814400004"],
+        ["9784814400005"],
+        ["9784814400003", "9784814400004"],
+    ]
+    assert cutoffs[0] == cutoffs[1]
+    assert first == target.MetadataCacheWarmupResult(catalog_count=5, candidate_count=5, refreshed_count=3, failed_count=2)
+    assert second == target.MetadataCacheWarmupResult(catalog_count=5, candidate_count=4, refreshed_count=4, failed_count=0)
+    assert third == second
+    assert progress[-1] == target.MetadataWarmupProgress(
+        publisher_id="oreilly_japan",
+        candidate_count=4,
+        resumed_count=2,
+        processed_count=4,
+        refreshed_count=4,
+        failed_count=0,
+    )
+    assert checkpoints[("nightly", "oreilly_japan")].completed
+
+
+def test_publisher_catalog_service_does_not_cache_fallback_when_google_fails(monkeypatch):
+    class FakeOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            return {}
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            raise target.BookSearchRateLimitError()
+
+    catalog_book = target.PublisherCatalogBookAppModel(
+        isbn13="9784814401703",
+        title="エンジニアリング戦略の作り方",
+        published_at=date(2026, 5, 22),
+    )
+    saved_books: list[target.BookSearchResultAppModel] = []
+    service = target.PublisherCatalogService(google=FakeGoogle(), openbd=FakeOpenBd())
+    monkeypatch.setattr(service, "_load_book_metadata_cache", lambda _isbns: {})
+    monkeypatch.setattr(service, "_load_unknown_isbn13s", lambda _isbns: set())
+    monkeypatch.setattr(service, "_save_book_metadata_cache", saved_books.extend)
+
+    actual = service._enrich_books([catalog_book], "オライリー・ジャパン")
+
+    assert [book.title for book in actual] == ["エンジニアリング戦略の作り方"]
+    assert saved_books == []
+
+
+def test_publisher_catalog_service_skips_providers_for_negative_cached_isbns():
+    openbd_calls: list[list[str]] = []
+    google_calls: list[str] = []
+
+    class FakeOpenBd:
+        def find_by_isbn13s(self, isbn13s: list[str]):
+            openbd_calls.append(isbn13s)
+            return {isbn13: create_book(source="openbd", isbn13=isbn13) for isbn13 in isbn13s}
+
+    class FakeGoogle:
+        def find_by_isbn13(self, isbn13: str):
+            google_calls.append(isbn13)
+            return None
+
+    catalog_books = [
+        target.PublisherCatalogBookAppModel(isbn13="9784814401703", title="既知の本", published_at=date(2026, 5, 22)),
+        target.PublisherCatalogBookAppModel(isbn13="9784814409999", title="未知の本", published_at=date(2026, 5, 1)),
+    ]
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    BookMetadataCacheDTO.__table__.create(engine)
+    metadata_cache = target.BookMetadataCache(sessionmaker(engine))
+    metadata_cache.save_unknown(["9784814409999"])
+    service = target.PublisherCatalogService(google=FakeGoogle(), openbd=FakeOpenBd(), metadata_cache=metadata_cache)
+
+    actual = service._enrich_books(catalog_books, "オライリー・ジャパン")
+    metadata_cache.clear_memory()
+
+    assert openbd_calls == [["9784814401703"]]
+    assert google_calls == []
+    assert [(book.source, book.title) for book in actual] == [("openbd", "テスト本"), ("publisher-catalog", "未知の本")]
+    assert metadata_cache.get_unknown(["9784814401703", "9784814409999"]) == {"9784814409999"}
+    assert list(metadata_cache.get_many(["9784814401703", "9784814409999"])) == ["9784814401703"]
+
+
+def test_metadata_cache_needs_refresh_keeps_negative_entries_until_they_expire():
+    now = datetime.now(timezone.utc)
+    refresh_before = now - timedelta(days=14)
+    fresh = SimpleNamespace(status="not_found", payload_json="{}", fetched_at=now, expires_at=now + timedelta(hours=1))
+    expired = SimpleNamespace(status="not_found", payload_json="{}", fetched_at=now, expires_at=now - timedelta(hours=1))
+
+    assert not target.metadata_cache_needs_refresh(fresh, refresh_before)
+    assert target.metadata_cache_needs_refresh(expired, refresh_before)
+
+
+def test_publisher_catalog_service_serves_stale_catalog_and_refreshes_once_in_background(monkeypatch):
+    fetch_calls = 0
+
+    class FakeProvider(target.PublisherCatalogProvider):
+        publisher_id = "gihyo"
+        publisher_name = "技術評論社"
+        cache_key = "gihyo_catalog"
+
+        def fetch_books(self):
+            nonlocal fetch_calls
+            fetch_calls += 1
+            return [target.PublisherCatalogBookAppModel(isbn13="9784297000002", title="新しい本", published_at=date(2026, 6, 1))]
+
+    stale_book = target.PublisherCatalogBookAppModel(isbn13="9784297000001", title="古い本", published_at=date(2026, 1, 1))
+    stale_version = (datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 4, tzinfo=timezone.utc))
+    background: list = []
+    saved: list = []
+    lock_names: list[str] = []
+    service = target.PublisherCatalogService(google=object(), openbd=object())
+    service._providers = {"gihyo": FakeProvider()}
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: stale_version)
+    monkeypatch.setattr(service, "_load_catalog_rows", lambda _key: [stale_book])
+    monkeypatch.setattr(service, "_submit_background", background.append)
+    monkeypatch.setattr(service, "_load_catalog_validators", lambda _key: target.CatalogValidators())
+    monkeypatch.setattr(service, "_save_cache", lambda key, books, _validators=None: saved.append((key, books)))
+    monkeypatch.setattr(service, "_try_acquire_lock", lambda name, _ttl: lock_names.append(name) or True)
+    monkeypatch.setattr(service, "_release_lock", lambda _name: None)
+    monkeypatch.setattr(service, "_enrich_books", lambda books, _publisher_name: [create_book(isbn13=book.isbn13) for book in books])
+
+    first = service.search_books("gihyo")
+    second = service.search_books("gihyo", keyword="古い")
+
+    assert [book.isbn13 for book in first.books] == ["9784297000001"]
+    assert [book.isbn13 for book in second.books] == ["9784297000001"]
+    assert fetch_calls == 0
+    assert len(background) == 1
+
+    background[0]()
+
+    assert fetch_calls == 1
+    assert lock_names == ["publisher_catalog_refresh:gihyo_catalog"]
+    assert [book.isbn13 for book in saved[0][1]] == ["9784297000002"]
+    assert service._refreshing_sources == set()
+
+
+def test_publisher_catalog_service_skips_refresh_when_another_worker_holds_lock(monkeypatch):
+    class FakeProvider:
+        publisher_id = "gihyo"
+        publisher_name = "技術評論社"
+        cache_key = "gihyo_catalog"
+
+        def fetch_books(self):
+            raise AssertionError("only the lock holder should scrape the catalog")
+
+    service = target.PublisherCatalogService(google=object(), openbd=object())
+    monkeypatch.setattr(service, "_try_acquire_lock", lambda _name, _ttl: False)
+
+    service._refresh_catalog(FakeProvider())
+
+
+class FakeStream:
+    def __init__(self, status: int, headers: dict[str, str], chunks: list[str]):
+        self.status = status
+        self.headers = headers
+        self.chunks = chunks
+        self.closed = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc_info):
+        self.closed = True
+
+    def iter_text(self):
+        for chunk in self.chunks:
+            if chunk is None:
+                raise AssertionError("read past the item limit")
+            yield chunk
+
+
+def create_oreilly_row(isbn13: str, title: str) -> str:
+    return f"<tr><td>{isbn13}</td><td><a href='/books/{isbn13}/'>{title}</a></td><td>3,960</td><td>2026/05/22</td></tr>"
+
+
+def test_iter_oreilly_catalog_parses_rows_split_across_chunks():
+    html = "<table>" + create_oreilly_row("9784814401703", "分割される本") + create_oreilly_row("9784814400003", "次の本")
+    chunks = [html[index : index + 7] for index in range(0, len(html), 7)] + ["</table>"]
+
+    actual = target.iter_oreilly_catalog(chunks, "https://www.oreilly.co.jp/catalog/")
+
+    assert next(actual).title == "分割される本"
+    assert [book.isbn13 for book in actual] == ["9784814400003"]
+
+
+def test_oreilly_catalog_provider_streams_until_item_limit(monkeypatch):
+    stream = FakeStream(
+        200,
+        {"etag": '"v1"', "last-modified": "Wed, 01 Jul 2026 00:00:00 GMT"},
+        ["<table>" + create_oreilly_row("9784814401703", "本1"), create_oreilly_row("9784814400003", "本2"), None],
+    )
+    monkeypatch.setattr(target, "open_fetch_stream", lambda _url, _headers: stream)
+    monkeypatch.setattr(target, "PUBLISHER_CATALOG_MAX_ITEMS", 2)
+
+    actual = target.OreillyCatalogProvider().fetch_catalog(target.CatalogValidators())
+
+    assert [book.isbn13 for book in actual.books] == ["9784814401703", "9784814400003"]
+    assert actual.validators.etag == '"v1"'
+    assert actual.validators.content_hash == target.hash_catalog_books(actual.books)
+    assert stream.closed
+
+
+def test_oreilly_catalog_provider_sends_validators_and_skips_unchanged_catalog(monkeypatch):
+    html = "<table>" + create_oreilly_row("9784814401703", "本") + "</table>"
+    book = target.parse_oreilly_catalog(html, target.OreillyCatalogProvider.catalog_url)
+    requests: list = []
+    streams = [
+        FakeStream(304, {}, []),
+        FakeStream(200, {"etag": '"v2"'}, [html]),
+    ]
+
+    def fake_open_fetch_stream(_url: str, headers: dict[str, str]):
+        requests.append(headers)
+        return streams.pop(0)
+
+    monkeypatch.setattr(target, "open_fetch_stream", fake_open_fetch_stream)
+    provider = target.OreillyCatalogProvider()
+    validators = target.CatalogValidators('"v1"', "Wed, 01 Jul 2026 00:00:00 GMT", target.hash_catalog_books(book))
+
+    first = provider.fetch_catalog(validators)
+    second = provider.fetch_catalog(validators)
+
+    assert requests == [
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jul 2026 00:00:00 GMT"},
+        {"If-None-Match": '"v1"', "If-Modified-Since": "Wed, 01 Jul 2026 00:00:00 GMT"},
+    ]
+    assert first == target.CatalogFetchResult(None, validators)
+    assert second == target.CatalogFetchResult(None, target.CatalogValidators('"v2"', None, validators.content_hash))
+
+
+def test_diff_catalog_books_reports_added_removed_and_changed_isbns():
+    previous = [
+        target.PublisherCatalogBookAppModel(isbn13="9784297000001", title="残る本", published_at=date(2026, 1, 1)),
+        target.PublisherCatalogBookAppModel(isbn13="9784297000002", title="消える本", published_at=date(2026, 1, 1)),
+        target.PublisherCatalogBookAppModel(isbn13="9784297000003", title="旧題", published_at=date(2026, 1, 1)),
+    ]
+    current = [
+        target.PublisherCatalogBookAppModel(isbn13="9784297000004", title="新刊", published_at=date(2026, 7, 1)),
+        target.PublisherCatalogBookAppModel(isbn13="9784297000003", title="新題", published_at=date(2026, 1, 1)),
+        target.PublisherCatalogBookAppModel(isbn13="9784297000001", title="残る本", published_at=date(2026, 1, 1)),
+    ]
+
+    actual = target.diff_catalog_books(previous, current)
+
+    assert actual == target.CatalogDiff(
+        added=["9784297000004"],
+        removed=["9784297000002"],
+        changed=["9784297000003"],
+    )
+    assert target.diff_catalog_books(current, list(reversed(current))).is_empty
+
+
+def test_publisher_catalog_service_extends_unchanged_catalog_without_rewriting(monkeypatch):
+    book = target.PublisherCatalogBookAppModel(isbn13="9784297000001", title="本", published_at=date(2026, 1, 1))
+
+    class FakeProvider(target.PublisherCatalogProvider):
+        publisher_id = "gihyo"
+        publisher_name = "技術評論社"
+        cache_key = "gihyo_catalog"
+
+        def fetch_books(self):
+            return [book]
+
+    extended: list = []
+    service = target.PublisherCatalogService(google=object(), openbd=object())
+    monkeypatch.setattr(
+        service, "_load_catalog_validators", lambda _key: target.CatalogValidators(content_hash=target.hash_catalog_books([book]))
+    )
+    monkeypatch.setattr(service, "_extend_cache", lambda key, validators: extended.append((key, validators)))
+    monkeypatch.setattr(service, "_save_cache", lambda *_args: (_ for _ in ()).throw(AssertionError("rewritten")))
+
+    actual = service._update_catalog(FakeProvider())
+
+    assert actual is None
+    assert extended == [("gihyo_catalog", target.CatalogValidators(content_hash=target.hash_catalog_books([book])))]
+
+
+def test_publisher_catalog_service_refresh_enriches_only_added_books(monkeypatch):
+    old_book = target.PublisherCatalogBookAppModel(isbn13="9784297000001", title="既刊", published_at=date(2026, 1, 1))
+    new_book = target.PublisherCatalogBookAppModel(isbn13="9784297000002", title="新刊", published_at=date(2026, 7, 1))
+    rows = [old_book]
+
+    class FakeProvider(target.PublisherCatalogProvider):
+        publisher_id = "gihyo"
+        publisher_name = "技術評論社"
+        cache_key = "gihyo_catalog"
+
+        def fetch_books(self):
+            return [new_book, old_book]
+
+    versions = [(datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 1, 1, tzinfo=timezone.utc))]
+    enriched: list[list[str]] = []
+
+    def fake_save_cache(_key, books, _validators=None):
+        rows[:] = books
+        versions.append((datetime(2026, 7, 1, tzinfo=timezone.utc), FRESH_UNTIL))
+
+    service = target.PublisherCatalogService(google=object(), openbd=object())
+    monkeypatch.setattr(service, "_load_catalog_version", lambda _key: versions[-1])
+    monkeypatch.setattr(service, "_load_catalog_rows", lambda _key: list(rows))
+    monkeypatch.setattr(service, "_load_catalog_validators", lambda _key: target.CatalogValidators())
+    monkeypatch.setattr(service, "_save_cache", fake_save_cache)
+    monkeypatch.setattr(service, "_try_acquire_lock", lambda _name, _ttl: True)
+    monkeypatch.setattr(service, "_release_lock", lambda _name: None)
+    monkeypatch.setattr(
+        service,
+        "_enrich_books",
+        lambda books, _publisher_name: enriched.append([book.isbn13 for book in books]) or [],
+    )
+
+    service._refresh_catalog(FakeProvider())
+
+    assert [book.isbn13 for book in rows] == ["9784297000002", "9784297000001"]
+    assert enriched == [["9784297000002"]]
@@ -0,0 +1,49 @@
+from datetime import date, datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from bookshelf_app.infra.db import book_search as target
+
+
+def create_session() -> Session:
+    engine = create_engine("sqlite://")
+    target.PublisherCatalogCacheDTO.__table__.create(engine)
+    target.PublisherCatalogBookDTO.__table__.create(engine)
+    return Session(engine)
+
+
+def create_row(position: int, isbn13: str, title: str, published_at: date, source_key: str = "gihyo_catalog") -> dict:
+    return {
+        "source_key": source_key,
+        "isbn13": isbn13,
+        "position": position,
+        "title": title,
+        "published_at": published_at,
+        "price": None,
+        "source_url": None,
+        "is_deleted": False,
+    }
+
+
+def save_catalog(session: Session, source_key: str, rows: list[dict]) -> None:
+    now = datetime(2026, 6, 1, tzinfo=timezone.utc)
+    target.upsert_publisher_catalog_caches(
+        session,
+        [{"source_key": source_key, "fetched_at": now, "expires_at": now, "is_deleted": False}],
+    )
+    target.replace_publisher_catalog_books(session, source_key, rows)
+    session.commit()
+
+
+def test_replace_publisher_catalog_books_replaces_only_one_source():
+    with create_session() as session:
+        save_catalog(session, "gihyo_catalog", [create_row(0, "9784297000001", "古い本", date(2026, 1, 1))])
+        save_catalog(session, "oreilly_japan_catalog", [create_row(0, "9784814400001", "別の本", date(2026, 1, 1), "oreilly_japan_catalog")])
+        save_catalog(session, "gihyo_catalog", [create_row(0, "9784297000002", "新しい本", date(2026, 2, 1))])
+
+        gihyo = target.load_publisher_catalog_books(session, "gihyo_catalog")
+        oreilly = target.load_publisher_catalog_books(session, "oreilly_japan_catalog")
+
+    assert [row.title for row in gihyo] == ["新しい本"]
+    assert [row.title for row in oreilly] == ["別の本"]
@@ -0,0 +1,31 @@
+from bookshelf_app.infra import dependencies as target
+
+
+def test_get_book_search_service_returns_process_wide_instance(monkeypatch):
+    closed: list[object] = []
+
+    class FakeBookSearchService:
+        def close(self):
+            closed.append(self)
+
+    target.get_book_search_service.cache_clear()
+    monkeypatch.setattr(target, "BookSearchService", FakeBookSearchService)
+    try:
+        first = target.get_book_search_service()
+        second = target.get_book_search_service()
+        target.close_book_search_service()
+    finally:
+        target.get_book_search_service.cache_clear()
+
+    assert first is second
+    assert closed == [first]
+
+
+def test_close_book_search_service_does_nothing_before_first_use(monkeypatch):
+    def fail():
+        raise AssertionError("service should not be created on shutdown")
+
+    target.get_book_search_service.cache_clear()
+    monkeypatch.setattr(target, "BookSearchService", fail)
+
+    target.close_book_search_service()
@@ -0,0 +1,142 @@
+from datetime import date, datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import Session
+
+from bookshelf_app.infra.db import enrichment_job as target
+
+
+def create_session() -> Session:
+    engine = create_engine("sqlite://")
+    target.BookEnrichmentJobDTO.__table__.create(engine)
+    return Session(engine)
+
+
+def create_row(isbn13: str, title: str = "本") -> dict:
+    return {
+        "isbn13": isbn13,
+        "publisher_name": "技術評論社",
+        "title": title,
+        "published_at": date(2026, 1, 1),
+        "price": None,
+        "source_url": None,
+    }
+
+
+def expire_claims(session: Session) -> None:
+    session.execute(
+        update(target.BookEnrichmentJobDTO).values(available_at=datetime.now(timezone.utc) - timedelta(seconds=1))
+    )
+    session.commit()
+
+
+def test_enqueue_enrichment_jobs_keeps_one_job_per_isbn():
+    with create_session() as session:
+        first = target.enqueue_enrichment_jobs(session, [create_row("9784297000001"), create_row("9784297000001", "重複")])
+        second = target.enqueue_enrichment_jobs(session, [create_row("9784297000001"), create_row("9784297000002")])
+
+        titles = dict(session.execute(select(target.BookEnrichmentJobDTO.isbn13, target.BookEnrichmentJobDTO.title)).all())
+
+    assert (first, second) == (1, 1)
+    assert titles == {"9784297000001": "重複", "9784297000002": "本"}
+
+
+def test_claim_enrichment_jobs_hides_claimed_jobs_until_visibility_timeout():
+    with create_session() as session:
+        target.enqueue_enrichment_jobs(session, [create_row("9784297000001"), create_row("9784297000002")])
+
+        first = target.claim_enrichment_jobs(session, "worker-1", limit=1, visibility_timeout_seconds=60)
+        second = target.claim_enrichment_jobs(session, "worker-2", limit=10, visibility_timeout_seconds=60)
+        third = target.claim_enrichment_jobs(session, "worker-3", limit=10, visibility_timeout_seconds=60)
+        expire_claims(session)
+        reclaimed = target.claim_enrichment_jobs(session, "worker-4", limit=10, visibility_timeout_seconds=60)
+
+        assert [job.isbn13 for job in first] == ["9784297000001"]
+        assert [job.isbn13 for job in second] == ["9784297000002"]
+        assert third == []
+        assert sorted(job.isbn13 for job in reclaimed) == ["9784297000001", "9784297000002"]
+        assert {job.attempts for job in reclaimed} == {2}
+
+
+def test_complete_enrichment_jobs_only_removes_own_claim():
+    with create_session() as session:
+        target.enqueue_enrichment_jobs(session, [create_row("9784297000001")])
+        target.claim_enrichment_jobs(session, "worker-1", limit=1, visibility_timeout_seconds=60)
+        expire_claims(session)
+        target.claim_enrichment_jobs(session, "worker-2", limit=1, visibility_timeout_seconds=60)
+
+        target.complete_enrichment_jobs(session, "worker-1", ["9784297000001"])
+        assert target.count_enrichment_jobs(session) == {"pending": 1}
+
+        target.complete_enrichment_jobs(session, "worker-2", ["9784297000001"])
+        assert target.count_enrichment_jobs(session) == {}
+
+
+def test_retry_enrichment_jobs_backs_off_and_gives_up_after_max_attempts():
+    with create_session() as session:
+        target.enqueue_enrichment_jobs(session, [create_row("9784297000001")])
+        target.claim_enrichment_jobs(session, "worker-1", limit=1, visibility_timeout_seconds=60)
+        before = datetime.now(timezone.utc).replace(tzinfo=None)
+
+        target.retry_enrichment_jobs(
+            session, "worker-1", ["9784297000001"], "timeout", max_attempts=2, base_delay_seconds=30, max_delay_seconds=60
+        )
+        job = session.get(target.BookEnrichmentJobDTO, "9784297000001")
+        assert job.status == "pending"
+        assert job.last_error == "timeout"
+        assert job.available_at.replace(tzinfo=None) >= before + timedelta(seconds=29)
+        assert target.claim_enrichment_jobs(session, "worker-2", limit=1, visibility_timeout_seconds=60) == []
+
+        expire_claims(session)
+        target.claim_enrichment_jobs(session, "worker-3", limit=1, visibility_timeout_seconds=60)
+        target.retry_enrichment_jobs(
+            session, "worker-3", ["9784297000001"], "timeout", max_attempts=2, base_delay_seconds=30, max_delay_seconds=60
+        )
+        expire_claims(session)
+
+        assert target.count_enrichment_jobs(session) == {"failed": 1}
+        assert target.claim_enrichment_jobs(session, "worker-4", limit=1, visibility_timeout_seconds=60) == []
+
+
+def test_enqueue_enrichment_jobs_retries_failed_jobs_after_cooldown():
+    with create_session() as session:
+        target.enqueue_enrichment_jobs(session, [create_row("9784297000001"), create_row("9784297000002")])
+        target.claim_enrichment_jobs(session, "worker-1", limit=2, visibility_timeout_seconds=60)
+        target.retry_enrichment_jobs(
+            session,
+            "worker-1",
+            ["9784297000001", "9784297000002"],
+            "timeout",
+            max_attempts=1,
+            base_delay_seconds=30,
+            max_delay_seconds=60,
+        )
+
+        assert target.enqueue_enrichment_jobs(session, [create_row("9784297000001")]) == 0
+        assert target.count_enrichment_jobs(session) == {"failed": 2}
+
+        failed_at = datetime.now(timezone.utc) - target.ENRICHMENT_JOB_FAILED_COOLDOWN
+        session.execute(update(target.BookEnrichmentJobDTO).values(available_at=failed_at))
+        session.commit()
+        assert target.enqueue_enrichment_jobs(session, [create_row("9784297000001")]) == 1
+
+        job = session.get(target.BookEnrichmentJobDTO, "9784297000001")
+        assert (job.status, job.attempts, job.claimed_by) == ("pending", 0, None)
+        assert target.count_enrichment_jobs(session) == {"pending": 1, "failed": 1}
+
+
+def test_enqueue_enrichment_jobs_purges_failed_jobs_after_retention():
+    with create_session() as session:
+        target.enqueue_enrichment_jobs(session, [create_row("9784297000001")])
+        target.claim_enrichment_jobs(session, "worker-1", limit=1, visibility_timeout_seconds=60)
+        target.retry_enrichment_jobs(
+            session, "worker-1", ["9784297000001"], "timeout", max_attempts=1, base_delay_seconds=30, max_delay_seconds=60
+        )
+        stale = datetime.now(timezone.utc) - target.ENRICHMENT_JOB_FAILED_RETENTION - timedelta(seconds=1)
+        session.execute(update(target.BookEnrichmentJobDTO).values(available_at=stale))
+        session.commit()
+
+        target.enqueue_enrichment_jobs(session, [create_row("9784297000002")])
+
+        assert session.get(target.BookEnrichmentJobDTO, "9784297000001") is None
+        assert target.count_enrichment_jobs(session) == {"pending": 1}
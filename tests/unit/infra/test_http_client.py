@@ -0,0 +1,172 @@
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import socket
+import threading
+
+import pytest
+
+from bookshelf_app.infra.other import http_client as target
+
+
+class FakeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    client_ports: list[int] = []
+
+    def do_GET(self):
+        self.client_ports.append(self.client_address[1])
+        if self.path.startswith("/gzip"):
+            body = gzip.compress(json.dumps({"compressed": True}).encode("utf-8"))
+            self._send(200, body, {"Content-Encoding": "gzip"})
+        elif self.path.startswith("/large"):
+            body = ("本" * 50_000).encode("utf-8")
+            self._send(200, gzip.compress(body) if "gzip" in self.path else body, {"Content-Encoding": "gzip"} if "gzip" in self.path else None)
+        elif self.path.startswith("/limited"):
+            self._send(429, b"too many requests", {"Retry-After": "3"})
+        else:
+            self._send(200, json.dumps({"path": self.path, "encoding": self.headers["Accept-Encoding"]}).encode())
+
+    def do_POST(self):
+        self.client_ports.append(self.client_address[1])
+        body = self.rfile.read(int(self.headers["Content-Length"])).decode("ascii")
+        self._send(200, json.dumps({"path": self.path, "type": self.headers["Content-Type"], "body": body}).encode())
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str] | None = None):
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+@pytest.fixture
+def base_url():
+    FakeHandler.client_ports = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_reuses_keep_alive_connection(base_url):
+    client = target.HttpClient()
+
+    first = client.get(f"{base_url}/first", {"q": "本"}).json()
+    second = client.get(f"{base_url}/second").json()
+    client.close()
+
+    assert first["path"] == "/first?q=%E6%9C%AC"
+    assert first["encoding"] == "gzip"
+    assert second["path"] == "/second"
+    assert len(set(FakeHandler.client_ports)) == 1
+
+
+def test_http_client_posts_form_on_pooled_connection(base_url):
+    client = target.HttpClient()
+
+    first = client.post_form(f"{base_url}/post", {"isbn": "9784798121963,9784814401703"}).json()
+    second = client.get(f"{base_url}/second").json()
+    client.close()
+
+    assert first == {
+        "path": "/post",
+        "type": "application/x-www-form-urlencoded",
+        "body": "isbn=9784798121963%2C9784814401703",
+    }
+    assert second["path"] == "/second"
+    assert len(set(FakeHandler.client_ports)) == 1
+
+
+def test_http_client_decompresses_gzip_response(base_url):
+    client = target.HttpClient()
+
+    actual = client.get(f"{base_url}/gzip").json()
+    client.close()
+
+    assert actual == {"compressed": True}
+
+
+def test_http_client_raises_status_error_with_headers(base_url):
+    client = target.HttpClient()
+
+    with pytest.raises(target.HttpStatusError) as exc_info:
+        client.get(f"{base_url}/limited")
+    client.close()
+
+    assert exc_info.value.status == 429
+    assert exc_info.value.headers["retry-after"] == "3"
+    assert exc_info.value.retry_after_seconds() == 3.0
+
+
+def test_http_client_reconnects_when_pooled_connection_is_stale(base_url):
+    client = target.HttpClient()
+    client.get(f"{base_url}/first")
+    for pool in client._pools.values():
+        idle = pool.acquire_idle()
+        idle.sock.shutdown(socket.SHUT_RDWR)
+        pool.release(idle)
+
+    actual = client.get(f"{base_url}/second").json()
+    client.close()
+
+    assert actual["path"] == "/second"
+
+
+def test_http_client_streams_text_in_chunks_and_reuses_finished_connection(base_url):
+    client = target.HttpClient()
+
+    with client.stream(f"{base_url}/large") as stream:
+        chunks = list(stream.iter_text(chunk_size=1000))
+    with client.stream(f"{base_url}/large/gzip") as stream:
+        decompressed = stream.read()
+    second = client.get(f"{base_url}/second").json()
+    client.close()
+
+    assert len(chunks) > 1
+    assert "".join(chunks) == "本" * 50_000
+    assert decompressed == ("本" * 50_000).encode("utf-8")
+    assert second["path"] == "/second"
+    assert len(set(FakeHandler.client_ports)) == 1
+
+
+def test_http_client_closes_partially_read_stream(base_url):
+    client = target.HttpClient(max_connections_per_host=1)
+
+    with client.stream(f"{base_url}/large") as stream:
+        first = next(stream.iter_bytes(chunk_size=10))
+    second = client.get(f"{base_url}/second").json()
+    client.close()
+
+    assert first == "本".encode("utf-8") * 3 + "本".encode("utf-8")[:1]
+    assert second["path"] == "/second"
+    assert len(set(FakeHandler.client_ports)) == 2
+
+
+def test_http_client_stream_raises_status_error(base_url):
+    client = target.HttpClient(max_connections_per_host=1)
+
+    with pytest.raises(target.HttpStatusError) as exc_info:
+        client.stream(f"{base_url}/limited")
+    second = client.get(f"{base_url}/second").json()
+    client.close()
+
+    assert exc_info.value.body == b"too many requests"
+    assert second["path"] == "/second"
+
+
+def test_http_client_rejects_unsupported_url():
+    with pytest.raises(ValueError):
+        target.HttpClient().get("ftp://example.com/file")
+
+
+def test_http_status_error_parses_retry_after_seconds_and_date():
+    assert target.parse_retry_after("3") == 3.0
+    assert target.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert target.parse_retry_after("invalid") is None
+    assert target.parse_retry_after(None) is None
@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session
+
+from bookshelf_app.infra.db import lock as target
+
+
+def create_session() -> Session:
+    engine = create_engine("sqlite://")
+    target.LockDTO.__table__.create(engine)
+    return Session(engine)
+
+
+def test_try_acquire_lock_allows_one_owner_at_a_time():
+    with create_session() as session:
+        assert target.try_acquire_lock(session, "refresh", "worker-1", 60)
+        assert not target.try_acquire_lock(session, "refresh", "worker-2", 60)
+        assert target.try_acquire_lock(session, "refresh", "worker-1", 60)
+
+
+def test_try_acquire_lock_takes_over_expired_lock():
+    with create_session() as session:
+        target.try_acquire_lock(session, "refresh", "worker-1", 60)
+        session.execute(
+            update(target.LockDTO).values(locked_until=datetime.now(timezone.utc) - timedelta(seconds=1))
+        )
+        session.commit()
+
+        assert target.try_acquire_lock(session, "refresh", "worker-2", 60)
+
+
+def test_release_lock_only_releases_own_lock():
+    with create_session() as session:
+        target.try_acquire_lock(session, "refresh", "worker-1", 60)
+        target.release_lock(session, "refresh", "worker-2")
+        assert not target.try_acquire_lock(session, "refresh", "worker-2", 60)
+
+        target.release_lock(session, "refresh", "worker-1")
+        assert target.try_acquire_lock(session, "refresh", "worker-2", 60)
@@ -0,0 +1,90 @@
+from bookshelf_app.infra.other import memory_cache as target
+
+
+class FakeClock:
+    now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_cache(clock: FakeClock, max_entries: int = 10, max_bytes: int = 100, ttl_seconds: float = 60):
+    return target.TtlLruCache(
+        max_entries=max_entries,
+        max_bytes=max_bytes,
+        ttl_seconds=ttl_seconds,
+        size_of=len,
+        clock=clock,
+    )
+
+
+def test_ttl_lru_cache_counts_hits_and_misses():
+    cache = create_cache(FakeClock())
+
+    cache.set("python", "result")
+
+    assert cache.get("python") == "result"
+    assert cache.get("java") is None
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 1
+    assert stats.hit_rate == 0.5
+
+
+def test_ttl_lru_cache_expires_entries():
+    clock = FakeClock()
+    cache = create_cache(clock, ttl_seconds=10)
+    cache.set("python", "result")
+
+    clock.now = 10
+
+    assert cache.get("python") is None
+    assert cache.stats().expirations == 1
+    assert cache.stats().entries == 0
+
+
+def test_ttl_lru_cache_evicts_least_recently_used_entry_by_count():
+    cache = create_cache(FakeClock(), max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+
+    cache.set("c", "3")
+
+    assert cache.get("a") == "1"
+    assert cache.get("b") is None
+    assert cache.get("c") == "3"
+    assert cache.stats().evictions == 1
+
+
+def test_ttl_lru_cache_evicts_entries_by_size():
+    cache = create_cache(FakeClock(), max_bytes=10)
+    cache.set("a", "12345")
+    cache.set("b", "12345")
+
+    cache.set("c", "123")
+
+    assert cache.get("a") is None
+    assert cache.get("b") == "12345"
+    assert cache.stats().size_bytes == 8
+
+
+def test_ttl_lru_cache_skips_value_larger_than_limit():
+    cache = create_cache(FakeClock(), max_bytes=4)
+
+    cache.set("a", "12345")
+
+    assert cache.get("a") is None
+    assert cache.stats().entries == 0
+
+
+def test_ttl_lru_cache_uses_per_entry_ttl():
+    clock = FakeClock()
+    cache = create_cache(clock, ttl_seconds=60)
+    cache.set("short", "1", ttl_seconds=5)
+    cache.set("long", "2")
+
+    clock.now = 6
+
+    assert cache.get("short") is None
+    assert cache.get("long") == "2"
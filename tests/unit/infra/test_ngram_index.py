@@ -0,0 +1,27 @@
+from bookshelf_app.infra.other import ngram_index as target
+
+
+def test_ngram_index_finds_documents_containing_query_in_order():
+    index = target.NgramIndex(["python入門", "go入門", "実践python", "python"])
+
+    assert index.search("python") == [0, 2, 3]
+    assert index.search("入門") == [0, 1]
+    assert index.search("n") == [0, 2, 3]
+
+
+def test_ngram_index_confirms_long_queries_are_contiguous():
+    index = target.NgramIndex(["abcxbcd", "abcd"])
+
+    assert index.search("abcd") == [1]
+
+
+def test_ngram_index_returns_all_documents_for_empty_query_and_none_for_unknown_gram():
+    index = target.NgramIndex(["abc", "def"])
+
+    assert index.search("") == [0, 1]
+    assert index.search("xyz") == []
+    assert len(index) == 2
+
+
+def test_intersect_sorted_keeps_common_ids():
+    assert target.intersect_sorted([1, 3, 5, 7], [2, 3, 4, 7, 9]) == [3, 7]
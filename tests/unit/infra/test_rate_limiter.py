@@ -0,0 +1,105 @@
+import pytest
+
+from bookshelf_app.infra.other import rate_limiter as target
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def create_bucket(clock: FakeClock, **kwargs) -> target.AdaptiveTokenBucket:
+    options = {"rate_per_second": 2.0, "burst": 2, "recovery_seconds": 10.0}
+    options.update(kwargs)
+    return target.AdaptiveTokenBucket(clock=clock, sleep=clock.sleep, **options)
+
+
+def test_token_bucket_allows_burst_then_paces_calls():
+    clock = FakeClock()
+    bucket = create_bucket(clock)
+
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert bucket.acquire()
+
+    assert clock.sleeps == [pytest.approx(0.5)]
+    assert bucket.stats().acquired == 3
+
+
+def test_token_bucket_rejects_when_wait_exceeds_limit():
+    clock = FakeClock()
+    bucket = create_bucket(clock, burst=1, max_wait_seconds=0.1)
+
+    assert bucket.acquire()
+    assert not bucket.acquire()
+
+    assert clock.sleeps == []
+    assert bucket.stats().rejected == 1
+
+
+def test_token_bucket_slows_down_after_throttle_and_recovers():
+    clock = FakeClock()
+    bucket = create_bucket(clock, min_rate_per_second=0.5)
+
+    bucket.throttle()
+    assert bucket.stats().rate_per_second == pytest.approx(1.0)
+    bucket.throttle()
+    bucket.throttle()
+    assert bucket.stats().rate_per_second == pytest.approx(0.5)
+
+    clock.now += 5
+    assert bucket.stats().rate_per_second == pytest.approx(1.25)
+    clock.now += 10
+    assert bucket.stats().rate_per_second == pytest.approx(2.0)
+
+
+def test_token_bucket_waits_out_retry_after_after_throttle():
+    clock = FakeClock()
+    bucket = create_bucket(clock)
+
+    bucket.throttle(retry_after_seconds=3)
+
+    assert bucket.acquire()
+    assert clock.sleeps == [pytest.approx(3.0)]
+
+
+def test_rate_limiter_uses_budget_from_context():
+    clock = FakeClock()
+    interactive = create_bucket(clock)
+    warmup = create_bucket(clock)
+    limiter = target.RateLimiter({"interactive": interactive, "warmup": warmup}, default_budget="interactive")
+
+    limiter.acquire()
+    with target.use_rate_limit_budget("warmup"):
+        limiter.acquire()
+        limiter.acquire()
+
+    assert interactive.stats().acquired == 1
+    assert warmup.stats().acquired == 2
+
+
+def test_rate_limiter_throttles_every_budget():
+    clock = FakeClock()
+    limiter = target.RateLimiter(
+        {"interactive": create_bucket(clock), "warmup": create_bucket(clock)},
+        default_budget="interactive",
+    )
+
+    limiter.throttle()
+
+    assert [stats.throttled for stats in limiter.stats().values()] == [1, 1]
+
+
+def test_rate_limiter_rejects_unknown_budget():
+    limiter = target.RateLimiter({"interactive": create_bucket(FakeClock())}, default_budget="interactive")
+
+    with pytest.raises(ValueError):
+        limiter.acquire("unknown")
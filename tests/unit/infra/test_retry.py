@@ -0,0 +1,107 @@
+import pytest
+
+from bookshelf_app.infra.other import retry as target
+
+
+class TransientError(Exception):
+    def __init__(self, retry_after: float | None = None):
+        super().__init__("transient")
+        self.retry_after = retry_after
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def create_retrier(clock: FakeClock, **policy) -> target.Retrier:
+    return target.Retrier(
+        target.RetryPolicy(**{"max_retries": 2, "base_delay_seconds": 1.0, "deadline_seconds": 10.0, **policy}),
+        is_retryable=lambda error: isinstance(error, TransientError),
+        retry_after=lambda error: getattr(error, "retry_after", None),
+        clock=clock,
+        sleep=clock.sleep,
+        jitter=lambda _low, high: high,
+    )
+
+
+def create_flaky(errors: list[Exception]):
+    def func():
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    return func
+
+
+def test_retrier_retries_transient_errors_with_exponential_backoff():
+    clock = FakeClock()
+    retrier = create_retrier(clock)
+
+    actual = retrier.call("example", create_flaky([TransientError(), TransientError()]))
+
+    assert actual == "ok"
+    assert clock.sleeps == [1.0, 2.0]
+    assert retrier.stats()["example"] == target.RetryStats(
+        calls=1, attempts=3, retries=2, successes=1, failures=0, waited_seconds=3.0
+    )
+
+
+def test_retrier_waits_for_retry_after():
+    clock = FakeClock()
+    retrier = create_retrier(clock)
+
+    retrier.call("example", create_flaky([TransientError(retry_after=4)]))
+
+    assert clock.sleeps == [5.0]
+
+
+def test_retrier_gives_up_when_retry_after_exceeds_deadline():
+    clock = FakeClock()
+    retrier = create_retrier(clock)
+
+    with pytest.raises(TransientError):
+        retrier.call("example", create_flaky([TransientError(retry_after=30)]))
+
+    assert clock.sleeps == []
+    assert retrier.stats()["example"].failures == 1
+
+
+def test_retrier_stops_after_retry_budget():
+    clock = FakeClock()
+    retrier = create_retrier(clock, max_retries=1)
+
+    with pytest.raises(TransientError):
+        retrier.call("example", create_flaky([TransientError(), TransientError()]))
+
+    assert retrier.stats()["example"].attempts == 2
+
+
+def test_retrier_does_not_retry_permanent_errors():
+    clock = FakeClock()
+    retrier = create_retrier(clock)
+
+    with pytest.raises(ValueError):
+        retrier.call("example", create_flaky([ValueError("broken")]))
+
+    assert clock.sleeps == []
+    assert retrier.stats()["example"].attempts == 1
+
+
+def test_retrier_counts_stats_per_name():
+    retrier = create_retrier(FakeClock())
+
+    retrier.call("google", create_flaky([]))
+    retrier.call("openbd", create_flaky([TransientError()]))
+
+    stats = retrier.stats()
+    assert stats["google"].retries == 0
+    assert stats["openbd"].retries == 1
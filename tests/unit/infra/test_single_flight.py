@@ -0,0 +1,68 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import pytest
+
+from bookshelf_app.infra.other import single_flight as target
+
+
+def run_concurrent_calls(flight: target.SingleFlight, func, count: int) -> list:
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(flight.do, "key", func) for _ in range(count)]
+        return [future.exception() or future.result() for future in futures]
+
+
+def wait_for_waiters(flight: target.SingleFlight, count: int) -> None:
+    for _ in range(500):
+        if flight.stats().calls >= count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("callers did not join the flight")
+
+
+def test_single_flight_shares_one_execution_between_concurrent_callers():
+    release = threading.Event()
+    executions = 0
+    flight = target.SingleFlight()
+
+    def fetch():
+        nonlocal executions
+        executions += 1
+        release.wait(5)
+        return "result"
+
+    releaser = threading.Thread(target=lambda: (wait_for_waiters(flight, 4), release.set()))
+    releaser.start()
+    actual = run_concurrent_calls(flight, fetch, 4)
+    releaser.join()
+
+    assert actual == ["result"] * 4
+    assert executions == 1
+    assert flight.stats() == target.SingleFlightStats(calls=4, executions=1, shared=3)
+
+
+def test_single_flight_shares_error_between_concurrent_callers():
+    release = threading.Event()
+    flight = target.SingleFlight()
+
+    def fetch():
+        release.wait(5)
+        raise ValueError("provider failed")
+
+    releaser = threading.Thread(target=lambda: (wait_for_waiters(flight, 3), release.set()))
+    releaser.start()
+    actual = run_concurrent_calls(flight, fetch, 3)
+    releaser.join()
+
+    assert all(isinstance(error, ValueError) for error in actual)
+    assert flight.stats().executions == 1
+
+
+def test_single_flight_runs_again_after_previous_call_finished():
+    flight = target.SingleFlight()
+
+    assert flight.do("key", lambda: 1) == 1
+    assert flight.do("key", lambda: 2) == 2
+    with pytest.raises(KeyError):
+        flight.do("key", lambda: {}["missing"])
+    assert flight.stats() == target.SingleFlightStats(calls=3, executions=3, shared=0)
@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, create_engine, func, select
+from sqlalchemy.dialects import mssql, postgresql
+from sqlalchemy.orm import Session
+
+from bookshelf_app.infra.db import upsert as target
+
+metadata = MetaData()
+cache_table = Table(
+    "example_cache",
+    metadata,
+    Column("isbn13", String(13), primary_key=True),
+    Column("payload_json", String(100), nullable=False),
+    Column("fetched_at", DateTime(timezone=True), nullable=False),
+    Column("last_modified", DateTime(timezone=True), server_default=func.now(), onupdate=func.now()),
+)
+FETCHED_AT = datetime(2026, 6, 1, tzinfo=timezone.utc)
+
+
+def create_row(isbn13: str, payload_json: str) -> dict:
+    return {"isbn13": isbn13, "payload_json": payload_json, "fetched_at": FETCHED_AT}
+
+
+def test_upsert_rows_inserts_and_updates_in_batches():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    with Session(engine) as session:
+        target.upsert_rows(session, cache_table, [create_row("9784814400001", "old")], ["isbn13"])
+        target.upsert_rows(
+            session,
+            cache_table,
+            [
+                create_row("9784814400001", "new"),
+                create_row("9784814400002", "first"),
+                create_row("9784814400003", "third"),
+            ],
+            ["isbn13"],
+            batch_size=2,
+        )
+        session.commit()
+
+        actual = session.execute(select(cache_table.c.isbn13, cache_table.c.payload_json).order_by("isbn13")).all()
+
+    assert [tuple(row) for row in actual] == [
+        ("9784814400001", "new"),
+        ("9784814400002", "first"),
+        ("9784814400003", "third"),
+    ]
+
+
+def test_unique_rows_keeps_last_row_per_key():
+    actual = target.unique_rows(
+        [create_row("9784814400001", "old"), create_row("9784814400001", "new")],
+        ["isbn13"],
+    )
+
+    assert [row["payload_json"] for row in actual] == ["new"]
+
+
+def test_build_postgresql_upsert_updates_on_conflict():
+    stmt = target.build_postgresql_upsert(cache_table, [create_row("9784814400001", "new")], ["isbn13"])
+
+    actual = str(stmt.compile(dialect=postgresql.dialect()))
+
+    assert "ON CONFLICT (isbn13) DO UPDATE SET" in actual
+    assert "payload_json = excluded.payload_json" in actual
+    assert "last_modified = now()" in actual
+
+
+def test_build_mssql_merge_binds_every_row():
+    stmt = target.build_mssql_merge(
+        cache_table,
+        [create_row("9784814400001", "first"), create_row("9784814400002", "second")],
+        ["isbn13"],
+    )
+
+    actual = str(stmt.compile(dialect=mssql.dialect()))
+
+    assert actual.startswith("MERGE INTO example_cache WITH (HOLDLOCK) AS target")
+    assert "ON target.isbn13 = source.isbn13" in actual
+    assert "target.last_modified = SYSDATETIMEOFFSET()" in actual
+    assert len(stmt.compile(dialect=mssql.dialect()).params) == 6
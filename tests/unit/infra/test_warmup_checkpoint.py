@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from bookshelf_app.infra.db import warmup_checkpoint as target
+
+
+def create_session() -> Session:
+    engine = create_engine("sqlite://")
+    target.MetadataWarmupCheckpointDTO.__table__.create(engine)
+    return Session(engine)
+
+
+def create_values(last_isbn13: str | None, processed_count: int) -> dict:
+    return {
+        "refresh_before": datetime(2026, 7, 1, tzinfo=timezone.utc),
+        "last_isbn13": last_isbn13,
+        "candidate_count": 80,
+        "processed_count": processed_count,
+        "refreshed_count": processed_count,
+        "completed_at": None,
+    }
+
+
+def test_save_warmup_checkpoint_inserts_then_updates_one_row_per_publisher():
+    session = create_session()
+
+    target.save_warmup_checkpoint(session, "nightly", "gihyo", create_values("9784297000040", 40))
+    target.save_warmup_checkpoint(session, "nightly", "gihyo", create_values("9784297000080", 80))
+    target.save_warmup_checkpoint(session, "nightly", "oreilly_japan", create_values(None, 0))
+
+    actual = target.load_warmup_checkpoint(session, "nightly", "gihyo")
+
+    assert actual.last_isbn13 == "9784297000080"
+    assert actual.processed_count == 80
+    assert target.load_warmup_checkpoint(session, "nightly", "oreilly_japan").last_isbn13 is None
+    assert target.load_warmup_checkpoint(session, "other", "gihyo") is None
+
+
+def test_delete_warmup_checkpoints_by_run_or_age():
+    session = create_session()
+    target.save_warmup_checkpoint(session, "old", "gihyo", create_values(None, 0))
+    target.save_warmup_checkpoint(session, "new", "gihyo", create_values(None, 0))
+    target.save_warmup_checkpoint(session, "new", "oreilly_japan", create_values(None, 0))
+
+    assert target.delete_warmup_checkpoints(session, before=datetime.now(timezone.utc) - timedelta(days=1)) == 0
+    assert target.delete_warmup_checkpoints(session, run_id="old") == 1
+    assert target.load_warmup_checkpoint(session, "new", "gihyo") is not None
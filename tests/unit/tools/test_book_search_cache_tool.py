@@ -45,3 +45,13 @@ def test_clear_publisher_catalog_cache_deletes_all(monkeypatch):
 
     assert actual == 2
     assert session.committed
+
+
+def test_clear_provider_response_cache_deletes_all(monkeypatch):
+    session = FakeSession()
+    monkeypatch.setattr(target, "get_session", lambda: iter([session]))
+
+    actual = target.clear_provider_response_cache()
+
+    assert actual == 2
+    assert session.committed
@@ -0,0 +1,72 @@
+import threading
+
+from bookshelf_app.api.book_search.service import MetadataCacheWarmupResult, MetadataWarmupProgress
+from bookshelf_app.tools.cache import warm_book_metadata as target
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def create_progress(publisher_id: str, resumed_count: int, processed_count: int) -> MetadataWarmupProgress:
+    return MetadataWarmupProgress(
+        publisher_id=publisher_id,
+        candidate_count=80,
+        resumed_count=resumed_count,
+        processed_count=processed_count,
+        refreshed_count=processed_count,
+        failed_count=0,
+    )
+
+
+def test_warmup_progress_reporter_reports_throughput_of_this_run():
+    clock = FakeClock()
+    api_calls = [10]
+    lines: list[str] = []
+    reporter = target.WarmupProgressReporter(lambda: api_calls[0], output=lines.append, clock=clock)
+
+    clock.now = 102.0
+    api_calls[0] = 30
+    reporter.report(create_progress("gihyo", resumed_count=0, processed_count=40))
+    clock.now = 104.0
+    api_calls[0] = 50
+    reporter.report(create_progress("oreilly_japan", resumed_count=40, processed_count=80))
+
+    assert lines == [
+        "[gihyo] 40/80 refreshed=40 failed=0 | elapsed=2.0s, isbns=40 (20.00/s), api_calls=20 (10.00/s)",
+        "[oreilly_japan] 80/80 refreshed=80 failed=0 | elapsed=4.0s, isbns=80 (20.00/s), api_calls=40 (10.00/s)",
+    ]
+
+
+def test_warm_publishers_runs_publishers_concurrently_and_collects_failures():
+    barrier = threading.Barrier(2, timeout=5)
+    calls: list[dict] = []
+
+    class FakeService:
+        def warm_publisher_metadata_cache(self, **kwargs):
+            calls.append(kwargs)
+            # Both publishers must be in flight at the same time to pass the barrier.
+            barrier.wait()
+            if kwargs["publisher_id"] == "gihyo":
+                raise OSError("catalog unavailable")
+            kwargs["on_progress"](create_progress(kwargs["publisher_id"], resumed_count=0, processed_count=1))
+            return MetadataCacheWarmupResult(catalog_count=1, candidate_count=1, refreshed_count=1, failed_count=0)
+
+    lines: list[str] = []
+    reporter = target.WarmupProgressReporter(lambda: 0, output=lines.append)
+
+    actual = target.warm_publishers(
+        FakeService(), ["oreilly_japan", "gihyo"], workers=2, run_id="nightly", reporter=reporter
+    )
+
+    assert list(actual) == ["oreilly_japan", "gihyo"]
+    assert actual["oreilly_japan"] == MetadataCacheWarmupResult(
+        catalog_count=1, candidate_count=1, refreshed_count=1, failed_count=0
+    )
+    assert isinstance(actual["gihyo"], OSError)
+    assert {call["run_id"] for call in calls} == {"nightly"}
+    assert lines[0].startswith("[oreilly_japan] 1/80")